@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: MIT
 """Keyframe Importer - Import keyframes from Drake recording server.
 
-This addon imports animation keyframes from pickle files generated by
-drake-recording-server. Compatible with Blender 4.0+ and 5.0+.
+This addon imports animation keyframes from pickle or JSON Lines files generated
+by drake-recording-server. Compatible with Blender 4.0+ and 5.0+.
 """
 
+import gzip
+import json
 import pickle
 
 import bpy
@@ -22,6 +24,60 @@ bl_info = {
     "category": "Animation",
 }
 
+# Header written first by the recording server when streaming keyframes, one
+# pickled frame per record. Files without it hold a single pickled frame list.
+KEYFRAME_STREAM_HEADER = {"format": "drake_recording_server.keyframes", "version": 1}
+
+# Magic bytes at the start of a gzip-compressed keyframe stream.
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def load_keyframes(filepath):
+    """Load the list of frames from a keyframe pickle or JSON Lines file."""
+    with open(filepath, "rb") as f:
+        magic = f.read(len(GZIP_MAGIC))
+
+    if magic.startswith(b"{"):
+        # JSON Lines stream: the header line, then one frame per line.
+        with open(filepath, "rb") as f:
+            if json.loads(f.readline()) != KEYFRAME_STREAM_HEADER:
+                raise ValueError(f"{filepath} is not a keyframe stream")
+            return [json.loads(line) for line in f if line.strip()]
+
+    opener = gzip.open if magic == GZIP_MAGIC else open
+    with opener(filepath, "rb") as f:
+        first = pickle.load(f)
+        if first != KEYFRAME_STREAM_HEADER:
+            return first
+
+        frames = []
+        while True:
+            try:
+                frames.append(pickle.load(f))
+            except EOFError:
+                # Also raised for a stream that was flushed but never closed.
+                break
+    return frames
+
+
+def frame_poses(frame_data):
+    """Yield (name, location, rotation_quaternion) for each object in a frame."""
+    if isinstance(frame_data, dict):
+        # Pose arrays with one row per object
+        yield from zip(
+            frame_data["names"],
+            frame_data["location"],
+            frame_data["rotation_quaternion"],
+        )
+    else:
+        # One pose dict per object
+        for obj_data in frame_data:
+            yield (
+                obj_data["name"],
+                obj_data["location"],
+                obj_data["rotation_quaternion"],
+            )
+
 
 class KeyframeImportOperator(Operator, ImportHelper):
     """
@@ -42,6 +98,10 @@ class KeyframeImportOperator(Operator, ImportHelper):
     ]
     ```
     where the outer list is a list of frames and the inner list is a list of objects.
+    Keyframe streams written by the recording server, which pickle one frame at a
+    time into a gzip-compressed file or write one JSON frame per line, are read as
+    well. Their frames are dicts of "names" and per-object "location" and
+    "rotation_quaternion" arrays.
 
     The keyframes are only added for the objects that are already present in the scene.
     Hence, the recommended workflow is to first load the .blend file that was exported
@@ -53,22 +113,19 @@ class KeyframeImportOperator(Operator, ImportHelper):
     bl_label = "Import Keyframes"
 
     filename_ext = ".pkl"
-    filter_glob: StringProperty(default="*.pkl", options={"HIDDEN"})
+    filter_glob: StringProperty(default="*.pkl;*.jsonl", options={"HIDDEN"})
 
     def execute(self, context):
         try:
-            with open(self.filepath, "rb") as f:
-                keyframes = pickle.load(f)
+            keyframes = load_keyframes(self.filepath)
 
             # Track objects we've set up animation for
             animated_objects = set()
 
+            # Keyframes are inserted at explicit frames rather than by changing
+            # the current frame, which would re-evaluate the scene every frame.
             for frame_idx, frame_data in enumerate(keyframes):
-                # Set the current frame.
-                bpy.context.scene.frame_set(frame_idx)
-
-                for obj_data in frame_data:
-                    obj_name = obj_data["name"]
+                for obj_name, location, rotation in frame_poses(frame_data):
                     if obj_name not in bpy.data.objects:
                         self.report(
                             {"WARNING"},
@@ -84,13 +141,15 @@ class KeyframeImportOperator(Operator, ImportHelper):
                         animated_objects.add(obj_name)
 
                     # Set location.
-                    obj.location = obj_data["location"]
-                    obj.keyframe_insert(data_path="location")
+                    obj.location = location
+                    obj.keyframe_insert(data_path="location", frame=frame_idx)
 
                     # Set rotation.
                     obj.rotation_mode = "QUATERNION"
-                    obj.rotation_quaternion = obj_data["rotation_quaternion"]
-                    obj.keyframe_insert(data_path="rotation_quaternion")
+                    obj.rotation_quaternion = rotation
+                    obj.keyframe_insert(
+                        data_path="rotation_quaternion", frame=frame_idx
+                    )
 
             # Set animation range.
             bpy.context.scene.frame_start = 0
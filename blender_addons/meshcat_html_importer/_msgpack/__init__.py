@@ -18,6 +18,7 @@ def unpackb(
     ext_hook: Callable[[int, bytes], Any] | None = None,
     raw: bool = True,
     strict_map_key: bool = True,
+    use_list: bool = True,
 ) -> Any:
     """Unpack msgpack binary data.
 
@@ -26,11 +27,12 @@ def unpackb(
         ext_hook: Callback for extension types (code, data) -> value
         raw: If True, return bytes for strings; if False, decode as UTF-8
         strict_map_key: If True, require string map keys
+        use_list: If True, return arrays as lists; if False, as tuples
 
     Returns:
         Decoded Python object
     """
-    unpacker = _Unpacker(data, ext_hook=ext_hook, raw=raw)
+    unpacker = _Unpacker(data, ext_hook=ext_hook, raw=raw, use_list=use_list)
     return unpacker.unpack()
 
 
@@ -42,11 +44,13 @@ class _Unpacker:
         data: bytes,
         ext_hook: Callable[[int, bytes], Any] | None = None,
         raw: bool = True,
+        use_list: bool = True,
     ):
         self._data = data
         self._pos = 0
         self._ext_hook = ext_hook
         self._raw = raw
+        self._use_list = use_list
 
     def _read(self, n: int) -> bytes:
         """Read n bytes from the buffer."""
@@ -249,9 +253,10 @@ class _Unpacker:
             return data
         return data.decode("utf-8")
 
-    def _read_array(self, length: int) -> list:
+    def _read_array(self, length: int) -> list | tuple:
         """Read an array of given length."""
-        return [self.unpack() for _ in range(length)]
+        items = [self.unpack() for _ in range(length)]
+        return items if self._use_list else tuple(items)
 
     def _read_map(self, length: int) -> dict:
         """Read a map of given length."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
@@ -17,6 +18,30 @@ class TrackType(Enum):
     VISIBLE = "visible"
 
 
+@lru_cache(maxsize=1024)
+def track_type_from_name(name: str) -> TrackType | None:
+    """Classify a Three.js track by its name.
+
+    Track names repeat across nodes (".position", ".quaternion", ...), so the
+    result is cached to classify each distinct name only once.
+
+    Args:
+        name: Track name in Three.js format ("object.property" or ".property")
+
+    Returns:
+        TrackType, or None for properties that are not handled
+    """
+    if ".position" in name:
+        return TrackType.POSITION
+    elif ".quaternion" in name:
+        return TrackType.QUATERNION
+    elif ".scale" in name:
+        return TrackType.SCALE
+    elif ".visible" in name:
+        return TrackType.VISIBLE
+    return None
+
+
 @dataclass
 class AnimationTrack:
     """A single animation track for a property."""
@@ -100,17 +125,8 @@ def parse_three_js_track(track_data: dict[str, Any]) -> AnimationTrack | None:
     if isinstance(values, np.ndarray):
         values = values.tolist()
 
-    # Determine track type from name
-    # Three.js format: "object.property" or ".property"
-    if ".position" in name:
-        track_type = TrackType.POSITION
-    elif ".quaternion" in name:
-        track_type = TrackType.QUATERNION
-    elif ".scale" in name:
-        track_type = TrackType.SCALE
-    elif ".visible" in name:
-        track_type = TrackType.VISIBLE
-    else:
+    track_type = track_type_from_name(name)
+    if track_type is None:
         return None
 
     return AnimationTrack(
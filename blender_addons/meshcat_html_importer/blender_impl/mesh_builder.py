@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,12 +28,14 @@ if TYPE_CHECKING:
 def create_mesh_object(
     node: SceneNode,
     name: str | None = None,
+    temp_dir: Path | None = None,
 ) -> bpy.types.Object | None:
     """Create a Blender mesh object from a scene node.
 
     Args:
         node: SceneNode with geometry
         name: Optional name override
+        temp_dir: Optional directory for writing embedded mesh files
 
     Returns:
         Blender object or None if creation fails
@@ -46,7 +50,7 @@ def create_mesh_object(
     elif isinstance(node.geometry, PrimitiveGeometry):
         return _create_from_primitive(node.geometry, obj_name)
     elif isinstance(node.geometry, MeshFileGeometry):
-        result = _create_from_mesh_file(node.geometry, obj_name)
+        result = _create_from_mesh_file(node.geometry, obj_name, temp_dir)
         # _create_from_mesh_file returns (obj, import_matrix) tuple
         return result[0] if result[0] is not None else None
 
@@ -56,6 +60,7 @@ def create_mesh_object(
 def create_mesh_file_object(
     node: SceneNode,
     name: str | None = None,
+    temp_dir: Path | None = None,
 ) -> tuple[bpy.types.Object, "mathutils.Matrix | None"] | tuple[None, None]:
     """Create a Blender mesh object from a MeshFileGeometry node.
 
@@ -65,6 +70,7 @@ def create_mesh_file_object(
     Args:
         node: SceneNode with MeshFileGeometry
         name: Optional name override
+        temp_dir: Optional directory for writing the mesh files
 
     Returns:
         Tuple of (object, import_matrix). import_matrix is non-None for glTF.
@@ -73,7 +79,7 @@ def create_mesh_file_object(
         return None, None
 
     obj_name = name or node.name
-    return _create_from_mesh_file(node.geometry, obj_name)
+    return _create_from_mesh_file(node.geometry, obj_name, temp_dir)
 
 
 def _create_from_mesh_geometry(
@@ -87,32 +93,43 @@ def _create_from_mesh_geometry(
     # Create mesh
     mesh = bpy.data.meshes.new(name)
 
-    # Prepare vertex data
-    vertices = geom.positions.tolist()
-
-    # Prepare face data
+    # Prepare face data as the vertex index of each triangle corner
     if geom.indices is not None:
-        # Indexed geometry - reshape indices to triangles
-        indices = geom.indices.flatten()
+        # Indexed geometry - every 3 indices form a triangle
+        indices = geom.indices.ravel()
         num_tris = len(indices) // 3
-        faces = [tuple(indices[i * 3 : i * 3 + 3]) for i in range(num_tris)]
+        corners = indices[: num_tris * 3].astype(np.int32, copy=False)
     else:
         # Non-indexed - every 3 vertices form a triangle
-        num_verts = len(vertices)
-        num_tris = num_verts // 3
-        faces = [tuple(range(i * 3, i * 3 + 3)) for i in range(num_tris)]
-
-    # Create mesh from data
-    mesh.from_pydata(vertices, [], faces)
-    mesh.update()
+        num_tris = len(geom.positions) // 3
+        corners = np.arange(num_tris * 3, dtype=np.int32)
+
+    # Fill the mesh buffers directly rather than going through from_pydata,
+    # which would need the data as Python tuples
+    mesh.vertices.add(len(geom.positions))
+    mesh.vertices.foreach_set(
+        "co", geom.positions.astype(np.float32, copy=False).ravel()
+    )
+    mesh.loops.add(len(corners))
+    mesh.loops.foreach_set("vertex_index", corners)
+    mesh.polygons.add(num_tris)
+    # Polygon sizes follow from the loop starts (loop_total is read-only)
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, len(corners), 3, dtype=np.int32)
+    )
+    mesh.update(calc_edges=True)
 
-    # Add normals
+    # Add normals. Blender stores per-vertex custom normals as a float vector
+    # attribute, which can be filled straight from the array.
     if geom.normals is not None:
-        mesh.normals_split_custom_set_from_vertices(geom.normals.tolist())
+        normals = mesh.attributes.new("custom_normal", "FLOAT_VECTOR", "POINT")
+        normals.data.foreach_set(
+            "vector", geom.normals.astype(np.float32, copy=False).ravel()
+        )
 
     # Add UVs
     if geom.uvs is not None and len(geom.uvs) > 0:
-        _add_uv_layer(mesh, geom.uvs, geom.indices)
+        _add_uv_layer(mesh, geom.uvs)
 
     # Validate mesh
     mesh.validate()
@@ -126,32 +143,26 @@ def _create_from_mesh_geometry(
 def _add_uv_layer(
     mesh: bpy.types.Mesh,
     uvs: np.ndarray,
-    indices: np.ndarray | None,
 ) -> None:
     """Add UV coordinates to a mesh.
 
     Args:
         mesh: Blender mesh
         uvs: UV coordinates per vertex
-        indices: Optional face indices
     """
     if len(mesh.loops) == 0:
         return
 
     uv_layer = mesh.uv_layers.new(name="UVMap")
 
-    if indices is not None:
-        # Map UVs through indices
-        for loop_idx, loop in enumerate(mesh.loops):
-            vert_idx = loop.vertex_index
-            if vert_idx < len(uvs):
-                uv_layer.data[loop_idx].uv = uvs[vert_idx].tolist()
-    else:
-        # Direct mapping
-        for loop_idx, loop in enumerate(mesh.loops):
-            vert_idx = loop.vertex_index
-            if vert_idx < len(uvs):
-                uv_layer.data[loop_idx].uv = uvs[vert_idx].tolist()
+    # UVs are per vertex, so look them up through each loop's vertex index.
+    # Loops whose vertex has no UV keep the default (0, 0).
+    vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_indices)
+    loop_uvs = np.zeros((len(vertex_indices), 2), dtype=np.float32)
+    has_uv = vertex_indices < len(uvs)
+    loop_uvs[has_uv] = uvs[vertex_indices[has_uv]]
+    uv_layer.data.foreach_set("uv", loop_uvs.ravel())
 
 
 def _create_from_primitive(
@@ -303,70 +314,102 @@ def _create_plane_mesh(
 def _create_from_mesh_file(
     geom: MeshFileGeometry,
     name: str,
+    temp_dir: Path | None = None,
 ) -> tuple[bpy.types.Object, "mathutils.Matrix"] | tuple[None, None]:
     """Create mesh by importing embedded mesh file.
 
+    Args:
+        geom: Mesh file geometry
+        name: Name for the created object
+        temp_dir: Directory to write the mesh files into. A temporary directory
+            is created and removed if not given.
+
     Returns:
         Tuple of (object, import_matrix) where import_matrix is the coordinate
         system conversion matrix from the importer (e.g., glTF Y-up to Z-up).
         For OBJ imports, import_matrix is None. Returns (None, None) on failure.
     """
-
-    # Write mesh data to temp file
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        if geom.format.lower() in ("gltf", "glb"):
-            # Determine extension
-            ext = ".glb" if geom.data[:4] == b"glTF" else ".gltf"
-            mesh_file = temp_path / f"{name}{ext}"
-            mesh_file.write_bytes(geom.data)
-
-            # Write any resources
-            for res_name, res_data in geom.resources.items():
-                res_path = temp_path / res_name
-                res_path.parent.mkdir(parents=True, exist_ok=True)
-                res_path.write_bytes(res_data)
-
-            # Import glTF
-            old_objects = set(bpy.data.objects)
-            bpy.ops.import_scene.gltf(filepath=str(mesh_file))
-            new_objects = list(set(bpy.data.objects) - old_objects)
-
-            if new_objects:
-                # Capture the import's coordinate conversion matrix before cleanup.
-                # The glTF importer applies a rotation to convert from glTF's
-                # coordinate system to Blender's. We need to preserve this when
-                # applying the meshcat world transform later.
-                import_matrix = _get_import_rotation_matrix(new_objects)
-
-                # Find the main mesh object and clean up extras
-                main_obj = _select_main_object_and_cleanup(new_objects, name)
-                return main_obj, import_matrix
-
-        elif geom.format.lower() == "obj":
-            mesh_file = temp_path / f"{name}.obj"
-            mesh_file.write_bytes(geom.data)
-
-            # Write MTL and textures
-            for res_name, res_data in geom.resources.items():
-                res_path = temp_path / res_name
-                res_path.parent.mkdir(parents=True, exist_ok=True)
-                res_path.write_bytes(res_data)
-
-            # Import OBJ
-            old_objects = set(bpy.data.objects)
-            bpy.ops.wm.obj_import(filepath=str(mesh_file))
-            new_objects = list(set(bpy.data.objects) - old_objects)
-
-            if new_objects:
-                # Find the main mesh object and clean up extras
-                main_obj = _select_main_object_and_cleanup(new_objects, name)
-                return main_obj, None
+    if temp_dir is None:
+        with tempfile.TemporaryDirectory() as own_temp_dir:
+            return _create_from_mesh_file(geom, name, Path(own_temp_dir))
+
+    # Write mesh data to a fresh subdirectory, as resource names may repeat
+    temp_path = temp_dir / uuid.uuid4().hex
+    temp_path.mkdir()
+
+    if geom.format.lower() in ("gltf", "glb"):
+        # Determine extension
+        ext = ".glb" if geom.data.startswith(b"glTF") else ".gltf"
+        mesh_file = _write_mesh_files(temp_path, f"{name}{ext}", geom)
+
+        # Import glTF. The importer selects exactly the objects it created.
+        bpy.ops.import_scene.gltf(filepath=str(mesh_file))
+        new_objects = list(bpy.context.selected_objects)
+
+        if new_objects:
+            # Capture the import's coordinate conversion matrix before cleanup.
+            # The glTF importer applies a rotation to convert from glTF's
+            # coordinate system to Blender's. We need to preserve this when
+            # applying the meshcat world transform later.
+            import_matrix = _get_import_rotation_matrix(new_objects)
+
+            # Find the main mesh object and clean up extras
+            main_obj = _select_main_object_and_cleanup(new_objects, name)
+            return main_obj, import_matrix
+
+    elif geom.format.lower() == "obj":
+        # Also writes the MTL and textures
+        mesh_file = _write_mesh_files(temp_path, f"{name}.obj", geom)
+
+        # Import OBJ. The importer selects exactly the objects it created.
+        bpy.ops.wm.obj_import(filepath=str(mesh_file))
+        new_objects = list(bpy.context.selected_objects)
+
+        if new_objects:
+            # Find the main mesh object and clean up extras
+            main_obj = _select_main_object_and_cleanup(new_objects, name)
+            return main_obj, None
 
     return None, None
 
 
+def _write_mesh_files(
+    temp_path: Path,
+    file_name: str,
+    geom: MeshFileGeometry,
+) -> Path:
+    """Write a mesh file and its resources for import.
+
+    Args:
+        temp_path: Directory to write into
+        file_name: File name for the mesh data
+        geom: Mesh file geometry with data and resources
+
+    Returns:
+        Path of the written mesh file
+    """
+    mesh_file = temp_path / file_name
+    _write_file(mesh_file, geom.data)
+
+    for res_name, res_data in geom.resources.items():
+        res_path = temp_path / res_name
+        res_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file(res_path, res_data)
+
+    return mesh_file
+
+
+def _write_file(path: Path, data: bytes | memoryview) -> None:
+    """Write a buffer to a new file straight through the file descriptor."""
+    view = memoryview(data).cast("B")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def _get_import_rotation_matrix(
     objects: list[bpy.types.Object],
 ) -> "mathutils.Matrix":
@@ -436,29 +479,13 @@ def _select_main_object_and_cleanup(
             main_obj.parent = None
             main_obj.matrix_world = world_matrix
     else:
-        # Multiple meshes - join them all into one object
-        # First, unparent all and apply world transforms
-        for obj in mesh_objects:
-            world_matrix = obj.matrix_world.copy()
-            if obj.parent is not None:
-                obj.parent = None
-            obj.matrix_world = world_matrix
-
-        # Select all mesh objects for joining
-        bpy.ops.object.select_all(action="DESELECT")
-        for obj in mesh_objects:
-            obj.select_set(True)
-
-        # Set the first mesh as active (will be the target for join)
+        # Multiple meshes - merge them all into the first one
         main_obj = mesh_objects[0]
-        bpy.context.view_layer.objects.active = main_obj
-
-        # Join all selected objects into the active one
-        bpy.ops.object.join()
-
-        # After join, only main_obj remains with combined geometry
-        # Clear the mesh_objects list references as they're now invalid
-        mesh_objects = [main_obj]
+        world_matrix = main_obj.matrix_world.copy()
+        if main_obj.parent is not None:
+            main_obj.parent = None
+            main_obj.matrix_world = world_matrix
+        _join_meshes(main_obj, mesh_objects[1:])
 
     # Rename
     main_obj.name = name
@@ -469,3 +496,63 @@ def _select_main_object_and_cleanup(
             bpy.data.objects.remove(obj, do_unlink=True)
 
     return main_obj
+
+
+def _join_meshes(
+    main_obj: bpy.types.Object,
+    others: list[bpy.types.Object],
+) -> None:
+    """Merge the geometry of other mesh objects into main_obj and remove them.
+
+    This works on the mesh data through bmesh rather than with the join
+    operator, which needs selection changes and scene updates.
+
+    Args:
+        main_obj: Mesh object receiving the geometry
+        others: Mesh objects to merge, removed afterwards
+    """
+    import bmesh
+
+    to_main = main_obj.matrix_world.inverted()
+    # As with the join operator, once any mesh has materials, material-less
+    # meshes get an empty slot so that their faces keep no material.
+    empty_slots = (
+        [None]
+        if main_obj.data.materials or any(obj.data.materials for obj in others)
+        else []
+    )
+    materials = list(main_obj.data.materials) or list(empty_slots)
+
+    bm = bmesh.new()
+    bm.from_mesh(main_obj.data)
+    for obj in others:
+        # Bring a copy of the mesh into main_obj's local space
+        mesh = obj.data.copy()
+        mesh.transform(to_main @ obj.matrix_world)
+
+        # Point the faces at the material slots of the merged mesh
+        slots = []
+        for mat in list(mesh.materials) or empty_slots:
+            if mat not in materials:
+                materials.append(mat)
+            slots.append(materials.index(mat))
+        if slots:
+            material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", material_indices)
+            material_indices = np.asarray(slots, dtype=np.int32)[
+                np.minimum(material_indices, len(slots) - 1)
+            ]
+            mesh.polygons.foreach_set("material_index", material_indices)
+
+        bm.from_mesh(mesh)
+        bpy.data.meshes.remove(mesh)
+
+    bm.to_mesh(main_obj.data)
+    bm.free()
+
+    for mat in materials[len(main_obj.data.materials) :]:
+        main_obj.data.materials.append(mat)
+
+    meshes = [obj.data for obj in others]
+    bpy.data.batch_remove(others)
+    bpy.data.batch_remove([mesh for mesh in meshes if mesh.users == 0])
@@ -3,13 +3,20 @@
 
 from __future__ import annotations
 
+import tempfile
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import bpy
+from mathutils import Matrix, Quaternion, Vector
 
 if TYPE_CHECKING:
     import mathutils
 
+    from ..animation.keyframe_converter import BlenderKeyframes
+
+from ..animation import convert_keyframes_to_blender
 from ..parser import parse_html_recording
 from ..scene import SceneGraph, SceneNode
 from .animation_builder import (
@@ -26,7 +33,8 @@ from .mesh_builder import (
     create_mesh_object,
 )
 
-# Path prefixes to exclude (contact forces, collision geometry, inertia visualizers)
+# Path prefixes to exclude (contact forces, collision geometry, inertia visualizers).
+# Kept as a tuple so a single str.startswith() call checks all of them.
 EXCLUDED_PATH_PREFIXES = (
     "/drake/contact_forces/",
     "/drake/proximity/",
@@ -42,6 +50,9 @@ PATHS_PREFIX = "/drake/paths/"
 # Default collection name for imported objects
 DEFAULT_COLLECTION_NAME = "MeshcatObjects"
 
+# Generic path components that do not describe an object
+_GENERIC_PART_NAMES = frozenset(("visual", "collision", "base_link"))
+
 
 def build_scene(
     scene_data: dict[str, Any],
@@ -76,38 +87,77 @@ def build_scene(
     assets = scene_data.get("assets", {})
     scene_graph = SceneGraph(assets=assets)
     scene_graph.process_commands(scene_data["commands"])
+    scene_graph.compute_world_transforms()
 
     # Get or create root collection for meshcat objects
     root_collection = _get_or_create_root_collection()
+    collection_cache: dict[tuple[str, ...], bpy.types.Collection] = {}
 
     # Create objects for each node with geometry (filtering excluded paths)
     created_objects: dict[str, bpy.types.Object] = {}
     import_matrices: dict[str, "mathutils.Matrix"] = {}  # glTF coordinate conversion
-
-    for node in scene_graph.get_mesh_nodes():
-        # Skip excluded paths (contact forces, proximity/collision geometry)
-        if _should_skip_path(node.path):
-            continue
-
-        obj, import_matrix = _create_object_from_node(node, scene_graph)
-        if obj is not None:
-            created_objects[node.path] = obj
-            if import_matrix is not None:
-                import_matrices[node.path] = import_matrix
-            _link_object_to_scene(
-                obj,
-                path=node.path,
-                hierarchical=hierarchical_collections,
-                path_prefix=collection_root,
-                root_collection=root_collection,
+    # Meshes already built for each geometry content, shared by repeated visuals
+    mesh_cache: dict[str, tuple[bpy.types.Mesh, "mathutils.Matrix | None"]] = {}
+    # One shared matrix per distinct glTF import conversion
+    import_matrix_cache: dict[tuple[float, ...], "mathutils.Matrix"] = {}
+    # Objects to link to each collection, linked together once all are created
+    collection_objects: dict[bpy.types.Collection, list[bpy.types.Object]] = {}
+
+    # Embedded mesh files are written to one temporary directory, removed once
+    # all objects are created.
+    with tempfile.TemporaryDirectory(prefix="meshcat_import_") as temp_dir:
+        for node in scene_graph.get_mesh_nodes():
+            # Skip excluded paths (contact forces, proximity/collision geometry)
+            if node.path.startswith(EXCLUDED_PATH_PREFIXES):
+                continue
+
+            obj, import_matrix = _create_object_from_node(
+                node,
+                scene_graph,
+                temp_dir=Path(temp_dir),
+                mesh_cache=mesh_cache,
+                import_matrix_cache=import_matrix_cache,
             )
+            if obj is not None:
+                created_objects[node.path] = obj
+                if import_matrix is not None:
+                    import_matrices[node.path] = import_matrix
+
+                # Link to the root collection, or a nested one mirroring the path
+                if hierarchical_collections:
+                    collection = _get_or_create_collection_hierarchy(
+                        node.path, root_collection, collection_root, collection_cache
+                    )
+                else:
+                    collection = root_collection
+                collection_objects.setdefault(collection, []).append(obj)
+
+    # Link the objects only now, so the scene updates run by the mesh file
+    # importers above do not re-evaluate every object created before them
+    for collection, objects in collection_objects.items():
+        link = collection.objects.link
+        for obj in objects:
+            link(obj)
 
     # Apply animations - check both direct animations and parent animations
     all_nodes = {n.path: n for n in scene_graph.get_all_nodes()}
+    animation_nodes = _find_animation_nodes(all_nodes)
+    # Keyframes resampled to target_fps, once per animation source node
+    converted_keyframes: dict[str, BlenderKeyframes] = {}
     for path, obj in created_objects.items():
         # Find animation data for this object or its ancestors
-        anim_node = _find_animation_node(scene_graph, path)
+        anim_node = animation_nodes.get(path)
         if anim_node is not None:
+            blender_keyframes = converted_keyframes.get(anim_node.path)
+            if blender_keyframes is None:
+                blender_keyframes = convert_keyframes_to_blender(
+                    anim_node.keyframes,
+                    recording_fps=recording_fps,
+                    target_fps=target_fps,
+                    start_frame=start_frame,
+                )
+                converted_keyframes[anim_node.path] = blender_keyframes
+
             # Get the object's own node to calculate local offset from animation source
             obj_node = all_nodes.get(path)
             local_offset = _get_local_offset_from_ancestor(obj_node, anim_node)
@@ -119,13 +169,14 @@ def build_scene(
                 start_frame=start_frame,
                 local_offset=local_offset,
                 import_matrix=import_matrices.get(path),
+                blender_keyframes=blender_keyframes,
             )
 
     # Set scene frame range based on all animated nodes (excluding contact forces, etc.)
     animated_nodes = [
         n
         for n in scene_graph.get_animated_nodes()
-        if not _should_skip_path(n.path)
+        if not n.path.startswith(EXCLUDED_PATH_PREFIXES)
     ]
     if animated_nodes:
         set_animation_range(
@@ -141,21 +192,6 @@ def build_scene(
     return created_objects
 
 
-def _should_skip_path(path: str) -> bool:
-    """Check if a path should be skipped during import.
-
-    Args:
-        path: The node path
-
-    Returns:
-        True if the path should be skipped
-    """
-    for prefix in EXCLUDED_PATH_PREFIXES:
-        if path.startswith(prefix):
-            return True
-    return False
-
-
 def _determine_path_prefix(path: str) -> str:
     """Determine the appropriate prefix to strip from a path.
 
@@ -178,11 +214,10 @@ def _get_or_create_root_collection() -> bpy.types.Collection:
     Returns:
         The root MeshcatObjects collection
     """
-    if DEFAULT_COLLECTION_NAME not in bpy.data.collections:
+    collection = bpy.data.collections.get(DEFAULT_COLLECTION_NAME)
+    if collection is None:
         collection = bpy.data.collections.new(DEFAULT_COLLECTION_NAME)
         bpy.context.scene.collection.children.link(collection)
-    else:
-        collection = bpy.data.collections[DEFAULT_COLLECTION_NAME]
     return collection
 
 
@@ -190,6 +225,7 @@ def _get_or_create_collection_hierarchy(
     path: str,
     root_collection: bpy.types.Collection,
     path_prefix: str = "",
+    collection_cache: dict[tuple[str, ...], bpy.types.Collection] | None = None,
 ) -> bpy.types.Collection:
     """Get or create a collection hierarchy based on a path.
 
@@ -199,6 +235,9 @@ def _get_or_create_collection_hierarchy(
         path: The full meshcat path (e.g., "/drake/paths/move_1/optimized/red/e_0")
         root_collection: The root collection to build hierarchy under
         path_prefix: Custom prefix to strip (auto-detected if empty)
+        collection_cache: Optional dict of collections already resolved under
+            root_collection, keyed by their path components. Filled in as
+            collections are found or created.
 
     Returns:
         The collection where the object should be linked
@@ -224,27 +263,32 @@ def _get_or_create_collection_hierarchy(
     # Remove the leaf component (the object itself)
     collection_parts = parts[:-1]
 
-    # Create nested collections
+    if collection_cache is None:
+        collection_cache = {}
+
+    # Create nested collections, reusing the ones resolved for earlier paths
     current_collection = root_collection
-    for part in collection_parts:
-        # Check if child collection already exists
-        child_collection = None
-        for child in current_collection.children:
-            if child.name == part:
-                child_collection = child
-                break
+    for i, part in enumerate(collection_parts):
+        key = tuple(collection_parts[: i + 1])
+        child_collection = collection_cache.get(key)
+
+        if child_collection is None:
+            # Check if child collection already exists
+            child_collection = current_collection.children.get(part)
 
         if child_collection is None:
             # Create new child collection
             child_collection = bpy.data.collections.new(part)
             current_collection.children.link(child_collection)
 
+        collection_cache[key] = child_collection
         current_collection = child_collection
 
     return current_collection
 
 
-def _derive_object_name(path: str) -> str:
+@lru_cache(maxsize=4096)
+def _derive_object_name(path_parts: tuple[str, ...]) -> str:
     """Derive a descriptive object name from a scene graph path.
 
     Path formats:
@@ -253,12 +297,12 @@ def _derive_object_name(path: str) -> str:
     - /drake/illustration/room_geometry_dining_room/room_geometry_body_link/<wall_name>
 
     Args:
-        path: Full scene graph path
+        path_parts: Components of the full scene graph path
 
     Returns:
         Descriptive object name
     """
-    parts = path.strip("/").split("/")
+    parts = path_parts
 
     # Skip common prefixes
     if parts and parts[0] == "drake":
@@ -276,7 +320,7 @@ def _derive_object_name(path: str) -> str:
     # Check if the last part is descriptive (not just "visual" or similar)
     if len(parts) > 1:
         last_part = parts[-1]
-        if last_part not in ("visual", "collision", "base_link"):
+        if last_part not in _GENERIC_PART_NAMES:
             # For room geometry, use the last part (wall names, etc.)
             if "room_geometry" in model_name:
                 return last_part
@@ -287,34 +331,33 @@ def _derive_object_name(path: str) -> str:
     return model_name
 
 
-def _find_animation_node(scene_graph: SceneGraph, path: str) -> SceneNode | None:
-    """Find the animation node for a given path.
+def _find_animation_nodes(
+    all_nodes: dict[str, SceneNode],
+) -> dict[str, SceneNode | None]:
+    """Find the animation node for every path in the scene graph.
 
-    Searches the path and its ancestors for animation data.
-    In Drake/meshcat, animations are often on parent nodes (e.g., base_link)
-    while geometry is on child nodes (e.g., visual).
+    The animation node of a path is the node itself if it has keyframes, or
+    else its nearest ancestor with keyframes. In Drake/meshcat, animations are
+    often on parent nodes (e.g., base_link) while geometry is on child nodes
+    (e.g., visual).
 
     Args:
-        scene_graph: The scene graph
-        path: The path to search from
+        all_nodes: All scene graph nodes keyed by path, parents before their
+            children (the scene graph creates nodes in that order)
 
     Returns:
-        SceneNode with keyframes, or None if not found
+        Dictionary mapping each path to its SceneNode with keyframes, or None
     """
-    # Check the node itself first
-    all_nodes = {n.path: n for n in scene_graph.get_all_nodes()}
-
-    if path in all_nodes and all_nodes[path].keyframes:
-        return all_nodes[path]
-
-    # Search ancestors
-    parts = path.strip("/").split("/")
-    for i in range(len(parts) - 1, 0, -1):
-        ancestor_path = "/" + "/".join(parts[:i])
-        if ancestor_path in all_nodes and all_nodes[ancestor_path].keyframes:
-            return all_nodes[ancestor_path]
-
-    return None
+    animation_nodes: dict[str, SceneNode | None] = {}
+    for path, node in all_nodes.items():
+        if node.keyframes:
+            animation_nodes[path] = node
+        elif node.parent is not None and node.parent.parent is not None:
+            animation_nodes[path] = animation_nodes[node.parent.path]
+        else:
+            # Animations on the root node are not inherited
+            animation_nodes[path] = None
+    return animation_nodes
 
 
 def _get_local_offset_from_ancestor(
@@ -340,101 +383,106 @@ def _get_local_offset_from_ancestor(
         # Same node, no offset needed
         return None
 
-    # Compute the relative transform from anim_node to obj_node
-    # This is: obj_world = anim_world * local_offset
-    # So: local_offset = inverse(anim_world) * obj_world
-    # For simplicity, we collect transforms from anim_node to obj_node
-    from ..scene.transforms import Transform, combine_transforms
-
-    # Start from animation node, walk down to object node
-    # Collect all transforms between them
-    obj_path_parts = obj_node.path.strip("/").split("/")
-    anim_path_parts = anim_node.path.strip("/").split("/")
-
     # Object path should be longer (descendant of anim node)
-    if len(obj_path_parts) <= len(anim_path_parts):
+    depth = len(anim_node.path_parts)
+    if (
+        len(obj_node.path_parts) <= depth
+        or obj_node.path_parts[:depth] != anim_node.path_parts
+    ):
+        # anim_node is not an ancestor of obj_node
         return None
 
-    # Collect transforms from nodes between anim_node and obj_node
-    # (exclusive of anim, inclusive of obj)
-    combined = Transform.identity()
-    current = obj_node
-
-    # Include the object's own local matrix first (innermost transform)
-    combined = combine_transforms(obj_node.object_matrix, combined)
+    # Compose the relative transform from anim_node to obj_node, i.e. the
+    # local chain below anim_node (exclusive) down to obj_node (inclusive),
+    # followed by the object's own local matrix. Unlike inverting anim_node's
+    # world matrix, this also works when that matrix is singular.
+    from ..scene.transforms import matrix_to_trs
 
+    offset_matrix = obj_node.object_matrix.to_matrix()
+    current = obj_node
     while current is not None and current.path != anim_node.path:
-        combined = combine_transforms(current.transform, combined)
+        offset_matrix = current.transform.to_matrix() @ offset_matrix
         current = current.parent
-
-    if current is None:
-        # anim_node is not an ancestor of obj_node
-        return None
+    combined = matrix_to_trs(offset_matrix)
 
     return (combined.translation, combined.rotation)
 
 
 def _clear_scene() -> None:
     """Clear all objects from the scene."""
-    # Deselect all
-    bpy.ops.object.select_all(action="DESELECT")
-
-    # Select all mesh objects
-    for obj in bpy.data.objects:
-        obj.select_set(True)
-
-    # Delete selected
-    bpy.ops.object.delete()
-
-    # Clean up orphaned data
-    for mesh in bpy.data.meshes:
-        if mesh.users == 0:
-            bpy.data.meshes.remove(mesh)
-
-    for mat in bpy.data.materials:
-        if mat.users == 0:
-            bpy.data.materials.remove(mat)
+    # Remove all objects directly, without the selection and delete operators
+    bpy.data.batch_remove(bpy.data.objects)
 
-    for action in bpy.data.actions:
-        if action.users == 0:
-            bpy.data.actions.remove(action)
+    # Clean up orphaned data (meshes, materials, actions, ...)
+    bpy.data.orphans_purge(do_recursive=True)
 
 
 def _create_object_from_node(
     node: SceneNode,
     scene_graph: SceneGraph | None = None,
+    temp_dir: Path | None = None,
+    mesh_cache: dict[str, tuple[bpy.types.Mesh, "mathutils.Matrix | None"]]
+    | None = None,
+    import_matrix_cache: dict[tuple[float, ...], "mathutils.Matrix"] | None = None,
 ) -> tuple[bpy.types.Object, "mathutils.Matrix | None"] | tuple[None, None]:
     """Create a Blender object from a scene node.
 
     Args:
         node: SceneNode with geometry
         scene_graph: Optional scene graph for deriving better names
+        temp_dir: Optional directory for writing embedded mesh files
+        mesh_cache: Optional dict of meshes (and their glTF import matrices)
+            keyed by geometry_key(). Nodes whose geometry is already in it get
+            a new object sharing the mesh instead of building it again; new
+            meshes are added to it.
+        import_matrix_cache: Optional dict used to intern glTF import matrices
+            (see _intern_import_matrix)
 
     Returns:
         Tuple of (Blender object, import_matrix). import_matrix is non-None for
         glTF imports and captures the coordinate conversion rotation.
     """
-    from ..scene.geometry import MeshFileGeometry
+    from ..scene.geometry import MeshFileGeometry, geometry_key
 
     # Derive a descriptive name from the path
     # Path format: /drake/illustration/<model_name>/base_link/<model_name>/visual
     # We want to extract the model name
-    obj_name = _derive_object_name(node.path)
+    obj_name = _derive_object_name(node.path_parts)
 
     # Check if this is a mesh file (glTF/OBJ) - these are handled specially
     is_meshfile = isinstance(node.geometry, MeshFileGeometry)
     is_gltf = is_meshfile and node.geometry.format.lower() in ("gltf", "glb")
 
+    key = None
+    cached = None
+    if mesh_cache is not None:
+        key = geometry_key(node.geometry)
+        cached = mesh_cache.get(key)
+
     import_matrix = None
-    if is_meshfile:
+    if cached is not None:
+        # Same geometry as an earlier node: share its mesh
+        mesh, import_matrix = cached
+        obj = bpy.data.objects.new(obj_name, mesh)
+        if is_meshfile:
+            # Mesh file imports are also linked to the active collection
+            bpy.context.collection.objects.link(obj)
+    elif is_meshfile:
         # Use create_mesh_file_object to get the import coordinate conversion matrix
-        obj, import_matrix = create_mesh_file_object(node, name=obj_name)
+        obj, import_matrix = create_mesh_file_object(
+            node, name=obj_name, temp_dir=temp_dir
+        )
+        if import_matrix is not None and import_matrix_cache is not None:
+            import_matrix = _intern_import_matrix(import_matrix, import_matrix_cache)
     else:
         obj = create_mesh_object(node, name=obj_name)
 
     if obj is None:
         return None, None
 
+    if key is not None and cached is None and obj.type == "MESH":
+        mesh_cache[key] = (obj.data, import_matrix)
+
     # Apply world transform (combining all parent transforms)
     _apply_world_transform(obj, node, import_matrix=import_matrix)
 
@@ -459,6 +507,26 @@ def _create_object_from_node(
     return obj, import_matrix
 
 
+def _intern_import_matrix(
+    import_matrix: "mathutils.Matrix",
+    cache: dict[tuple[float, ...], "mathutils.Matrix"],
+) -> "mathutils.Matrix":
+    """Share one matrix between glTF imports with the same coordinate conversion.
+
+    The glTF importer applies the same conversion to every file of a recording,
+    so all of its objects end up referring to the first matrix seen.
+
+    Args:
+        import_matrix: Coordinate conversion matrix from the glTF importer
+        cache: Matrices seen so far, keyed by their values
+
+    Returns:
+        The shared matrix
+    """
+    key = tuple(value for row in import_matrix for value in row)
+    return cache.setdefault(key, import_matrix)
+
+
 def _apply_world_transform(
     obj: bpy.types.Object,
     node: SceneNode,
@@ -476,91 +544,25 @@ def _apply_world_transform(
         import_matrix: Optional coordinate conversion matrix from glTF importer.
             When provided, the final world matrix is: meshcat_world × import_matrix
     """
-    import mathutils
-
     # Get world transform (combines all parent transforms)
-    transform = node.get_world_transform()
+    trs = node.get_world_transform().data
+    meshcat_matrix = Matrix.LocRotScale(
+        Vector(trs[0:3]),
+        # Convert from (x, y, z, w) to Blender's (w, x, y, z)
+        Quaternion(trs[[6, 3, 4, 5]]),
+        Vector(trs[7:10]),
+    )
 
+    # Keep the decomposed rotation as a quaternion, matching the animation curves
+    obj.rotation_mode = "QUATERNION"
     if import_matrix is not None:
         # For glTF: combine meshcat world transform with the importer's
         # coordinate conversion. The import_matrix handles the conversion
         # from glTF model space to Blender's coordinate system (e.g., Y-up
         # to Z-up). The meshcat transform positions the object in the scene.
-        # Build meshcat world matrix
-        x, y, z, w = transform.rotation
-        quat = mathutils.Quaternion((w, x, y, z))
-        meshcat_matrix = mathutils.Matrix.LocRotScale(
-            mathutils.Vector(transform.translation),
-            quat,
-            mathutils.Vector(transform.scale),
-        )
-        # Combine: meshcat positioning × import coordinate conversion
         obj.matrix_world = meshcat_matrix @ import_matrix
     else:
-        # Standard path: set location, rotation, scale directly
-        obj.location = transform.translation
-
-        obj.rotation_mode = "QUATERNION"
-        # Convert from (x, y, z, w) to Blender's (w, x, y, z)
-        x, y, z, w = transform.rotation
-        obj.rotation_quaternion = (w, x, y, z)
-
-        obj.scale = transform.scale
-
-
-def _apply_transform(obj: bpy.types.Object, node: SceneNode) -> None:
-    """Apply node's local transform to Blender object.
-
-    Args:
-        obj: Blender object
-        node: SceneNode with transform
-    """
-    transform = node.transform
-
-    # Set location
-    obj.location = transform.translation
-
-    # Set rotation (quaternion)
-    obj.rotation_mode = "QUATERNION"
-    # Convert from (x, y, z, w) to Blender's (w, x, y, z)
-    x, y, z, w = transform.rotation
-    obj.rotation_quaternion = (w, x, y, z)
-
-    # Set scale
-    obj.scale = transform.scale
-
-
-def _link_object_to_scene(
-    obj: bpy.types.Object,
-    path: str = "",
-    hierarchical: bool = False,
-    path_prefix: str = "",
-    root_collection: bpy.types.Collection | None = None,
-) -> None:
-    """Link an object to the current scene.
-
-    Args:
-        obj: Blender object to link
-        path: The meshcat path for the object (used for hierarchical collections)
-        hierarchical: If True, create nested collections mirroring path structure
-        path_prefix: Custom prefix to strip from paths (auto-detected if empty)
-        root_collection: Pre-created root collection (created if None)
-    """
-    # Get or create root collection
-    if root_collection is None:
-        root_collection = _get_or_create_root_collection()
-
-    if hierarchical and path:
-        # Create hierarchy and get target collection
-        collection = _get_or_create_collection_hierarchy(
-            path, root_collection, path_prefix
-        )
-    else:
-        # Link directly to root collection
-        collection = root_collection
-
-    # Link object to collection
-    collection.objects.link(obj)
+        obj.matrix_world = meshcat_matrix
 
 
 def build_scene_from_file(
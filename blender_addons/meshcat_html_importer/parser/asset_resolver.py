@@ -3,15 +3,11 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import hashlib
-import re
 from dataclasses import dataclass
 from typing import Any
 
-# Data URI pattern: data:<mimetype>;base64,<data>
-DATA_URI_PATTERN = re.compile(r"data:([^;,]+)(?:;([^,]+))?,(.+)", re.DOTALL)
-
 
 @dataclass
 class ResolvedAsset:
@@ -33,6 +29,8 @@ class AssetResolver:
         """
         self._assets = cas_assets
         self._cache: dict[str, ResolvedAsset] = {}
+        # Resolved data URIs keyed by the URI string itself
+        self._uri_cache: dict[str, ResolvedAsset] = {}
 
     def resolve(self, key: str) -> ResolvedAsset | None:
         """Resolve an asset by its hash key.
@@ -65,15 +63,20 @@ class AssetResolver:
         Returns:
             ResolvedAsset with decoded data, or None if invalid
         """
-        # Generate hash for caching
-        hash_key = hashlib.sha256(data_uri.encode()).hexdigest()[:16]
+        # Look up the URI string directly, so repeated URIs are not rehashed
+        resolved = self._uri_cache.get(data_uri)
+        if resolved is not None:
+            return resolved
 
-        if hash_key in self._cache:
-            return self._cache[hash_key]
+        # Short content hash used as the asset key
+        hash_key = hashlib.blake2b(data_uri.encode(), digest_size=8).hexdigest()
 
-        resolved = self._parse_data_uri(data_uri, hash_key)
+        resolved = self._cache.get(hash_key)
+        if resolved is None:
+            resolved = self._parse_data_uri(data_uri, hash_key)
         if resolved:
             self._cache[hash_key] = resolved
+            self._uri_cache[data_uri] = resolved
 
         return resolved
 
@@ -87,20 +90,31 @@ class AssetResolver:
         Returns:
             ResolvedAsset or None if parsing fails
         """
-        match = DATA_URI_PATTERN.match(data_uri)
-        if not match:
+        # Data URI format: data:<mimetype>[;<encoding>],<data>
+        # Only the short header is split; the payload is never scanned here.
+        if not data_uri.startswith("data:"):
+            return None
+        header_end = data_uri.find(",", 5)
+        if header_end < 0 or header_end == len(data_uri) - 1:
             return None
 
-        mime_type = match.group(1)
-        encoding = match.group(2)  # Usually "base64"
-        data_str = match.group(3)
+        mime_type, sep, encoding = data_uri[5:header_end].partition(";")
+        if not mime_type or (sep and not encoding):
+            return None
+        # encoding is usually "base64"
 
         try:
+            # Encode once and slice the payload as a memoryview, so the
+            # (possibly multi-MB) payload is not copied again before decoding.
+            # binascii accepts the memoryview directly, unlike base64.b64decode
+            # which copies any buffer that is not bytes.
+            raw = data_uri.encode("utf-8")
+            payload = memoryview(raw)[raw.index(b",") + 1 :]
             if encoding == "base64":
-                data = base64.b64decode(data_str)
+                data = binascii.a2b_base64(payload)
             else:
                 # Assume URL-encoded or raw
-                data = data_str.encode("utf-8")
+                data = bytes(payload)
         except Exception as e:
             print(f"Warning: Failed to decode asset {hash_key}: {e}")
             return None
@@ -3,30 +3,117 @@
 
 from __future__ import annotations
 
-import base64
+import functools
+import mmap
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .command_types import Command
+from .command_types import (
+    Command,
+    CommandType,
+    get_animation_fps,
+)
 from .msgpack_decoder import decode_msgpack
 
+# Prefer pybase64 (SIMD-accelerated) when available, falling back to stdlib
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Minimum number of commands for which decoding is spread over threads
+_PARALLEL_DECODE_MIN_COMMANDS = 512
+
 # Pattern to match base64 msgpack data URIs
 # fetch("data:application/octet-binary;base64,<DATA>")
 FETCH_PATTERN = re.compile(
     r'fetch\s*\(\s*["\']data:application/octet-binary;base64,([A-Za-z0-9+/=]+)["\']\s*\)'
 )
 
-# Pattern to match casAssets dictionary (old format)
-# var casAssets = {"sha256-hash": "data:..."};
-CAS_ASSETS_DICT_PATTERN = re.compile(r"var\s+casAssets\s*=\s*(\{.*?\})\s*;", re.DOTALL)
+# Tokens that matter when balancing braces: double-quoted strings (written as
+# an unrolled loop so it cannot backtrack) and the braces themselves
+_BRACE_TOKEN_PATTERN = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*"|(?P<open>\{)|(?P<close>\})', re.DOTALL
+)
 
 # Pattern to extract individual asset entries from object literal
 ASSET_ENTRY_PATTERN = re.compile(r'"([^"]+)"\s*:\s*"([^"]*)"')
 
-# Pattern to match individual casAssets assignments (new format)
-# casAssets["cas-v1/hash"] = "data:...";
-CAS_ASSETS_ASSIGNMENT_PATTERN = re.compile(r'casAssets\["([^"]+)"\]\s*=\s*"([^"]*)"')
+# The fetch and both casAssets patterns combined into one alternation, so a
+# full recording is scanned once instead of once per pattern. Named groups tell
+# the matches apart: b64 (fetch), ck/cv (assignment) and dict (object literal).
+HTML_SCAN_PATTERN = re.compile(
+    r"fetch\s*\(\s*[\"']data:application/octet-binary;base64,"
+    r"(?P<b64>[A-Za-z0-9+/=]+)[\"']\s*\)"
+    r'|casAssets\["(?P<ck>[^"]+)"\]\s*=\s*"(?P<cv>[^"]*)"'
+    r"|var\s+casAssets\s*=\s*(?P<dict>\{)"
+)
+
+
+def _as_bytes_pattern(pattern: re.Pattern[str]) -> re.Pattern[bytes]:
+    """Compile a bytes version of an ASCII str pattern."""
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+# Bytes versions for scanning a memory-mapped file without decoding it
+_HTML_SCAN_BYTES_PATTERN = _as_bytes_pattern(HTML_SCAN_PATTERN)
+_ASSET_ENTRY_BYTES_PATTERN = _as_bytes_pattern(ASSET_ENTRY_PATTERN)
+_BRACE_TOKEN_BYTES_PATTERN = _as_bytes_pattern(_BRACE_TOKEN_PATTERN)
+
+
+@functools.cache
+def _cas_assets_dict_pattern() -> re.Pattern[str]:
+    """Pattern matching the start of the casAssets dictionary (old format).
+
+    var casAssets = {"sha256-hash": "data:..."};
+
+    The end of the literal is found by _find_object_literal_end(), which runs
+    in linear time instead of retrying a lazy ".*?" at every character.
+    Compiled on first use, as only extract_cas_assets() needs it.
+    """
+    return re.compile(r"var\s+casAssets\s*=\s*(\{)")
+
+
+@functools.cache
+def _cas_assets_assignment_pattern() -> re.Pattern[str]:
+    """Pattern matching individual casAssets assignments (new format).
+
+    casAssets["cas-v1/hash"] = "data:...";
+
+    Compiled on first use, as only extract_cas_assets() needs it.
+    """
+    return re.compile(r'casAssets\["([^"]+)"\]\s*=\s*"([^"]*)"')
+
+
+def _find_object_literal_end(text: str | bytes, start: int) -> int:
+    """Find the end of a JavaScript object literal by balancing braces.
+
+    Braces inside double-quoted strings are ignored.
+
+    Args:
+        text: Text containing the object literal
+        start: Index of the literal's opening brace
+
+    Returns:
+        Index just past the matching closing brace, or -1 if the literal
+        is not closed
+    """
+    pattern = (
+        _BRACE_TOKEN_PATTERN if isinstance(text, str) else _BRACE_TOKEN_BYTES_PATTERN
+    )
+    depth = 0
+    for token in pattern.finditer(text, start):
+        kind = token.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    return -1
 
 
 def extract_commands_from_html(html_content: str) -> list[bytes]:
@@ -43,7 +130,7 @@ def extract_commands_from_html(html_content: str) -> list[bytes]:
 
     for base64_data in matches:
         try:
-            decoded = base64.b64decode(base64_data)
+            decoded = base64.b64decode(base64_data, validate=False)
             commands.append(decoded)
         except Exception as e:
             print(f"Warning: Failed to decode base64 data: {e}")
@@ -70,24 +157,90 @@ def extract_cas_assets(html_content: str) -> dict[str, str]:
     """
     assets = {}
 
+    # Both formats contain the "casAssets" literal; skip the regex scans
+    # entirely when it is absent
+    first = html_content.find("casAssets")
+    if first == -1:
+        return assets
+
     # Try object literal format first
-    match = CAS_ASSETS_DICT_PATTERN.search(html_content)
-    if match:
-        assets_str = match.group(1)
+    match = _cas_assets_dict_pattern().search(html_content)
+    end = _find_object_literal_end(html_content, match.start(1)) if match else -1
+    if end != -1:
+        assets_str = html_content[match.start(1) : end]
         for entry_match in ASSET_ENTRY_PATTERN.finditer(assets_str):
             key = entry_match.group(1)
             value = entry_match.group(2)
             assets[key] = value
 
-    # Also try individual assignment format
-    for entry_match in CAS_ASSETS_ASSIGNMENT_PATTERN.finditer(html_content):
-        key = entry_match.group(1)
-        value = entry_match.group(2)
-        assets[key] = value
+    # Also try individual assignment format, starting at the first assignment
+    first_assignment = html_content.find("casAssets[", first)
+    if first_assignment != -1:
+        assignment_pattern = _cas_assets_assignment_pattern()
+        for entry_match in assignment_pattern.finditer(html_content, first_assignment):
+            key = entry_match.group(1)
+            value = entry_match.group(2)
+            assets[key] = value
 
     return assets
 
 
+def scan_html(
+    html_content: str | bytes | mmap.mmap,
+) -> tuple[list[bytes], dict[str, str]]:
+    """Extract commands and casAssets from HTML in a single pass.
+
+    Equivalent to calling extract_commands_from_html() and
+    extract_cas_assets(), but only walks the HTML once.
+
+    Args:
+        html_content: The HTML file content, either as a string or as raw
+            bytes (including a memory-mapped file)
+
+    Returns:
+        Tuple of (decoded msgpack bytes, casAssets dictionary)
+    """
+    if isinstance(html_content, str):
+        scan_pattern, entry_pattern = HTML_SCAN_PATTERN, ASSET_ENTRY_PATTERN
+        to_str = str
+    else:
+        scan_pattern = _HTML_SCAN_BYTES_PATTERN
+        entry_pattern = _ASSET_ENTRY_BYTES_PATTERN
+        to_str = bytes.decode
+
+    commands = []
+    dict_assets: dict[str, str] = {}
+    assigned_assets: dict[str, str] = {}
+    found_dict = False
+
+    pos = 0
+    while match := scan_pattern.search(html_content, pos):
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "b64":
+            try:
+                commands.append(base64.b64decode(match.group("b64"), validate=False))
+            except Exception as e:
+                print(f"Warning: Failed to decode base64 data: {e}")
+        elif kind == "cv":
+            assigned_assets[to_str(match.group("ck"))] = to_str(match.group("cv"))
+        elif kind == "dict" and not found_dict:
+            end = _find_object_literal_end(html_content, match.start("dict"))
+            if end == -1:
+                continue
+            # Only the first object literal is used, as in extract_cas_assets
+            found_dict = True
+            assets_str = html_content[match.start("dict") : end]
+            for entry_match in entry_pattern.finditer(assets_str):
+                key, value = entry_match.groups()
+                dict_assets[to_str(key)] = to_str(value)
+            pos = end
+
+    # Individual assignments take precedence over the object literal
+    dict_assets.update(assigned_assets)
+    return commands, dict_assets
+
+
 def parse_commands(raw_commands: list[bytes]) -> list[Command]:
     """Parse raw msgpack bytes into Command objects.
 
@@ -112,53 +265,94 @@ def parse_commands(raw_commands: list[bytes]) -> list[Command]:
     return commands
 
 
-def parse_html_recording(html_path: Path | str) -> dict[str, Any]:
+def _decode_command(raw: bytes) -> tuple[Any, Command | None] | None:
+    """Decode one msgpack payload into its raw object and Command.
+
+    Returns:
+        Tuple of (decoded object, Command or None if it is not a valid
+        command), or None if the payload could not be decoded
+    """
+    try:
+        decoded = decode_msgpack(raw)
+    except Exception as e:
+        print(f"Warning: Failed to parse command: {e}")
+        return None
+    if not isinstance(decoded, dict):
+        return decoded, None
+    try:
+        return decoded, Command.from_dict(decoded)
+    except Exception as e:
+        print(f"Warning: Failed to parse command: {e}")
+        return decoded, None
+
+
+def _decode_commands(
+    raw_bytes: list[bytes],
+) -> list[tuple[Any, Command | None] | None]:
+    """Decode msgpack payloads with _decode_command, in order.
+
+    Payloads are independent, so on free-threaded Python large recordings
+    are decoded on a thread pool. With the GIL, threads cannot run the
+    decoder in parallel and process pools would have to pickle every
+    decoded command back, so the payloads are decoded serially.
+    """
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled or len(raw_bytes) < _PARALLEL_DECODE_MIN_COMMANDS:
+        return [_decode_command(raw) for raw in raw_bytes]
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_decode_command, raw_bytes, chunksize=64))
+
+
+def parse_html_recording(
+    html_path: Path | str, include_raw: bool = False
+) -> dict[str, Any]:
     """Parse a complete meshcat HTML recording.
 
     Args:
         html_path: Path to the HTML file
+        include_raw: Whether to also return the raw decoded command dicts.
+                    Off by default, as keeping them holds on to every
+                    decoded command for the lifetime of the result.
 
     Returns:
         Dictionary containing:
         - commands: List of parsed Command objects
         - assets: Dictionary of casAssets (hash -> data URI)
-        - raw_commands: List of raw decoded command dicts (for debugging)
+        - raw_commands: List of raw decoded command dicts (for debugging),
+          or None unless include_raw is set
     """
     html_path = Path(html_path)
-    html_content = html_path.read_text(encoding="utf-8")
-
-    # Extract raw command bytes
-    raw_bytes = extract_commands_from_html(html_content)
 
-    # Decode commands to dicts for inspection
-    raw_commands = []
-    for raw in raw_bytes:
-        try:
-            decoded = decode_msgpack(raw)
-            raw_commands.append(decoded)
-        except Exception:
+    # Extract raw command bytes and assets in one scan. The file is mapped
+    # rather than read so large recordings are never decoded to a str.
+    with html_path.open("rb") as f:
+        if html_path.stat().st_size == 0:
+            raw_bytes, assets = [], {}
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                raw_bytes, assets = scan_html(mm)
+
+    # Decode each command once, keeping the dicts only if requested
+    raw_commands = [] if include_raw else None
+    commands = []
+    for result in _decode_commands(raw_bytes):
+        if result is None:
             continue
+        decoded, cmd = result
+        if raw_commands is not None:
+            raw_commands.append(decoded)
+        if cmd is not None:
+            commands.append(cmd)
 
-    # Parse into Command objects
-    commands = parse_commands(raw_bytes)
-
-    # Extract assets
-    assets = extract_cas_assets(html_content)
-
-    # Extract animation FPS from set_animation commands
+    # Extract animation FPS from the last set_animation command that has one,
+    # matching the scene graph where later animations override earlier ones
     animation_fps = 64.0  # Drake default
-    for cmd in commands:
-        if cmd.type.value == "set_animation":
-            options = cmd.data.get("options", {})
-            # Check options first: Drake uses "fps", meshcat.js uses "play_fps"
-            fps = options.get("fps") or options.get("play_fps")
-            # Fall back to the clip-level fps from the first animation
-            if not fps:
-                animations = cmd.data.get("animations", [])
-                if animations:
-                    fps = animations[0].get("clip", {}).get("fps")
+    for cmd in reversed(commands):
+        if cmd.type is CommandType.SET_ANIMATION:
+            fps = get_animation_fps(cmd.data)
             if fps:
-                animation_fps = float(fps)
+                animation_fps = fps
                 break
 
     return {
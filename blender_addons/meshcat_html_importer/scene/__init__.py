@@ -5,6 +5,7 @@ from .geometry import (
     GeometryType,
     MeshGeometry,
     PrimitiveGeometry,
+    geometry_key,
     parse_geometry,
 )
 from .materials import MaterialType, parse_material
@@ -22,6 +23,7 @@ __all__ = [
     "GeometryType",
     "MeshGeometry",
     "PrimitiveGeometry",
+    "geometry_key",
     "parse_material",
     "MaterialType",
     "parse_transform_matrix",
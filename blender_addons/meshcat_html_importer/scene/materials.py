@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+# Lookup table from a color byte to its 0-1 float value
+_BYTE_TO_UNIT = tuple(i / 255.0 for i in range(256))
+
 
 class MaterialType(Enum):
     """Types of materials supported by meshcat."""
@@ -19,7 +23,11 @@ class MaterialType(Enum):
     POINTS = "PointsMaterial"
 
 
-@dataclass
+# Map type string to enum
+_MATERIAL_TYPES = {mat_type.value: mat_type for mat_type in MaterialType}
+
+
+@dataclass(slots=True)
 class Color:
     """RGB color with values 0-1."""
 
@@ -30,17 +38,24 @@ class Color:
     @classmethod
     def from_int(cls, color_int: int) -> Color:
         """Create from integer color (0xRRGGBB)."""
-        r = ((color_int >> 16) & 0xFF) / 255.0
-        g = ((color_int >> 8) & 0xFF) / 255.0
-        b = (color_int & 0xFF) / 255.0
-        return cls(r=r, g=g, b=b)
+        return cls(
+            r=_BYTE_TO_UNIT[(color_int >> 16) & 0xFF],
+            g=_BYTE_TO_UNIT[(color_int >> 8) & 0xFF],
+            b=_BYTE_TO_UNIT[color_int & 0xFF],
+        )
 
     @classmethod
     def from_hex(cls, hex_str: str) -> Color:
         """Create from hex string (#RRGGBB or 0xRRGGBB)."""
-        hex_str = hex_str.lstrip("#").lstrip("0x")
-        color_int = int(hex_str, 16)
-        return cls.from_int(color_int)
+        if hex_str.startswith("#"):
+            hex_str = hex_str[1:]
+        elif hex_str.startswith(("0x", "0X")):
+            hex_str = hex_str[2:]
+
+        if len(hex_str) == 6:
+            r, g, b = bytes.fromhex(hex_str)
+            return cls(r=_BYTE_TO_UNIT[r], g=_BYTE_TO_UNIT[g], b=_BYTE_TO_UNIT[b])
+        return cls.from_int(int(hex_str, 16))
 
     def to_tuple(self) -> tuple[float, float, float]:
         """Convert to RGB tuple."""
@@ -51,7 +66,7 @@ class Color:
         return (self.r, self.g, self.b, alpha)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMaterial:
     """Parsed material data from meshcat."""
 
@@ -105,47 +120,15 @@ def parse_material(mat_data: dict[str, Any]) -> ParsedMaterial | None:
     """
     mat_type_str = mat_data.get("type", "")
 
-    # Map string to enum
-    type_map = {
-        "MeshStandardMaterial": MaterialType.MESH_STANDARD,
-        "MeshPhongMaterial": MaterialType.MESH_PHONG,
-        "MeshBasicMaterial": MaterialType.MESH_BASIC,
-        "MeshLambertMaterial": MaterialType.MESH_LAMBERT,
-        "LineBasicMaterial": MaterialType.LINE_BASIC,
-        "PointsMaterial": MaterialType.POINTS,
-    }
-
-    mat_type = type_map.get(mat_type_str)
+    mat_type = _MATERIAL_TYPES.get(mat_type_str)
     if mat_type is None:
         print(f"Warning: Unsupported material type: {mat_type_str}")
         return None
 
-    # Parse color
-    color = Color(1.0, 1.0, 1.0)
-    if "color" in mat_data:
-        color_val = mat_data["color"]
-        if isinstance(color_val, int):
-            color = Color.from_int(color_val)
-        elif isinstance(color_val, str):
-            color = Color.from_hex(color_val)
-
-    # Parse emissive
-    emissive = Color(0.0, 0.0, 0.0)
-    if "emissive" in mat_data:
-        emissive_val = mat_data["emissive"]
-        if isinstance(emissive_val, int):
-            emissive = Color.from_int(emissive_val)
-        elif isinstance(emissive_val, str):
-            emissive = Color.from_hex(emissive_val)
-
-    # Parse specular
-    specular = Color(0.1, 0.1, 0.1)
-    if "specular" in mat_data:
-        specular_val = mat_data["specular"]
-        if isinstance(specular_val, int):
-            specular = Color.from_int(specular_val)
-        elif isinstance(specular_val, str):
-            specular = Color.from_hex(specular_val)
+    # Parse colors
+    color = _parse_color(mat_data.get("color"), Color(1.0, 1.0, 1.0))
+    emissive = _parse_color(mat_data.get("emissive"), Color(0.0, 0.0, 0.0))
+    specular = _parse_color(mat_data.get("specular"), Color(0.1, 0.1, 0.1))
 
     # Parse side
     side_val = mat_data.get("side", 0)
@@ -190,6 +173,15 @@ def parse_material(mat_data: dict[str, Any]) -> ParsedMaterial | None:
     )
 
 
+def _parse_color(value: Any, default: Color) -> Color:
+    """Parse an integer or hex string color, falling back to a default."""
+    if isinstance(value, int):
+        return Color.from_int(value)
+    elif isinstance(value, str):
+        return Color.from_hex(value)
+    return default
+
+
 def shininess_to_roughness(shininess: float) -> float:
     """Convert Phong shininess to PBR roughness.
 
@@ -203,8 +195,6 @@ def shininess_to_roughness(shininess: float) -> float:
         Roughness value (0-1)
     """
     # Common approximation: roughness = sqrt(2 / (shininess + 2))
-    import math
-
     if shininess <= 0:
         return 1.0
     roughness = math.sqrt(2.0 / (shininess + 2.0))
@@ -3,28 +3,46 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
 
-from ..parser.command_types import Command, CommandType
+from ..animation.animation_data import (
+    TrackType,
+    track_type_from_name,
+)
+from ..parser.command_types import (
+    Command,
+    CommandType,
+    get_animation_fps,
+)
 from .geometry import (
     MeshFileGeometry,
     MeshGeometry,
     PrimitiveGeometry,
     parse_geometry,
+    prefetch_cas_assets,
 )
 from .materials import ParsedMaterial, parse_material
 from .transforms import (
     Transform,
-    combine_transforms,
     matrix_to_trs,
     parse_transform_matrix,
+    trs_to_matrices,
 )
 
+# KeyframeTrack channel and width filled by each transform track type
+_TRACK_CHANNELS: dict[TrackType, tuple[str, int]] = {
+    TrackType.POSITION: ("positions", 3),
+    TrackType.QUATERNION: ("rotations", 4),
+    TrackType.SCALE: ("scales", 3),
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class AnimationKeyframe:
     """A single keyframe for animation."""
 
@@ -34,19 +52,96 @@ class AnimationKeyframe:
     scale: tuple[float, float, float] | None = None
 
 
-@dataclass
+@dataclass(eq=False)
+class KeyframeTrack:
+    """Animation keyframes of a node stored as parallel arrays.
+
+    Each channel is an (N, width) array aligned with ``times``. Rows where a
+    channel has no value at that time are NaN; channels that never appear in
+    the animation are None.
+    """
+
+    times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    positions: np.ndarray | None = None  # (N, 3)
+    rotations: np.ndarray | None = None  # (N, 4) quaternion (x,y,z,w)
+    scales: np.ndarray | None = None  # (N, 3)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[AnimationKeyframe]:
+        """Iterate over the keyframes as AnimationKeyframe views."""
+        for i, t in enumerate(self.times.tolist()):
+            yield AnimationKeyframe(
+                time=t,
+                position=_channel_row(self.positions, i),
+                rotation=_channel_row(self.rotations, i),
+                scale=_channel_row(self.scales, i),
+            )
+
+    @classmethod
+    def from_keyframes(cls, keyframes: list[AnimationKeyframe]) -> KeyframeTrack:
+        """Build a track from a list of AnimationKeyframe."""
+        track = cls(times=np.array([kf.time for kf in keyframes], dtype=np.float64))
+        track.positions = _channel_array([kf.position for kf in keyframes], 3)
+        track.rotations = _channel_array([kf.rotation for kf in keyframes], 4)
+        track.scales = _channel_array([kf.scale for kf in keyframes], 3)
+        return track
+
+    def extend(self, other: KeyframeTrack) -> None:
+        """Append the keyframes of another track to this one."""
+        n_self, n_other = len(self), len(other)
+        for name, width in (("positions", 3), ("rotations", 4), ("scales", 3)):
+            a = getattr(self, name)
+            b = getattr(other, name)
+            if a is None and b is None:
+                continue
+            if a is None:
+                a = np.full((n_self, width), np.nan, dtype=np.float32)
+            if b is None:
+                b = np.full((n_other, width), np.nan, dtype=np.float32)
+            setattr(self, name, np.concatenate([a, b]))
+        self.times = np.concatenate([self.times, other.times])
+
+
+def _channel_row(values: np.ndarray | None, index: int) -> tuple[float, ...] | None:
+    """Return one row of a keyframe channel as a tuple, or None if missing."""
+    if values is None:
+        return None
+    row = values[index]
+    if np.isnan(row).any():
+        return None
+    return tuple(row.tolist())
+
+
+def _channel_array(
+    rows: list[tuple[float, ...] | None], width: int
+) -> np.ndarray | None:
+    """Pack optional per-keyframe values into a NaN-padded (N, width) array."""
+    if all(row is None for row in rows):
+        return None
+    values = np.full((len(rows), width), np.nan, dtype=np.float32)
+    for i, row in enumerate(rows):
+        if row is not None:
+            values[i] = row
+    return values
+
+
+@dataclass(slots=True)
 class SceneNode:
     """A node in the scene graph."""
 
     path: str
     name: str
+    # Group transform from set_transform. Change it with set_transform() so
+    # cached world matrices of the node and its descendants are cleared.
     transform: Transform = field(default_factory=Transform.identity)
     geometry: MeshGeometry | PrimitiveGeometry | MeshFileGeometry | None = None
     material: ParsedMaterial | None = None
     visible: bool = True
     children: dict[str, SceneNode] = field(default_factory=dict)
     parent: SceneNode | None = None
-    keyframes: list[AnimationKeyframe] = field(default_factory=list)
+    keyframes: KeyframeTrack = field(default_factory=KeyframeTrack)
 
     # Object type hints
     object_type: str = "Object3D"  # Mesh, Line, Points, etc.
@@ -56,6 +151,39 @@ class SceneNode:
     # has its own local matrix (e.g., containing mm-to-m scale conversion).
     object_matrix: Transform = field(default_factory=Transform.identity)
 
+    # Path components, split once (e.g. ("drake", "illustration", "robot"))
+    path_parts: tuple[str, ...] = field(init=False, repr=False)
+
+    # 4x4 world matrix of the node's group (parent chain × transform), cached on
+    # first use or by SceneGraph.compute_world_transforms(), and cleared when
+    # set_transform() is called on this node or an ancestor. Does not include
+    # object_matrix. Kept as a matrix so the chain is only decomposed at the end.
+    world_matrix: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path_parts = tuple(self.path.strip("/").split("/"))
+
+    def set_transform(self, transform: Transform) -> None:
+        """Set the group transform, invalidating cached world matrices.
+
+        Args:
+            transform: New transform relative to the parent node
+        """
+        self.transform = transform
+        self.invalidate_world_matrix()
+
+    def invalidate_world_matrix(self) -> None:
+        """Clear the cached world matrices of this node and its descendants."""
+        # A descendant is only cached if its ancestors are, so an uncached
+        # node has nothing cached below it
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.world_matrix is None:
+                continue
+            node.world_matrix = None
+            stack.extend(node.children.values())
+
     def get_world_transform(self) -> Transform:
         """Get the world transform by combining all parent transforms.
 
@@ -66,30 +194,34 @@ class SceneNode:
         transform (set by set_transform) and the object inside has its own local
         matrix (set by set_object).
 
+        The chain is composed as 4x4 matrices and decomposed once. Its group
+        part is cached in world_matrix on this node and its ancestors, so
+        later calls only compose the missing levels.
+
         Returns:
             Transform in world space
         """
-        # Collect transforms from root to this node
-        transforms = []
-        node = self
-        while node is not None:
-            transforms.append(node.transform)
-            node = node.parent
-
-        # Combine from root (last) to leaf (first)
-        transforms.reverse()
-
-        if not transforms:
-            world_transform = Transform.identity()
-        else:
-            world_transform = transforms[0]
-            for t in transforms[1:]:
-                world_transform = combine_transforms(world_transform, t)
-
         # Apply the object's own local matrix (e.g., scale from mesh format)
-        world_transform = combine_transforms(world_transform, self.object_matrix)
+        return matrix_to_trs(
+            self.get_group_world_matrix() @ self.object_matrix.to_matrix()
+        )
+
+    def get_group_world_matrix(self) -> np.ndarray:
+        """Get the 4x4 world matrix of the node's group, caching it.
+
+        Unlike get_world_transform(), this does not include object_matrix.
 
-        return world_transform
+        Returns:
+            4x4 transformation matrix in world space
+        """
+        if self.world_matrix is None:
+            if self.parent is None:
+                self.world_matrix = self.transform.to_matrix()
+            else:
+                self.world_matrix = (
+                    self.parent.get_group_world_matrix() @ self.transform.to_matrix()
+                )
+        return self.world_matrix
 
 
 class SceneGraph:
@@ -106,6 +238,14 @@ class SceneGraph:
         self._textures: dict[str, Any] = {}
         self._animation_fps: float = 30.0
         self._assets: dict[str, str] = assets or {}
+        self._decoded_assets: dict[str, bytes] = {}
+        self._command_handlers: dict[CommandType, Callable[[Command], None]] = {
+            CommandType.SET_OBJECT: self._handle_set_object,
+            CommandType.SET_TRANSFORM: self._handle_set_transform,
+            CommandType.DELETE: self._handle_delete,
+            CommandType.SET_PROPERTY: self._handle_set_property,
+            CommandType.SET_ANIMATION: self._handle_set_animation,
+        }
 
     def process_commands(self, commands: list[Command]) -> None:
         """Process a list of commands to build the scene graph.
@@ -113,46 +253,67 @@ class SceneGraph:
         Args:
             commands: List of parsed Command objects
         """
+        if self._assets:
+            try:
+                self._prefetch_cas_assets(commands)
+            except Exception as e:
+                # Assets are still decoded one geometry at a time below
+                print(f"Warning: Failed to prefetch CAS assets: {e}")
+
         for cmd in commands:
             try:
                 self._process_command(cmd)
             except Exception as e:
                 print(f"Warning: Failed to process command {cmd.type}: {e}")
 
+    def _prefetch_cas_assets(self, commands: list[Command]) -> None:
+        """Decode the CAS assets of all mesh file objects in one batch."""
+        geom_data_list = []
+        for cmd in commands:
+            if cmd.type != CommandType.SET_OBJECT:
+                continue
+            inner_obj = cmd.data.get("object", {}).get("object", {})
+            if inner_obj.get("type") == "_meshfile_object":
+                geom_data_list.append(
+                    {
+                        "type": "_meshfile_geometry",
+                        "format": inner_obj.get("format"),
+                        "data": inner_obj.get("data"),
+                    }
+                )
+        prefetch_cas_assets(geom_data_list, self._assets, self._decoded_assets)
+
     def _process_command(self, cmd: Command) -> None:
         """Process a single command."""
-        if cmd.type == CommandType.SET_OBJECT:
-            self._handle_set_object(cmd)
-        elif cmd.type == CommandType.SET_TRANSFORM:
-            self._handle_set_transform(cmd)
-        elif cmd.type == CommandType.DELETE:
-            self._handle_delete(cmd)
-        elif cmd.type == CommandType.SET_PROPERTY:
-            self._handle_set_property(cmd)
-        elif cmd.type == CommandType.SET_ANIMATION:
-            self._handle_set_animation(cmd)
+        handler = self._command_handlers.get(cmd.type)
+        if handler is not None:
+            handler(cmd)
 
     def _get_or_create_node(self, path: str) -> SceneNode:
         """Get existing node or create node hierarchy for path."""
         if path in self._nodes:
             return self._nodes[path]
 
-        # Create parent nodes as needed
-        parts = path.strip("/").split("/")
-        current_path = ""
+        # Walk down by path segment, creating missing nodes as needed. Full
+        # path strings are only built for new nodes.
         parent = self.root
-
-        for part in parts:
-            current_path = f"{current_path}/{part}"
-            if current_path not in self._nodes:
+        relative_path = path.strip("/")
+        if not relative_path:
+            return parent
+
+        for part in relative_path.split("/"):
+            node = parent.children.get(part)
+            if node is None:
+                part = sys.intern(part)
+                prefix = "" if parent is self.root else parent.path
                 node = SceneNode(
-                    path=current_path,
+                    path=f"{prefix}/{part}",
                     name=part,
                     parent=parent,
                 )
                 parent.children[part] = node
-                self._nodes[current_path] = node
-            parent = self._nodes[current_path]
+                self._nodes[node.path] = node
+            parent = node
 
         return parent
 
@@ -192,6 +353,7 @@ class SceneGraph:
                     "resources": inner_obj.get("resources", {}),
                 },
                 cas_assets=self._assets,
+                decoded_assets=self._decoded_assets,
             )
             # _meshfile_object typically doesn't have separate material
             return
@@ -235,7 +397,7 @@ class SceneGraph:
 
         try:
             matrix = parse_transform_matrix(matrix_data)
-            node.transform = matrix_to_trs(matrix)
+            node.set_transform(matrix_to_trs(matrix))
         except Exception as e:
             print(f"Warning: Failed to parse transform for {path}: {e}")
 
@@ -247,13 +409,19 @@ class SceneGraph:
             node = self._nodes[path]
             if node.parent and node.name in node.parent.children:
                 del node.parent.children[node.name]
-            del self._nodes[path]
 
-            # Also delete all children
-            prefix = path + "/"
-            to_delete = [p for p in self._nodes if p.startswith(prefix)]
-            for p in to_delete:
-                del self._nodes[p]
+            # Delete the node and all its descendants by walking the subtree.
+            # Children are detached so the removed nodes cannot be reached
+            # again, e.g. through the root when "/" is deleted.
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                stack.extend(node.children.values())
+                node.children.clear()
+                self._nodes.pop(node.path, None)
+
+            # Deleting "/" clears the scene but keeps the root itself
+            self._nodes["/"] = self.root
 
     def _handle_set_property(self, cmd: Command) -> None:
         """Handle set_property command."""
@@ -272,14 +440,7 @@ class SceneGraph:
         """Handle set_animation command."""
         data = cmd.data
         animations = data.get("animations", [])
-        options = data.get("options", {})
-
-        # Store FPS - Drake uses "fps" key, meshcat.js uses "play_fps"
-        fps_value = options.get("fps") or options.get("play_fps")
-        # Fall back to the clip-level fps from the first animation
-        if not fps_value and animations:
-            fps_value = animations[0].get("clip", {}).get("fps")
-        self._animation_fps = float(fps_value or 64.0)
+        self._animation_fps = get_animation_fps(data) or 64.0
 
         for anim in animations:
             path = anim.get("path", "")
@@ -295,50 +456,58 @@ class SceneGraph:
         Meshcat animation tracks use a 'keys' array with {time, value} objects,
         where time is the frame number and value is the property value.
         """
-        # Collect keyframe times and values per track
-        all_times: set[float] = set()
-        track_data: dict[str, dict[float, Any]] = {}
+        # Collect the key times of every track, and the times and values of
+        # transform tracks. Each track is classified once by name.
+        time_arrays: list[np.ndarray] = []
+        channel_keys: list[tuple[str, int, np.ndarray, list[Any]]] = []
 
         for track in tracks:
-            track_name = track.get("name", "")
             keys = track.get("keys", [])
+            times = np.fromiter(
+                (key.get("time", 0) for key in keys), dtype=np.float64, count=len(keys)
+            )
+            # Other tracks still contribute keyframe times
+            time_arrays.append(times)
 
-            # Build time -> value mapping for this track
-            time_to_value = {}
-            for key in keys:
-                t = key.get("time", 0)
-                value = key.get("value")
-                time_to_value[t] = value
-                all_times.add(t)
-
-            track_data[track_name] = time_to_value
-
-        # Build keyframes for each time
-        sorted_times = sorted(all_times)
-
-        for t in sorted_times:
-            kf = AnimationKeyframe(time=t)
-
-            for track_name, time_to_value in track_data.items():
-                if t not in time_to_value:
-                    continue
-
-                value = time_to_value[t]
-                if value is None:
-                    continue
-
-                # Convert numpy arrays to lists/tuples
-                if isinstance(value, np.ndarray):
-                    value = value.tolist()
+            channel_width = _TRACK_CHANNELS.get(
+                track_type_from_name(track.get("name", ""))
+            )
+            if channel_width is None:
+                continue
 
-                if ".position" in track_name or track_name == ".position":
-                    kf.position = tuple(value)
-                elif ".quaternion" in track_name or track_name == ".quaternion":
-                    kf.rotation = tuple(value)
-                elif ".scale" in track_name or track_name == ".scale":
-                    kf.scale = tuple(value)
+            values = [key.get("value") for key in keys]
+            present = np.fromiter(
+                (v is not None for v in values), dtype=bool, count=len(values)
+            )
+            if not present.all():
+                times = times[present]
+                values = [v for v in values if v is not None]
+            if values:
+                channel_keys.append((*channel_width, times, values))
+
+        # One row per distinct keyframe time, sorted
+        if time_arrays:
+            all_times = np.unique(np.concatenate(time_arrays))
+        else:
+            all_times = np.empty(0, dtype=np.float64)
+        track = KeyframeTrack(times=all_times)
+
+        # Scatter all keys of each track into their rows at once
+        for channel, width, times, values in channel_keys:
+            channel_values = getattr(track, channel)
+            if channel_values is None:
+                channel_values = np.full(
+                    (len(all_times), width), np.nan, dtype=np.float32
+                )
+                setattr(track, channel, channel_values)
+            channel_values[np.searchsorted(all_times, times)] = np.asarray(
+                values, dtype=np.float32
+            ).reshape(len(values), width)
 
-            node.keyframes.append(kf)
+        if node.keyframes:
+            node.keyframes.extend(track)
+        else:
+            node.keyframes = track
 
     def _extract_textures(self, obj_data: dict) -> None:
         """Extract texture data from object definition."""
@@ -354,6 +523,35 @@ class SceneGraph:
             if uuid:
                 self._textures[f"image_{uuid}"] = img
 
+    def compute_world_transforms(self) -> None:
+        """Compute and cache the world transform of every node in one pass.
+
+        Lays the graph out level by level from the root as parallel arrays
+        (local matrices and parent indices), so each depth level is composed
+        with its parents' world matrices in one batched matrix product. The
+        results are stored in SceneNode.world_matrix and stay valid until
+        SceneNode.set_transform() changes the node or one of its ancestors.
+        """
+        # Breadth-first order from the root: each level follows its parents
+        order: list[SceneNode] = [self.root]
+        parent_indices: list[int] = [-1]
+        level_starts = [0, 1]
+        while level_starts[-2] < level_starts[-1]:
+            for parent_index in range(level_starts[-2], level_starts[-1]):
+                children = order[parent_index].children.values()
+                order.extend(children)
+                parent_indices.extend([parent_index] * len(children))
+            level_starts.append(len(order))
+
+        data = np.stack([node.transform.data for node in order])
+        matrices = trs_to_matrices(data[:, 0:3], data[:, 3:7], data[:, 7:10])
+        parents = np.array(parent_indices, dtype=np.intp)
+        for start, stop in zip(level_starts[1:-1], level_starts[2:]):
+            matrices[start:stop] = matrices[parents[start:stop]] @ matrices[start:stop]
+
+        for node, matrix in zip(order, matrices):
+            node.world_matrix = matrix
+
     def get_all_nodes(self) -> list[SceneNode]:
         """Get all nodes in the scene graph."""
         return list(self._nodes.values())
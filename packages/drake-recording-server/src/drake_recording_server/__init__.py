@@ -1,7 +1,19 @@
 # SPDX-License-Identifier: MIT
 """Drake Recording Server - Record Drake simulations as Blender keyframes."""
 
-from drake_recording_server.server import Blender, RenderParams, ServerApp
+from drake_recording_server.server import (
+    Blender,
+    RenderParams,
+    ServerApp,
+    load_keyframes,
+    pose_frame,
+)
 
 __version__ = "0.1.0"
-__all__ = ["Blender", "RenderParams", "ServerApp"]
+__all__ = [
+    "Blender",
+    "RenderParams",
+    "ServerApp",
+    "load_keyframes",
+    "pose_frame",
+]
@@ -6,7 +6,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from drake_recording_server.server import run_server
+from drake_recording_server.server import KEYFRAME_FORMATS, run_server
 
 
 def main() -> None:
@@ -42,7 +42,13 @@ def main() -> None:
         "--keyframe_dump_path",
         required=True,
         type=Path,
-        help="Path to dump keyframes to disk (.pkl)",
+        help="Path to dump keyframes to disk (.pkl, or .jsonl for the json format)",
+    )
+    parser.add_argument(
+        "--keyframe_format",
+        choices=KEYFRAME_FORMATS,
+        default="pickle",
+        help="Format of the keyframe dump (default: %(default)s)",
     )
     parser.add_argument(
         "--bpy_settings_file",
@@ -57,9 +63,10 @@ def main() -> None:
             f"Expected export_path to have '.blend' suffix, "
             f"got '{args.export_path.suffix}'"
         )
-    if args.keyframe_dump_path.suffix != ".pkl":
+    keyframe_suffix = ".jsonl" if args.keyframe_format == "json" else ".pkl"
+    if args.keyframe_dump_path.suffix != keyframe_suffix:
         raise ValueError(
-            f"Expected keyframe_dump_path to have '.pkl' suffix, "
+            f"Expected keyframe_dump_path to have '{keyframe_suffix}' suffix, "
             f"got '{args.keyframe_dump_path.suffix}'"
         )
 
@@ -70,6 +77,7 @@ def main() -> None:
         bpy_settings_file=args.bpy_settings_file,
         export_path=args.export_path,
         keyframe_dump_path=args.keyframe_dump_path,
+        keyframe_format=args.keyframe_format,
     )
 
 
@@ -4,20 +4,60 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses as dc
 import datetime
+import functools
+import gzip
 import io
+import json
 import math
+import os
 import pickle
+import queue
+import shutil
 import tempfile
+import threading
 import typing
 from pathlib import Path
 from types import NoneType
 
 import bpy
 import flask
+import numpy as np
+import werkzeug.serving
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Written first to a keyframe stream file, so that loaders can tell the stream
+# (one pickled frame per record) apart from a single pickled list of frames.
+KEYFRAME_STREAM_HEADER = {"format": "drake_recording_server.keyframes", "version": 1}
+
+# Magic bytes at the start of a gzip-compressed keyframe stream.
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Supported keyframe stream formats. "pickle" writes a gzip-compressed stream
+# of pickled records, "json" writes JSON Lines with one record per line.
+KEYFRAME_FORMATS = ("pickle", "json")
+
+# Rotation by +90 degrees around the X-axis, which compensates for the glTF
+# importer's rotation, as a matrix and as the 4x4 matrix of the quaternion
+# product q * p for quaternions in Blender's (w, x, y, z) order.
+_RX90 = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])
+_QX90 = np.array([math.cos(math.pi / 4), math.sin(math.pi / 4), 0.0, 0.0])
+_QX90_PRODUCT = np.array(
+    [
+        [_QX90[0], -_QX90[1], -_QX90[2], -_QX90[3]],
+        [_QX90[1], _QX90[0], -_QX90[3], _QX90[2]],
+        [_QX90[2], _QX90[3], _QX90[0], -_QX90[1]],
+        [_QX90[3], -_QX90[2], _QX90[1], _QX90[0]],
+    ]
+)
+
 
 @dc.dataclass
 class RenderParams:
@@ -72,6 +112,43 @@ class RenderParams:
     """The maximum depth range. Only provided when image_type='depth'."""
 
 
+def _param_converter(name: str, field_type: typing.Any) -> typing.Callable:
+    """Return a function converting a form value to a RenderParams field type."""
+    type_origin = typing.get_origin(field_type)
+    type_args = typing.get_args(field_type)
+    if field_type in (int, float, str):
+        return field_type
+    if type_origin == typing.Literal:
+        allowed = frozenset(type_args)
+
+        def convert_literal(value: str) -> str:
+            if value not in allowed:
+                raise ValueError(f"Invalid literal for {name}")
+            return value
+
+        return convert_literal
+    if type_origin == typing.Union:
+        # Handle typing.Optional (Union[T, None]).
+        assert len(type_args) == 2
+        assert type_args[1] == NoneType
+        return type_args[0]
+
+    def convert_unsupported(value: str) -> typing.NoReturn:
+        raise NotImplementedError(name)
+
+    return convert_unsupported
+
+
+# Lookup table from form field name to its value converter, computed once since
+# the request parsing only depends on the RenderParams fields. The types are
+# resolved from their annotation strings.
+_PARAM_CONVERTERS = {
+    name: _param_converter(name, field_type)
+    for name, field_type in typing.get_type_hints(RenderParams).items()
+    if name != "scene"
+}
+
+
 class Blender:
     """Encapsulates access to Blender.
 
@@ -86,13 +163,19 @@ class Blender:
         bpy_settings_file: Path | None = None,
         export_path: Path | None = None,
         keyframe_dump_path: Path | None = None,
+        keyframe_format: str = "pickle",
     ):
+        if keyframe_format not in KEYFRAME_FORMATS:
+            raise ValueError(f"Unsupported keyframe format: {keyframe_format}")
+
         self._blend_file = blend_file
         self._bpy_settings_file = bpy_settings_file
         self._export_path = export_path
         self._keyframe_dump_path = keyframe_dump_path
+        self._keyframe_format = keyframe_format
 
-        self._keyframes: list[list[dict]] = []
+        self._keyframes: list[dict] = []
+        self._keyframe_dump_file: typing.BinaryIO | None = None
 
         if self._keyframe_dump_path and self._keyframe_dump_path.exists():
             response = input(
@@ -110,12 +193,47 @@ class Blender:
     def reset_scene(self) -> None:
         """Reset the scene by loading factory settings and removing default objects."""
         bpy.ops.wm.read_factory_settings()
-        for item in bpy.data.objects:
-            item.select_set(True)
-        bpy.ops.object.delete()
+        bpy.data.batch_remove(bpy.data.objects)
 
     def save_keyframe(self, *, params: RenderParams) -> None:
-        """Save the current object poses as a keyframe."""
+        """Save the current object poses as a keyframe.
+
+        The base scene is only set up for the first keyframe. Afterwards, the
+        objects of each keyframe are removed again once their poses have been
+        read, which is much cheaper than reloading the scene every time.
+        """
+        first_keyframe = not self._keyframes
+        if first_keyframe:
+            self._setup_scene()
+
+        old_count = len(bpy.data.objects)
+
+        # Import a glTF file. Note that the Blender glTF importer imposes a
+        # +90 degree rotation around the X-axis when loading meshes. Thus, we
+        # counterbalance the rotation in the recorded poses.
+        bpy.ops.import_scene.gltf(filepath=str(params.scene))
+        new_count = len(bpy.data.objects)
+
+        # Reality check that all of the imported objects are selected by default.
+        objects = list(bpy.context.selected_objects)
+        assert new_count - old_count == len(objects)
+
+        # Store the poses of the newly imported objects.
+        frame = pose_frame(objects)
+        _rotate_gltf_roots(frame, [obj.parent is None for obj in objects])
+        self._keyframes.append(frame)
+
+        # Export the first scene.
+        if first_keyframe and self._export_path is not None:
+            self._export_scene()
+
+        # Remove the imported objects, along with their now unused meshes and
+        # materials, so the next import gets the same names.
+        bpy.data.batch_remove(objects)
+        bpy.data.orphans_purge(do_recursive=True)
+
+    def _setup_scene(self) -> None:
+        """Load the base scene and apply the user's custom settings."""
         # Load the blend file to set up the basic scene if provided.
         if self._blend_file is not None:
             bpy.ops.wm.open_mainfile(filepath=str(self._blend_file))
@@ -128,18 +246,8 @@ class Blender:
                 code = compile(f.read(), self._bpy_settings_file, "exec")
                 exec(code, {"bpy": bpy}, dict())
 
-        self._client_objects = bpy.data.collections.new("ClientObjects")
-        old_count = len(bpy.data.objects)
-
-        # Import a glTF file. Note that the Blender glTF importer imposes a
-        # +90 degree rotation around the X-axis when loading meshes. Thus, we
-        # counterbalance the rotation right after the glTF-loading.
-        bpy.ops.import_scene.gltf(filepath=str(params.scene))
-        new_count = len(bpy.data.objects)
-
-        # Reality check that all of the imported objects are selected by default.
-        assert new_count - old_count == len(bpy.context.selected_objects)
-
+    def _export_scene(self) -> None:
+        """Save the imported (still selected) objects as a blend file."""
         # Rotate to compensate for glTF coordinate system difference.
         bpy.ops.transform.rotate(
             value=math.pi / 2,
@@ -148,18 +256,6 @@ class Blender:
             center_override=(0, 0, 0),
         )
 
-        # Store the poses of the newly imported objects.
-        imported_objects = bpy.context.selected_objects
-        frame_data = []
-        for obj in imported_objects:
-            pose_data = {
-                "name": obj.name,
-                "location": list(obj.location),
-                "rotation_quaternion": list(obj.rotation_quaternion),
-            }
-            frame_data.append(pose_data)
-        self._keyframes.append(frame_data)
-
         # Create a new collection for imported objects and move them there.
         drake_objects = bpy.data.collections.new("DrakeObjects")
         bpy.context.scene.collection.children.link(drake_objects)
@@ -170,16 +266,180 @@ class Blender:
             # Link to our collection.
             drake_objects.objects.link(obj)
 
-        # Export the first scene.
-        if self._export_path is not None and len(self._keyframes) == 1:
-            self._export_path.parent.mkdir(parents=True, exist_ok=True)
-            bpy.ops.wm.save_as_mainfile(filepath=str(self._export_path))
+        self._export_path.parent.mkdir(parents=True, exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=str(self._export_path))
+
+    def append_last_keyframe_to_disk(self) -> None:
+        """Append the most recent keyframe to the keyframe stream on disk.
+
+        Only the new frame is written, so the cost per keyframe stays constant
+        instead of growing with the length of the recording. Pickle streams
+        are gzip-compressed at a fast level, as the repeated object names and
+        poses compress well. The stream is flushed after every frame so that
+        all recorded frames stay readable if the server is stopped.
+        """
+        if not self._keyframe_dump_path or not self._keyframes:
+            return
+
+        if self._keyframe_dump_file is None:
+            if self._keyframe_format == "json":
+                self._keyframe_dump_file = open(self._keyframe_dump_path, "wb")
+            else:
+                self._keyframe_dump_file = gzip.GzipFile(
+                    filename=self._keyframe_dump_path, mode="wb", compresslevel=1
+                )
+            self._write_keyframe_record(KEYFRAME_STREAM_HEADER)
+
+        self._write_keyframe_record(self._keyframes[-1])
+        self._keyframe_dump_file.flush()
+
+    def _write_keyframe_record(self, record: dict) -> None:
+        """Write one record to the keyframe stream in the configured format."""
+        if self._keyframe_format == "json":
+            self._keyframe_dump_file.write(_dump_json_line(record))
+        else:
+            pickle.dump(
+                record, self._keyframe_dump_file, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+    def close_keyframe_dump(self) -> None:
+        """Close the keyframe stream, if one was opened."""
+        if self._keyframe_dump_file is not None:
+            self._keyframe_dump_file.close()
+            self._keyframe_dump_file = None
 
     def dump_keyframes_to_disk(self) -> None:
-        """Write accumulated keyframes to disk as a pickle file."""
+        """Write accumulated keyframes to disk.
+
+        Pickle files hold the whole list of frames, JSON files use the same
+        JSON Lines layout as the keyframe stream.
+        """
         if self._keyframe_dump_path:
-            with open(self._keyframe_dump_path, "wb") as f:
-                pickle.dump(self._keyframes, f)
+            # Use a large write buffer to cut down on syscalls for long recordings.
+            with open(self._keyframe_dump_path, "wb", buffering=1 << 20) as f:
+                if self._keyframe_format == "json":
+                    f.write(_dump_json_line(KEYFRAME_STREAM_HEADER))
+                    f.writelines(map(_dump_json_line, self._keyframes))
+                else:
+                    pickle.dump(self._keyframes, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pose_frame(objects: typing.Sequence[typing.Any]) -> dict:
+    """Collect the poses of Blender objects into a keyframe.
+
+    The poses are stored as arrays with one row per object rather than as one
+    dict per object, which keeps frames compact in memory and on disk.
+
+    Args:
+        objects: Blender objects to record.
+
+    Returns:
+        Dict with the object "names" and (N, 3) "location" and (N, 4)
+        "rotation_quaternion" float32 arrays.
+    """
+    locations = np.empty((len(objects), 3), dtype=np.float32)
+    rotations = np.empty((len(objects), 4), dtype=np.float32)
+    for i, obj in enumerate(objects):
+        locations[i] = obj.location
+        rotations[i] = obj.rotation_quaternion
+    return {
+        "names": [obj.name for obj in objects],
+        "location": locations,
+        "rotation_quaternion": rotations,
+    }
+
+
+def _rotate_gltf_roots(frame: dict, roots: typing.Sequence[bool]) -> None:
+    """Rotate root object poses by +90 degrees around the global X-axis.
+
+    This matches rotating the objects with Blender's transform operator, which
+    only moves objects whose parent is not rotated as well.
+
+    Args:
+        frame: Keyframe as returned by `pose_frame`, modified in place.
+        roots: Whether each object of the frame has no parent.
+    """
+    roots = np.asarray(roots, dtype=bool)
+    frame["location"][roots] = frame["location"][roots] @ _RX90.T
+    frame["rotation_quaternion"][roots] = (
+        frame["rotation_quaternion"][roots] @ _QX90_PRODUCT.T
+    )
+
+
+def _dump_json_line(record: dict) -> bytes:
+    """Encode a keyframe stream record as one line of JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(record, default=np.ndarray.tolist) + "\n").encode()
+
+
+def _load_json_keyframes(path: Path) -> list[dict]:
+    """Load the frames of a JSON Lines keyframe file, with pose arrays."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        if loads(f.readline()) != KEYFRAME_STREAM_HEADER:
+            raise ValueError(f"{path} is not a keyframe stream")
+
+        frames = []
+        for line in f:
+            if not line.strip():
+                continue
+            frame = loads(line)
+            for key in ("location", "rotation_quaternion"):
+                frame[key] = np.array(frame[key], dtype=np.float32)
+            frames.append(frame)
+    return frames
+
+
+def load_keyframes(path: Path) -> list[dict | list[dict]]:
+    """Load keyframes written by the recording server.
+
+    Supports the keyframe streams written while recording, in either of the
+    `KEYFRAME_FORMATS`, and a single pickled list of frames as written by
+    `Blender.dump_keyframes_to_disk`.
+
+    Args:
+        path: Path to the keyframe file.
+
+    Returns:
+        List of frames. Frames are dicts of pose arrays as built by
+        `pose_frame`, or lists of per-object pose dicts in files written by
+        older server versions.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(_GZIP_MAGIC))
+    if magic.startswith(b"{"):
+        return _load_json_keyframes(path)
+
+    opener = gzip.open if magic == _GZIP_MAGIC else open
+    with opener(path, "rb") as f:
+        first = pickle.load(f)
+        if first != KEYFRAME_STREAM_HEADER:
+            return first
+
+        frames = []
+        while True:
+            try:
+                frames.append(pickle.load(f))
+            except EOFError:
+                # Also raised for a stream that was flushed but never closed.
+                break
+    return frames
+
+
+@functools.lru_cache(maxsize=32)
+def _fake_png(width: int, height: int) -> bytes:
+    """Encode a black PNG image of the given size.
+
+    The image only depends on its size, so the encoded bytes are cached and
+    reused across requests.
+    """
+    img = Image.new("RGB", (width, height), color="black")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
 
 
 class ServerApp(flask.Flask):
@@ -187,6 +447,10 @@ class ServerApp(flask.Flask):
 
     This server implements Drake's glTF Render Client-Server API but
     instead of rendering an image, it saves the object poses as keyframes.
+
+    Requests may be handled on worker threads, but bpy operators must run on
+    the main thread. Blender work from other threads is therefore queued and
+    carried out by process_blender_jobs(), which the main thread must call.
     """
 
     def __init__(
@@ -197,6 +461,7 @@ class ServerApp(flask.Flask):
         bpy_settings_file: Path | None = None,
         export_path: Path | None = None,
         keyframe_dump_path: Path | None = None,
+        keyframe_format: str = "pickle",
     ):
         super().__init__("drake_blender_recording_server")
 
@@ -206,7 +471,9 @@ class ServerApp(flask.Flask):
             bpy_settings_file=bpy_settings_file,
             export_path=export_path,
             keyframe_dump_path=keyframe_dump_path,
+            keyframe_format=keyframe_format,
         )
+        self._blender_jobs: queue.SimpleQueue = queue.SimpleQueue()
 
         self.add_url_rule("/", view_func=self._root_endpoint)
         self.add_url_rule(
@@ -216,6 +483,42 @@ class ServerApp(flask.Flask):
             view_func=self._render_endpoint,
         )
 
+    def close(self) -> None:
+        """Finish writing the recorded keyframes."""
+        self._blender.close_keyframe_dump()
+
+    def process_blender_jobs(self, timeout: float | None = None) -> None:
+        """Run the Blender work queued by request threads.
+
+        Must be called from the main thread.
+
+        Args:
+            timeout: Seconds to wait for the first job, or None to block.
+        """
+        try:
+            job = self._blender_jobs.get(timeout=timeout)
+        except queue.Empty:
+            return
+        while True:
+            future, func, args = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            try:
+                job = self._blender_jobs.get_nowait()
+            except queue.Empty:
+                return
+
+    def _call_blender(self, func: typing.Callable, *args) -> typing.Any:
+        """Call func on the main thread, waiting for its result."""
+        if threading.current_thread() is threading.main_thread():
+            return func(*args)
+        future = concurrent.futures.Future()
+        self._blender_jobs.put((future, func, args))
+        return future.result()
+
     def _root_endpoint(self) -> str:
         """Display a banner page at the server root."""
         return """\
@@ -233,13 +536,10 @@ class ServerApp(flask.Flask):
             params = self._parse_params(flask.request)
             self._save_keyframe(params)
 
-            # Create the fake image.
-            img = Image.new("RGB", (params.width, params.height), color="black")
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            buffer.seek(0)
-
-            return flask.send_file(buffer, mimetype="image/png")
+            # Return a fake image. Drake checks its size, so it must match.
+            return flask.Response(
+                _fake_png(params.width, params.height), mimetype="image/png"
+            )
         except Exception as e:
             code = 500
             message = f"Internal server error: {repr(e)}"
@@ -256,50 +556,37 @@ class ServerApp(flask.Flask):
         """Convert an HTTP request to a RenderParams."""
         result = dict()
 
-        # Compute a lookup table for known form field names.
-        param_fields = {x.name: x for x in dc.fields(RenderParams)}
-        del param_fields["scene"]
-
         # Copy all of the form data into the result.
         for name, value in request.form.items():
             if name == "submit":
                 # Ignore the HTML boilerplate.
                 continue
-            field = param_fields[name]
-            type_origin = typing.get_origin(field.type)
-            type_args = typing.get_args(field.type)
-            if field.type in (int, float, str):
-                result[name] = field.type(value)
-            elif type_origin == typing.Literal:
-                if value not in type_args:
-                    raise ValueError(f"Invalid literal for {name}")
-                result[name] = value
-            elif type_origin == typing.Union:
-                # Handle typing.Optional (Union[T, None]).
-                assert len(type_args) == 2
-                assert type_args[1] == NoneType
-                result[name] = type_args[0](value)
-            else:
-                raise NotImplementedError(name)
+            result[name] = _PARAM_CONVERTERS[name](value)
 
         # Save the glTF scene data.
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
-        scene = Path(f"{self._temp_dir}/{timestamp}.gltf")
+        # Include the thread id, as concurrent requests may share a timestamp.
+        scene = Path(f"{self._temp_dir}/{timestamp}_{threading.get_ident()}.gltf")
         assert len(request.files) == 1
-        request.files["scene"].save(scene)
+        # Copy in large chunks; FileStorage.save() uses a small buffer.
+        with open(scene, "wb") as f:
+            shutil.copyfileobj(request.files["scene"].stream, f, length=1 << 20)
         result["scene"] = scene
 
         return RenderParams(**result)
 
     def _save_keyframe(self, params: RenderParams) -> None:
         """Save the current object poses as a keyframe and dump to disk."""
-        self._blender.save_keyframe(params=params)
-        print(f"Saved keyframe {len(self._blender._keyframes)}")
+        self._call_blender(self._save_keyframe_on_main_thread, params)
 
         # Clean up the temporary glTF file.
         params.scene.unlink(missing_ok=True)
 
-        self._blender.dump_keyframes_to_disk()
+    def _save_keyframe_on_main_thread(self, params: RenderParams) -> None:
+        """Save a keyframe with bpy; see _save_keyframe()."""
+        self._blender.save_keyframe(params=params)
+        print(f"Saved keyframe {len(self._blender._keyframes)}")
+        self._blender.append_last_keyframe_to_disk()
 
 
 def run_server(
@@ -310,15 +597,35 @@ def run_server(
     bpy_settings_file: Path | None = None,
     export_path: Path,
     keyframe_dump_path: Path,
+    keyframe_format: str = "pickle",
 ) -> None:
     """Run the recording server."""
     prefix = "drake_blender_recorder_"
-    with tempfile.TemporaryDirectory(prefix=prefix) as temp_dir:
+    # Keep the uploaded scenes in memory-backed storage when available, as
+    # each one is only read once by the glTF importer.
+    temp_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(prefix=prefix, dir=temp_root) as temp_dir:
         app = ServerApp(
             temp_dir=temp_dir,
             blend_file=blend_file,
             bpy_settings_file=bpy_settings_file,
             export_path=export_path,
             keyframe_dump_path=keyframe_dump_path,
+            keyframe_format=keyframe_format,
         )
-        app.run(host=host, port=port, threaded=False)
+        # Serve requests on worker threads, so that receiving uploads and
+        # sending images overlaps with Blender work, while the main thread
+        # runs all of the bpy calls.
+        server = werkzeug.serving.make_server(host, port, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        print(f"Serving on http://{host}:{port}")
+        try:
+            while True:
+                app.process_blender_jobs(timeout=0.1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            thread.join()
+            app.close()
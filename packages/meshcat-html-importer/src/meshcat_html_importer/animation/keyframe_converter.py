@@ -3,34 +3,78 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from meshcat_html_importer.scene.scene_graph import AnimationKeyframe, SceneNode
+    from meshcat_html_importer.scene.scene_graph import KeyframeTrack, SceneNode
+
+
+# Blender F-curve channels written for each keyframe property
+FCURVE_DATA_PATHS = ("location", "rotation_quaternion", "scale")
 
 
-@dataclass
-class BlenderKeyframe:
-    """A keyframe in Blender format."""
+@dataclass(eq=False)
+class BlenderKeyframes:
+    """Keyframes in Blender format, stored as parallel arrays.
 
-    frame: int
-    location: tuple[float, float, float] | None = None
-    rotation_quaternion: tuple[float, float, float, float] | None = None  # (w,x,y,z)
-    scale: tuple[float, float, float] | None = None
+    Each channel is an (N, width) array aligned with ``frames``. Rows where a
+    channel has no value are NaN; channels without any keyframes are None.
+    """
+
+    frames: np.ndarray  # (N,)
+    location: np.ndarray | None = None  # (N, 3)
+    rotation_quaternion: np.ndarray | None = None  # (N, 4) quaternion (w,x,y,z)
+    scale: np.ndarray | None = None  # (N, 3)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def fcurve_points(self) -> Iterator[tuple[str, int, np.ndarray]]:
+        """Yield the keyframe points of every F-curve.
+
+        Yields:
+            Tuples of (data_path, array_index, co), where co is a flat float32
+            array of interleaved (frame, value) pairs sorted by frame, ready
+            for ``keyframe_points.foreach_set("co", co)``. When several
+            keyframes land on the same frame, the last one wins.
+        """
+        for data_path in FCURVE_DATA_PATHS:
+            values = getattr(self, data_path)
+            if values is None:
+                continue
+
+            for index in range(values.shape[1]):
+                column = values[:, index]
+                valid = ~np.isnan(column)
+                frames = self.frames[valid][::-1]
+                column = column[valid][::-1]
+
+                frames, last = np.unique(frames, return_index=True)
+                co = np.empty(2 * len(frames), dtype=np.float32)
+                co[0::2] = frames
+                co[1::2] = column[last]
+                yield data_path, index, co
 
 
 def convert_quaternion_to_blender(
-    quat: tuple[float, float, float, float],
-) -> tuple[float, float, float, float]:
+    quat: tuple[float, float, float, float] | np.ndarray,
+) -> tuple[float, float, float, float] | np.ndarray:
     """Convert quaternion from Three.js (x,y,z,w) to Blender (w,x,y,z).
 
     Args:
-        quat: Quaternion in Three.js format (x, y, z, w)
+        quat: Quaternion in Three.js format (x, y, z, w), or an (N, 4)
+              array of them
 
     Returns:
-        Quaternion in Blender format (w, x, y, z)
+        Quaternion in Blender format (w, x, y, z), or an (N, 4) array
+        when given an array
     """
+    if isinstance(quat, np.ndarray):
+        return quat[..., [3, 0, 1, 2]]
     x, y, z, w = quat
     return (w, x, y, z)
 
@@ -52,21 +96,22 @@ def time_to_frame(
     Returns:
         Frame number at target FPS
     """
-    # Convert recording frame to seconds, then to target frame
-    time_seconds = time_value / recording_fps
-    return start_frame + int(round(time_seconds * target_fps))
+    # Scale recording frame to target frame
+    return start_frame + int(round(time_value * (target_fps / recording_fps)))
 
 
 def downsample_keyframes(
-    keyframes: list[AnimationKeyframe],
+    keyframes: KeyframeTrack,
     recording_fps: float,
     target_fps: float,
-) -> list[AnimationKeyframe]:
+) -> KeyframeTrack:
     """Downsample keyframes from recording FPS to target FPS.
 
     Uses linear interpolation between keyframes to match Three.js behavior.
     Position and scale are linearly interpolated; rotation uses normalized
-    linear interpolation (nlerp).
+    linear interpolation (nlerp). Each channel is interpolated between its
+    own keyframes, so a channel that is keyed less often than the others is
+    still sampled on every target frame.
 
     Args:
         keyframes: Original keyframes at recording_fps
@@ -74,152 +119,165 @@ def downsample_keyframes(
         target_fps: Target FPS for output
 
     Returns:
-        Downsampled list of keyframes
+        Downsampled keyframes, with times in target frames
     """
     if not keyframes or target_fps >= recording_fps:
         return keyframes
 
+    from meshcat_html_importer.scene.scene_graph import KeyframeTrack
+
     # Sort by time
-    sorted_kfs = sorted(keyframes, key=lambda kf: kf.time)
+    order = np.argsort(keyframes.times, kind="stable")
+    times = keyframes.times[order]
 
-    if len(sorted_kfs) < 2:
-        return sorted_kfs
+    if len(times) < 2:
+        return keyframes
 
     # Use absolute time (from 0) so all nodes share the same time base.
     # This prevents time-shifting when a node's keyframes start later than t=0.
-    min_time = 0.0
-    max_time = sorted_kfs[-1].time
+    max_time = times[-1]
     duration_seconds = max_time / recording_fps
 
     # Calculate target frame count
     target_frame_count = int(duration_seconds * target_fps) + 1
+    target_frames = np.arange(target_frame_count, dtype=np.float64)
+    target_times = target_frames / target_fps * recording_fps
+
+    # Keyframes that already sit on the target frame grid need no interpolation
+    on_grid = len(times) == target_frame_count and np.array_equal(times, target_times)
+
+    # Channels without missing rows share the same bracketing keyframes, so
+    # the search is done once per node rather than once per channel
+    shared_bracket = None
+
+    def sample(values: np.ndarray | None, quaternion: bool = False):
+        nonlocal shared_bracket
+        if values is None:
+            return None
+        values = values[order]
+        if np.isnan(values).any():
+            return _sample_channel(times, values, target_times, quaternion)
+        if on_grid:
+            return values
+        if shared_bracket is None:
+            shared_bracket = _bracket_times(times, target_times)
+        return _interpolate(values, *shared_bracket, quaternion=quaternion)
+
+    return KeyframeTrack(
+        times=target_frames,
+        positions=sample(keyframes.positions),
+        rotations=sample(keyframes.rotations, quaternion=True),
+        scales=sample(keyframes.scales),
+    )
 
-    # Build list of times for binary search
-    all_times = [kf.time for kf in sorted_kfs]
-
-    import bisect
-
-    from meshcat_html_importer.scene.scene_graph import AnimationKeyframe
-
-    result = []
-    for target_frame in range(target_frame_count):
-        target_time_seconds = target_frame / target_fps
-        target_recording_time = min_time + target_time_seconds * recording_fps
-
-        # Find bracketing keyframes using binary search
-        idx = bisect.bisect_right(all_times, target_recording_time)
-
-        if idx == 0:
-            # Before first keyframe - use first
-            kf = sorted_kfs[0]
-            result.append(
-                AnimationKeyframe(
-                    time=float(target_frame),
-                    position=kf.position,
-                    rotation=kf.rotation,
-                    scale=kf.scale,
-                )
-            )
-        elif idx >= len(sorted_kfs):
-            # After last keyframe - use last
-            kf = sorted_kfs[-1]
-            result.append(
-                AnimationKeyframe(
-                    time=float(target_frame),
-                    position=kf.position,
-                    rotation=kf.rotation,
-                    scale=kf.scale,
-                )
-            )
-        else:
-            # Interpolate between kf_a and kf_b
-            kf_a = sorted_kfs[idx - 1]
-            kf_b = sorted_kfs[idx]
-            dt = kf_b.time - kf_a.time
-            t = (target_recording_time - kf_a.time) / dt if dt > 0 else 0.0
-
-            pos = _lerp_tuple3(kf_a.position, kf_b.position, t)
-            rot = _nlerp_quat(kf_a.rotation, kf_b.rotation, t)
-            sc = _lerp_tuple3(kf_a.scale, kf_b.scale, t)
-
-            result.append(
-                AnimationKeyframe(
-                    time=float(target_frame),
-                    position=pos,
-                    rotation=rot,
-                    scale=sc,
-                )
-            )
 
-    return result
+def _sample_channel(
+    times: np.ndarray,
+    values: np.ndarray,
+    target_times: np.ndarray,
+    quaternion: bool = False,
+) -> np.ndarray | None:
+    """Sample one keyframe channel at the given times.
 
+    Times before the first or after the last keyframe are clamped to the
+    first or last value.
+
+    Args:
+        times: Sorted keyframe times, shape (N,)
+        values: Channel values, shape (N, width), NaN rows for missing values
+        target_times: Times to sample at, shape (M,)
+        quaternion: Whether values are (x,y,z,w) quaternions, which are
+                   interpolated with nlerp along the shortest path
 
-def _lerp_tuple3(
-    a: tuple[float, float, float] | None,
-    b: tuple[float, float, float] | None,
-    t: float,
-) -> tuple[float, float, float] | None:
-    """Linearly interpolate between two 3-tuples."""
-    if a is None and b is None:
+    Returns:
+        Sampled values of shape (M, width), or None if the channel is empty
+    """
+    valid = ~np.isnan(values).any(axis=1)
+    if not valid.all():
+        times = times[valid]
+        values = values[valid]
+    if len(times) == 0:
         return None
-    if a is None:
-        return b
-    if b is None:
-        return a
-    return (
-        a[0] + (b[0] - a[0]) * t,
-        a[1] + (b[1] - a[1]) * t,
-        a[2] + (b[2] - a[2]) * t,
-    )
 
+    return _interpolate(values, *_bracket_times(times, target_times), quaternion)
 
-def _nlerp_quat(
-    a: tuple[float, float, float, float] | None,
-    b: tuple[float, float, float, float] | None,
-    t: float,
-) -> tuple[float, float, float, float] | None:
-    """Normalized linear interpolation for quaternions (x,y,z,w)."""
-    if a is None and b is None:
-        return None
-    if a is None:
-        return b
-    if b is None:
-        return a
-    import math
-
-    # Ensure shortest path (flip b if dot product is negative)
-    dot = a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
-    if dot < 0:
-        b = (-b[0], -b[1], -b[2], -b[3])
-
-    # Lerp
-    x = a[0] + (b[0] - a[0]) * t
-    y = a[1] + (b[1] - a[1]) * t
-    z = a[2] + (b[2] - a[2]) * t
-    w = a[3] + (b[3] - a[3]) * t
-
-    # Normalize
-    length = math.sqrt(x * x + y * y + z * z + w * w)
-    if length > 0:
-        x /= length
-        y /= length
-        z /= length
-        w /= length
-
-    return (x, y, z, w)
+
+def _bracket_times(
+    times: np.ndarray, target_times: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the keyframes around each target time, for _interpolate.
+
+    Args:
+        times: Sorted keyframe times, shape (N,), N > 0
+        target_times: Times to sample at, shape (M,)
+
+    Returns:
+        Tuple of (lo, hi, t): indices of the keyframes before and after each
+        target time, and the (M, 1) interpolation factor between them
+    """
+    # Find bracketing keyframes using binary search
+    idx = np.searchsorted(times, target_times, side="right")
+    lo = np.clip(idx - 1, 0, len(times) - 1)
+    hi = np.clip(idx, 0, len(times) - 1)
+
+    dt = times[hi] - times[lo]
+    t = np.divide(
+        target_times - times[lo],
+        dt,
+        out=np.zeros_like(target_times),
+        where=dt > 0,
+    )[:, np.newaxis]
+    return lo, hi, t
+
+
+def _interpolate(
+    values: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    t: np.ndarray,
+    quaternion: bool = False,
+) -> np.ndarray:
+    """Interpolate channel values between bracketing keyframes.
+
+    Args:
+        values: Channel values, shape (N, width), without missing rows
+        lo: Index of the keyframe before each target time, shape (M,)
+        hi: Index of the keyframe after each target time, shape (M,)
+        t: Interpolation factor between them, shape (M, 1)
+        quaternion: Whether values are (x,y,z,w) quaternions, which are
+                   interpolated with nlerp along the shortest path
+
+    Returns:
+        Interpolated values of shape (M, width)
+    """
+    a = values[lo].astype(np.float64)
+    b = values[hi].astype(np.float64)
+
+    if quaternion:
+        # Ensure shortest path (flip b if dot product is negative)
+        dot = np.einsum("ij,ij->i", a, b)
+        b[dot < 0] *= -1.0
+
+    result = a + (b - a) * t
+
+    if quaternion:
+        length = np.linalg.norm(result, axis=1, keepdims=True)
+        np.divide(result, length, out=result, where=length > 0)
+
+    return result
 
 
 def convert_keyframes_to_blender(
-    keyframes: list[AnimationKeyframe],
+    keyframes: KeyframeTrack,
     recording_fps: float = 1000.0,
     target_fps: float = 30.0,
     start_frame: int = 0,
     downsample: bool = True,
-) -> list[BlenderKeyframe]:
+) -> BlenderKeyframes:
     """Convert meshcat keyframes to Blender format.
 
     Args:
-        keyframes: List of AnimationKeyframe from scene node
+        keyframes: KeyframeTrack from scene node
         recording_fps: FPS of the original recording
                       (default 1000 for Drake simulations)
         target_fps: Target FPS for Blender animation
@@ -227,40 +285,32 @@ def convert_keyframes_to_blender(
         downsample: Whether to downsample to target FPS
 
     Returns:
-        List of BlenderKeyframe objects
+        BlenderKeyframes with one row per keyframe
     """
     if not keyframes:
-        return []
+        return BlenderKeyframes(frames=np.empty(0, dtype=np.int64))
 
     # Downsample if requested
     if downsample:
         processed_kfs = downsample_keyframes(keyframes, recording_fps, target_fps)
+        # After downsampling, time is already in target frames
+        frames = start_frame + np.rint(processed_kfs.times)
     else:
         processed_kfs = keyframes
-
-    blender_keyframes = []
-
-    for kf in processed_kfs:
-        # After downsampling, time is already in target frames
-        if downsample:
-            frame = start_frame + int(round(kf.time))
-        else:
-            frame = time_to_frame(kf.time, recording_fps, target_fps, start_frame)
-
-        # Convert quaternion format
-        rotation = None
-        if kf.rotation is not None:
-            rotation = convert_quaternion_to_blender(kf.rotation)
-
-        blender_kf = BlenderKeyframe(
-            frame=frame,
-            location=kf.position,
-            rotation_quaternion=rotation,
-            scale=kf.scale,
-        )
-        blender_keyframes.append(blender_kf)
-
-    return blender_keyframes
+        ratio = target_fps / recording_fps
+        frames = start_frame + np.rint(processed_kfs.times * ratio)
+
+    # Convert quaternion format from (x,y,z,w) to (w,x,y,z)
+    rotations = processed_kfs.rotations
+    if rotations is not None:
+        rotations = convert_quaternion_to_blender(rotations)
+
+    return BlenderKeyframes(
+        frames=frames.astype(np.int64),
+        location=processed_kfs.positions,
+        rotation_quaternion=rotations,
+        scale=processed_kfs.scales,
+    )
 
 
 def get_animation_range(
@@ -281,14 +331,13 @@ def get_animation_range(
         Tuple of (start_frame, end_frame)
     """
     min_frame = start_frame
-    max_time = 0
-
-    for node in nodes:
-        for kf in node.keyframes:
-            max_time = max(max_time, kf.time)
+    max_time = max(
+        (float(node.keyframes.times.max()) for node in nodes if node.keyframes),
+        default=0,
+    )
 
     # Convert max time to target frame
-    duration_seconds = max_time / recording_fps
-    max_frame = start_frame + int(round(duration_seconds * target_fps))
+    ratio = target_fps / recording_fps
+    max_frame = start_frame + int(round(max_time * ratio))
 
     return (min_frame, max_frame)
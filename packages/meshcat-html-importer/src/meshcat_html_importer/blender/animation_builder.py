@@ -9,10 +9,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import bpy
+import numpy as np
 
 from meshcat_html_importer.animation.keyframe_converter import (
-    BlenderKeyframe,
+    BlenderKeyframes,
     convert_keyframes_to_blender,
+    convert_quaternion_to_blender,
     get_animation_range,
 )
 
@@ -31,6 +33,7 @@ def apply_animation(
     local_offset: tuple[tuple[float, float, float], tuple[float, float, float, float]]
     | None = None,
     import_matrix: "mathutils.Matrix | None" = None,
+    blender_keyframes: BlenderKeyframes | None = None,
 ) -> None:
     """Apply animation keyframes to a Blender object.
 
@@ -47,18 +50,22 @@ def apply_animation(
         import_matrix: Optional coordinate conversion matrix from glTF importer.
                       When provided, each keyframe transform is combined with this
                       matrix to preserve correct mesh orientation.
+        blender_keyframes: Optional keyframes of node already converted with
+                          convert_keyframes_to_blender(), so objects sharing an
+                          animation source only resample it once
     """
     if not node.keyframes:
         return
 
     # Convert keyframes to Blender format with downsampling
-    blender_keyframes = convert_keyframes_to_blender(
-        node.keyframes,
-        recording_fps=recording_fps,
-        target_fps=target_fps,
-        start_frame=start_frame,
-        downsample=True,
-    )
+    if blender_keyframes is None:
+        blender_keyframes = convert_keyframes_to_blender(
+            node.keyframes,
+            recording_fps=recording_fps,
+            target_fps=target_fps,
+            start_frame=start_frame,
+            downsample=True,
+        )
 
     if not blender_keyframes:
         return
@@ -98,83 +105,62 @@ def apply_animation(
     obj.rotation_mode = "QUATERNION"
 
     # Insert keyframes
-    for kf in blender_keyframes:
-        _insert_keyframe(obj, kf)
+    _insert_keyframes(obj, action, blender_keyframes)
 
 
 def _apply_local_offset_to_keyframes(
-    keyframes: list[BlenderKeyframe],
+    keyframes: BlenderKeyframes,
     local_offset: tuple[tuple[float, float, float], tuple[float, float, float, float]],
-) -> list[BlenderKeyframe]:
+) -> BlenderKeyframes:
     """Apply local offset to keyframes for inherited animations.
 
     When animation is inherited from a parent node, we need to transform
     the parent's keyframes by the child's local offset.
 
     Args:
-        keyframes: List of BlenderKeyframe
+        keyframes: BlenderKeyframes of the parent node
         local_offset: (position_offset, rotation_offset) in (x,y,z), (x,y,z,w) format
 
     Returns:
-        New list of keyframes with offset applied
+        New keyframes with offset applied
     """
-    from meshcat_html_importer.animation.keyframe_converter import (
-        convert_quaternion_to_blender,
-    )
     from meshcat_html_importer.scene.transforms import (
         Transform,
-        combine_transforms,
+        matrices_to_trs,
+        trs_to_matrices,
     )
 
     pos_offset, rot_offset = local_offset
-    offset_transform = Transform(
+    offset_matrix = Transform(
         translation=pos_offset,
         rotation=rot_offset,
         scale=(1.0, 1.0, 1.0),
+    ).to_matrix()
+
+    # Build parent transforms from keyframes.
+    # Note: Blender keyframes have rotation in (w,x,y,z),
+    # need to convert to (x,y,z,w)
+    parent_pos, parent_rot, parent_scale = _keyframe_trs(keyframes)
+    parent_matrices = trs_to_matrices(
+        parent_pos, parent_rot[:, [1, 2, 3, 0]], parent_scale
     )
 
-    result = []
-    for kf in keyframes:
-        # Build parent transform from keyframe
-        # Note: Blender keyframes have rotation in (w,x,y,z),
-        # need to convert to (x,y,z,w)
-        parent_pos = kf.location or (0.0, 0.0, 0.0)
-        if kf.rotation_quaternion:
-            # Blender format is (w,x,y,z), convert to internal (x,y,z,w)
-            w, x, y, z = kf.rotation_quaternion
-            parent_rot = (x, y, z, w)
-        else:
-            parent_rot = (0.0, 0.0, 0.0, 1.0)
-        parent_scale = kf.scale or (1.0, 1.0, 1.0)
-
-        parent_transform = Transform(
-            translation=parent_pos,
-            rotation=parent_rot,
-            scale=parent_scale,
-        )
-
-        # Combine: child_world = parent * local_offset
-        combined = combine_transforms(parent_transform, offset_transform)
-
-        # Convert rotation back to Blender format (w,x,y,z)
-        new_rot = convert_quaternion_to_blender(combined.rotation)
+    # Combine: child_world = parent * local_offset
+    translations, rotations, scales = matrices_to_trs(parent_matrices @ offset_matrix)
 
-        result.append(
-            BlenderKeyframe(
-                frame=kf.frame,
-                location=combined.translation,
-                rotation_quaternion=new_rot,
-                scale=combined.scale if kf.scale else None,
-            )
-        )
-
-    return result
+    # Convert rotation back to Blender format (w,x,y,z)
+    return BlenderKeyframes(
+        frames=keyframes.frames,
+        location=translations,
+        rotation_quaternion=convert_quaternion_to_blender(rotations),
+        scale=_mask_missing_scale(scales, keyframes.scale),
+    )
 
 
 def _apply_import_matrix_to_keyframes(
-    keyframes: list[BlenderKeyframe],
+    keyframes: BlenderKeyframes,
     import_matrix: "mathutils.Matrix",
-) -> list[BlenderKeyframe]:
+) -> BlenderKeyframes:
     """Apply glTF import coordinate conversion to keyframes.
 
     For glTF objects, the importer applies a coordinate conversion rotation
@@ -184,69 +170,122 @@ def _apply_import_matrix_to_keyframes(
     The final transform is: meshcat_keyframe_matrix @ import_matrix
 
     Args:
-        keyframes: List of BlenderKeyframe (already in Blender convention)
+        keyframes: BlenderKeyframes (already in Blender convention)
         import_matrix: Coordinate conversion matrix from glTF importer
 
     Returns:
-        New list of keyframes with import matrix applied
+        New keyframes with import matrix applied
     """
-    import mathutils
+    from meshcat_html_importer.scene.transforms import (
+        matrices_to_trs,
+        trs_to_matrices,
+    )
 
-    result = []
-    for kf in keyframes:
-        loc = kf.location or (0.0, 0.0, 0.0)
-        scale = kf.scale or (1.0, 1.0, 1.0)
-
-        if kf.rotation_quaternion:
-            quat = mathutils.Quaternion(kf.rotation_quaternion)
-        else:
-            quat = mathutils.Quaternion()  # identity
-
-        # Build meshcat keyframe matrix
-        meshcat_matrix = mathutils.Matrix.LocRotScale(
-            mathutils.Vector(loc),
-            quat,
-            mathutils.Vector(scale),
-        )
+    # Build meshcat keyframe matrices
+    loc, quat, scale = _keyframe_trs(keyframes)
+    meshcat_matrices = trs_to_matrices(loc, quat[:, [1, 2, 3, 0]], scale)
 
-        # Combine: meshcat positioning × import coordinate conversion
-        combined = meshcat_matrix @ import_matrix
+    # Combine: meshcat positioning × import coordinate conversion
+    combined = meshcat_matrices @ np.array(import_matrix, dtype=np.float64)
 
-        # Decompose back to loc, rot, scale
-        new_loc, new_rot, new_scale = combined.decompose()
+    # Decompose back to loc, rot, scale
+    new_loc, new_rot, new_scale = matrices_to_trs(combined)
 
-        result.append(
-            BlenderKeyframe(
-                frame=kf.frame,
-                location=tuple(new_loc),
-                rotation_quaternion=(new_rot.w, new_rot.x, new_rot.y, new_rot.z),
-                scale=tuple(new_scale) if kf.scale else None,
-            )
+    # Keep w non-negative, matching mathutils' Matrix.decompose()
+    new_rot[new_rot[:, 3] < 0] *= -1.0
+
+    return BlenderKeyframes(
+        frames=keyframes.frames,
+        location=new_loc,
+        rotation_quaternion=convert_quaternion_to_blender(new_rot),
+        scale=_mask_missing_scale(new_scale, keyframes.scale),
+    )
+
+
+def _keyframe_trs(
+    keyframes: BlenderKeyframes,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get keyframe location, rotation (w,x,y,z) and scale with defaults filled.
+
+    Missing values are replaced by the identity transform components.
+    """
+    count = len(keyframes)
+    channels = []
+    for values, default in (
+        (keyframes.location, (0.0, 0.0, 0.0)),
+        (keyframes.rotation_quaternion, (1.0, 0.0, 0.0, 0.0)),
+        (keyframes.scale, (1.0, 1.0, 1.0)),
+    ):
+        filled = np.tile(np.array(default, dtype=np.float64), (count, 1))
+        if values is not None:
+            present = ~np.isnan(values).any(axis=1)
+            filled[present] = values[present]
+        channels.append(filled)
+    return channels[0], channels[1], channels[2]
+
+
+def _mask_missing_scale(
+    scales: np.ndarray, original: np.ndarray | None
+) -> np.ndarray | None:
+    """Only keep scale keyframes where the original keyframes had a scale."""
+    if original is None:
+        return None
+    scales[np.isnan(original).any(axis=1)] = np.nan
+    return scales
+
+
+def _ensure_fcurve(
+    action: bpy.types.Action,
+    obj: bpy.types.Object,
+    data_path: str,
+    index: int,
+) -> bpy.types.FCurve:
+    """Get or create the F-curve animating obj's data_path[index] in action."""
+    try:
+        # Blender 4.4+ API, uses the slot assigned to the object
+        return action.fcurve_ensure_for_datablock(
+            obj, data_path, index=index, group_name="Object Transforms"
         )
+    except AttributeError:
+        # Fallback for older Blender versions
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is None:
+            fcurve = action.fcurves.new(
+                data_path, index=index, action_group="Object Transforms"
+            )
+        return fcurve
 
-    return result
 
+def _insert_keyframes(
+    obj: bpy.types.Object,
+    action: bpy.types.Action,
+    keyframes: BlenderKeyframes,
+) -> None:
+    """Insert keyframes into the object's F-curves in bulk.
 
-def _insert_keyframe(obj: bpy.types.Object, kf: BlenderKeyframe) -> None:
-    """Insert a single keyframe.
+    Each F-curve is filled with a single keyframe_points.add() and
+    foreach_set() call, with linear interpolation between keyframes.
 
     Args:
         obj: Blender object
-        kf: BlenderKeyframe with transform data
+        action: Action assigned to the object
+        keyframes: BlenderKeyframes with transform data
     """
-    frame = kf.frame
-
-    if kf.location is not None:
-        obj.location = kf.location
-        obj.keyframe_insert(data_path="location", frame=frame)
+    linear = (
+        bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
+    )
 
-    if kf.rotation_quaternion is not None:
-        obj.rotation_quaternion = kf.rotation_quaternion
-        obj.keyframe_insert(data_path="rotation_quaternion", frame=frame)
+    for data_path, index, co in keyframes.fcurve_points():
+        count = len(co) // 2
+        if count == 0:
+            continue
 
-    if kf.scale is not None:
-        obj.scale = kf.scale
-        obj.keyframe_insert(data_path="scale", frame=frame)
+        fcurve = _ensure_fcurve(action, obj, data_path, index)
+        points = fcurve.keyframe_points
+        points.add(count)
+        points.foreach_set("co", co)
+        points.foreach_set("interpolation", np.full(count, linear, dtype=np.int32))
+        fcurve.update()
 
 
 def apply_animation_batch(
@@ -360,7 +399,6 @@ def create_shared_action(
             node.keyframes, fps, start_frame
         )
 
-        for kf in blender_keyframes:
-            _insert_keyframe(obj, kf)
+        _insert_keyframes(obj, obj.animation_data.action, blender_keyframes)
 
     return action
@@ -158,6 +158,9 @@ def apply_material_to_object(
 ) -> None:
     """Apply a material to an object.
 
+    When the object's mesh is shared with other objects, the material is
+    linked to the object's material slots so the other objects keep theirs.
+
     Args:
         obj: Blender object
         material: Blender material
@@ -165,6 +168,14 @@ def apply_material_to_object(
     if obj.data is None:
         return
 
+    if obj.data.users > 1:
+        if not obj.material_slots:
+            obj.data.materials.append(None)
+        for slot in obj.material_slots:
+            slot.link = "OBJECT"
+            slot.material = material
+        return
+
     # Clear existing materials
     obj.data.materials.clear()
 
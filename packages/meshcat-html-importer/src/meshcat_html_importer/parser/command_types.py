@@ -20,6 +20,10 @@ class CommandType(Enum):
     SET_RENDER_CALLBACK = "set_render_callback"
 
 
+# Map string type to enum, built once rather than on every Command.from_dict
+_COMMAND_TYPES: dict[str, CommandType] = {t.value: t for t in CommandType}
+
+
 @dataclass
 class Command:
     """A parsed meshcat command."""
@@ -33,18 +37,7 @@ class Command:
         """Create a Command from a decoded msgpack dictionary."""
         cmd_type_str = d.get("type", "")
 
-        # Map string type to enum
-        type_map = {
-            "set_object": CommandType.SET_OBJECT,
-            "set_transform": CommandType.SET_TRANSFORM,
-            "delete": CommandType.DELETE,
-            "set_property": CommandType.SET_PROPERTY,
-            "set_animation": CommandType.SET_ANIMATION,
-            "capture_image": CommandType.CAPTURE_IMAGE,
-            "set_render_callback": CommandType.SET_RENDER_CALLBACK,
-        }
-
-        cmd_type = type_map.get(cmd_type_str)
+        cmd_type = _COMMAND_TYPES.get(cmd_type_str)
         if cmd_type is None:
             raise ValueError(f"Unknown command type: {cmd_type_str}")
 
@@ -55,6 +48,26 @@ class Command:
         )
 
 
+def get_animation_fps(data: dict[str, Any]) -> float | None:
+    """Get the playback FPS of a set_animation command.
+
+    Args:
+        data: The set_animation command data
+
+    Returns:
+        The FPS, or None if the command does not specify one
+    """
+    # Check options first: Drake uses "fps", meshcat.js uses "play_fps"
+    options = data.get("options", {})
+    fps = options.get("fps") or options.get("play_fps")
+    # Fall back to the clip-level fps from the first animation
+    if not fps:
+        animations = data.get("animations", [])
+        if animations:
+            fps = animations[0].get("clip", {}).get("fps")
+    return float(fps) if fps else None
+
+
 @dataclass
 class GeometryData:
     """Parsed geometry data from a meshcat object."""
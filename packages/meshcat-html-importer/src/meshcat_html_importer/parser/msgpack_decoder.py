@@ -5,11 +5,12 @@ from __future__ import annotations
 
 from typing import Any
 
-# Try vendored msgpack first (for Blender addon), then system package
+# Prefer the system msgpack package (C-accelerated), falling back to the
+# vendored pure-Python unpacker (for the Blender addon)
 try:
-    from meshcat_html_importer.vendor import msgpack
+    import msgpack
 except ImportError:
-    import msgpack  # type: ignore
+    from meshcat_html_importer.vendor import msgpack  # type: ignore
 
 import numpy as np
 
@@ -43,22 +44,50 @@ def ext_hook(code: int, data: bytes) -> Any:
 def decode_msgpack(data: bytes) -> Any:
     """Decode msgpack data with support for typed arrays.
 
+    Msgpack arrays are decoded as tuples, which are cheaper to build than
+    lists. Decoded commands are only read, never mutated.
+
     Args:
         data: Raw msgpack bytes
 
     Returns:
-        Decoded Python object (dict, list, etc.)
+        Decoded Python object (dict, tuple, etc.)
     """
-    return msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False)
+    return msgpack.unpackb(
+        data, ext_hook=ext_hook, raw=False, strict_map_key=False, use_list=False
+    )
 
 
 def numpy_to_list(obj: Any) -> Any:
-    """Recursively convert numpy arrays to lists for JSON serialization."""
+    """Convert nested numpy arrays and tuples to lists for JSON serialization.
+
+    Walks dicts and lists with an explicit stack rather than recursion, so
+    deeply nested commands cannot hit the recursion limit. Containers are
+    copied before their arrays are replaced; the input is not modified.
+    """
     if isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, dict):
-        return {k: numpy_to_list(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [numpy_to_list(item) for item in obj]
+    if isinstance(obj, dict):
+        result = dict(obj)
+    elif isinstance(obj, (list, tuple)):
+        result = list(obj)
     else:
         return obj
+
+    stack = [result]
+    while stack:
+        container = stack.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, value in items:
+            if isinstance(value, np.ndarray):
+                container[key] = value.tolist()
+            elif isinstance(value, dict):
+                container[key] = value = dict(value)
+                stack.append(value)
+            elif isinstance(value, (list, tuple)):
+                container[key] = value = list(value)
+                stack.append(value)
+
+    return result
@@ -5,6 +5,7 @@ from meshcat_html_importer.scene.geometry import (
     GeometryType,
     MeshGeometry,
     PrimitiveGeometry,
+    geometry_key,
     parse_geometry,
 )
 from meshcat_html_importer.scene.materials import MaterialType, parse_material
@@ -22,6 +23,7 @@ __all__ = [
     "GeometryType",
     "MeshGeometry",
     "PrimitiveGeometry",
+    "geometry_key",
     "parse_material",
     "MaterialType",
     "parse_transform_matrix",
@@ -3,12 +3,33 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass, field
 from enum import Enum
 from typing import Any
+from urllib.parse import unquote_to_bytes
 
 import numpy as np
 
+# Prefer pybase64 (SIMD-accelerated) when available, falling back to stdlib
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Prefer orjson for parsing embedded glTF JSON when available, falling back to stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# CAS references in glTF JSON, e.g. "uri": "cas-v1/<sha>"
+_CAS_URI_PATTERN = re.compile(r'"uri"\s*:\s*"(cas-v1[/-][^"]*)"')
+
 
 class GeometryType(Enum):
     """Types of geometry supported by meshcat."""
@@ -21,7 +42,7 @@ class GeometryType(Enum):
     MESHFILE = "_meshfile_geometry"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshGeometry:
     """A mesh geometry with vertices, normals, UVs, and indices."""
 
@@ -39,7 +60,7 @@ class MeshGeometry:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimitiveGeometry:
     """A primitive geometry (box, sphere, cylinder, etc.)."""
 
@@ -60,18 +81,61 @@ class PrimitiveGeometry:
     # (uses width, height)
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshFileGeometry:
     """A geometry loaded from an embedded mesh file (glTF, OBJ)."""
 
     format: str  # "gltf" or "obj"
     data: bytes
-    resources: dict[str, bytes] = field(default_factory=dict)
+    resources: dict[str, bytes | memoryview] = field(default_factory=dict)
+
+
+def geometry_key(geometry: MeshGeometry | PrimitiveGeometry | MeshFileGeometry) -> str:
+    """Compute a key identifying a geometry by its content.
+
+    Geometries with the same key produce the same mesh, so scenes that repeat a
+    visual many times can share one mesh between all of its objects.
+
+    Args:
+        geometry: Parsed geometry
+
+    Returns:
+        Short hex digest of the geometry type and content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(type(geometry).__name__.encode())
+
+    if isinstance(geometry, MeshGeometry):
+        for array in (
+            geometry.positions,
+            geometry.normals,
+            geometry.uvs,
+            geometry.indices,
+        ):
+            if array is None:
+                digest.update(b"\0")
+                continue
+            array = np.ascontiguousarray(array)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(array)
+    elif isinstance(geometry, PrimitiveGeometry):
+        digest.update(repr(astuple(geometry)).encode())
+    else:
+        digest.update(geometry.format.lower().encode())
+        digest.update(len(geometry.data).to_bytes(8, "little"))
+        digest.update(geometry.data)
+        for name, data in sorted(geometry.resources.items()):
+            view = memoryview(data).cast("B")
+            digest.update(f"\0{name}\0{len(view)}".encode())
+            digest.update(view)
+
+    return digest.hexdigest()
 
 
 def parse_geometry(
     geom_data: dict[str, Any],
     cas_assets: dict[str, str] | None = None,
+    decoded_assets: dict[str, bytes] | None = None,
 ) -> MeshGeometry | PrimitiveGeometry | MeshFileGeometry | None:
     """Parse geometry data from a meshcat object.
 
@@ -79,35 +143,55 @@ def parse_geometry(
         geom_data: Geometry dictionary from meshcat command
         cas_assets: Dictionary of CAS assets (hash -> data URI) for resolving
             external references in meshfile geometries
+        decoded_assets: Optional cache of decoded CAS assets (hash -> bytes),
+            shared across calls so assets referenced by several meshfiles are
+            only decoded once
 
     Returns:
         Parsed geometry object or None if unsupported
     """
     geom_type = geom_data.get("type", "")
 
-    if geom_type == "BufferGeometry":
-        return _parse_buffer_geometry(geom_data)
-    elif geom_type == "BoxGeometry":
-        return _parse_box_geometry(geom_data)
-    elif geom_type == "BoxBufferGeometry":
-        return _parse_box_geometry(geom_data)
-    elif geom_type == "SphereGeometry":
-        return _parse_sphere_geometry(geom_data)
-    elif geom_type == "SphereBufferGeometry":
-        return _parse_sphere_geometry(geom_data)
-    elif geom_type == "CylinderGeometry":
-        return _parse_cylinder_geometry(geom_data)
-    elif geom_type == "CylinderBufferGeometry":
-        return _parse_cylinder_geometry(geom_data)
-    elif geom_type == "PlaneGeometry":
-        return _parse_plane_geometry(geom_data)
-    elif geom_type == "PlaneBufferGeometry":
-        return _parse_plane_geometry(geom_data)
-    elif geom_type == "_meshfile_geometry":
-        return _parse_meshfile_geometry(geom_data, cas_assets)
-    else:
+    if geom_type == "_meshfile_geometry":
+        return _parse_meshfile_geometry(geom_data, cas_assets, decoded_assets)
+
+    parser = _GEOMETRY_PARSERS.get(geom_type)
+    if parser is None:
         print(f"Warning: Unsupported geometry type: {geom_type}")
         return None
+    return parser(geom_data)
+
+
+def prefetch_cas_assets(
+    geom_data_list: list[dict[str, Any]],
+    cas_assets: dict[str, str],
+    decoded_assets: dict[str, bytes],
+) -> None:
+    """Decode the CAS assets referenced by several meshfile geometries at once.
+
+    Collecting the references of all geometries first lets the decode thread
+    pool work across geometries instead of only within each one. Parsing the
+    geometries afterwards with the same decoded_assets then finds every asset
+    already decoded.
+
+    Args:
+        geom_data_list: Geometry dictionaries; only glTF meshfiles are scanned
+        cas_assets: Dictionary of CAS assets (hash -> data URI)
+        decoded_assets: Cache of decoded CAS assets, updated in place
+    """
+    uris = []
+    for geom_data in geom_data_list:
+        data = geom_data.get("data")
+        if (
+            geom_data.get("type") == "_meshfile_geometry"
+            and str(geom_data.get("format", "")).lower() == "gltf"
+            and isinstance(data, str)
+            and "cas-v1" in data
+        ):
+            uris.extend(_CAS_URI_PATTERN.findall(data))
+
+    if uris:
+        _decode_cas_assets(uris, cas_assets, decoded_assets)
 
 
 def _parse_buffer_geometry(geom_data: dict[str, Any]) -> MeshGeometry | None:
@@ -122,46 +206,26 @@ def _parse_buffer_geometry(geom_data: dict[str, Any]) -> MeshGeometry | None:
     if position_array is None:
         return None
 
-    # Convert to numpy and reshape
-    if isinstance(position_array, np.ndarray):
-        positions = position_array.astype(np.float32)
-    else:
-        positions = np.array(position_array, dtype=np.float32)
-
     item_size = position_attr.get("itemSize", 3)
-    positions = positions.reshape(-1, item_size)
+    positions = _to_array(position_array, np.float32, item_size)
 
     # Extract normals
     normals = None
-    normal_attr = attributes.get("normal", {})
-    normal_array = normal_attr.get("array")
+    normal_array = attributes.get("normal", {}).get("array")
     if normal_array is not None:
-        if isinstance(normal_array, np.ndarray):
-            normals = normal_array.astype(np.float32)
-        else:
-            normals = np.array(normal_array, dtype=np.float32)
-        normals = normals.reshape(-1, 3)
+        normals = _to_array(normal_array, np.float32, 3)
 
     # Extract UVs
     uvs = None
-    uv_attr = attributes.get("uv", {})
-    uv_array = uv_attr.get("array")
+    uv_array = attributes.get("uv", {}).get("array")
     if uv_array is not None:
-        if isinstance(uv_array, np.ndarray):
-            uvs = uv_array.astype(np.float32)
-        else:
-            uvs = np.array(uv_array, dtype=np.float32)
-        uvs = uvs.reshape(-1, 2)
+        uvs = _to_array(uv_array, np.float32, 2)
 
     # Extract indices
     indices = None
-    index_data = data.get("index", {})
-    index_array = index_data.get("array")
+    index_array = data.get("index", {}).get("array")
     if index_array is not None:
-        if isinstance(index_array, np.ndarray):
-            indices = index_array.astype(np.int32)
-        else:
-            indices = np.array(index_array, dtype=np.int32)
+        indices = _to_array(index_array, np.int32)
 
     return MeshGeometry(
         positions=positions,
@@ -171,59 +235,106 @@ def _parse_buffer_geometry(geom_data: dict[str, Any]) -> MeshGeometry | None:
     )
 
 
+def _to_array(
+    array: Any,
+    dtype: type[np.generic],
+    columns: int | None = None,
+) -> np.ndarray:
+    """Convert buffer attribute data to a numpy array of the given dtype.
+
+    Arrays that already have the requested dtype and are C-contiguous (e.g.
+    typed arrays decoded from msgpack) and raw byte buffers are wrapped
+    without copying. Other inputs are converted once, straight to a
+    C-contiguous array, so the reshape below is always a view.
+
+    Args:
+        array: Attribute data as an ndarray, bytes-like buffer or sequence
+        dtype: Target numpy dtype
+        columns: Optional number of columns to reshape to
+
+    Returns:
+        Numpy array, reshaped to (-1, columns) when columns is given
+    """
+    if isinstance(array, (bytes, bytearray, memoryview)):
+        result = np.frombuffer(array, dtype=dtype)
+    else:
+        result = np.ascontiguousarray(array, dtype=dtype)
+
+    if columns is not None:
+        result = result.reshape(-1, columns)
+    return result
+
+
 def _parse_box_geometry(geom_data: dict[str, Any]) -> PrimitiveGeometry:
     """Parse a BoxGeometry."""
+    get = geom_data.get
     return PrimitiveGeometry(
         geometry_type=GeometryType.BOX,
-        width=geom_data.get("width", 1.0),
-        height=geom_data.get("height", 1.0),
-        depth=geom_data.get("depth", 1.0),
+        width=get("width", 1.0),
+        height=get("height", 1.0),
+        depth=get("depth", 1.0),
     )
 
 
 def _parse_sphere_geometry(geom_data: dict[str, Any]) -> PrimitiveGeometry:
     """Parse a SphereGeometry."""
+    get = geom_data.get
     return PrimitiveGeometry(
         geometry_type=GeometryType.SPHERE,
-        radius=geom_data.get("radius", 1.0),
-        width_segments=geom_data.get("widthSegments", 32),
-        height_segments=geom_data.get("heightSegments", 16),
+        radius=get("radius", 1.0),
+        width_segments=get("widthSegments", 32),
+        height_segments=get("heightSegments", 16),
     )
 
 
 def _parse_cylinder_geometry(geom_data: dict[str, Any]) -> PrimitiveGeometry:
     """Parse a CylinderGeometry."""
+    get = geom_data.get
     return PrimitiveGeometry(
         geometry_type=GeometryType.CYLINDER,
-        radius_top=geom_data.get("radiusTop", 1.0),
-        radius_bottom=geom_data.get("radiusBottom", 1.0),
-        height=geom_data.get("height", 1.0),
-        radial_segments=geom_data.get("radialSegments", 32),
+        radius_top=get("radiusTop", 1.0),
+        radius_bottom=get("radiusBottom", 1.0),
+        height=get("height", 1.0),
+        radial_segments=get("radialSegments", 32),
     )
 
 
 def _parse_plane_geometry(geom_data: dict[str, Any]) -> PrimitiveGeometry:
     """Parse a PlaneGeometry."""
+    get = geom_data.get
     return PrimitiveGeometry(
         geometry_type=GeometryType.PLANE,
-        width=geom_data.get("width", 1.0),
-        height=geom_data.get("height", 1.0),
+        width=get("width", 1.0),
+        height=get("height", 1.0),
     )
 
 
+# Parsers for the geometry types that only need the geometry data
+_GEOMETRY_PARSERS = {
+    "BufferGeometry": _parse_buffer_geometry,
+    "BoxGeometry": _parse_box_geometry,
+    "BoxBufferGeometry": _parse_box_geometry,
+    "SphereGeometry": _parse_sphere_geometry,
+    "SphereBufferGeometry": _parse_sphere_geometry,
+    "CylinderGeometry": _parse_cylinder_geometry,
+    "CylinderBufferGeometry": _parse_cylinder_geometry,
+    "PlaneGeometry": _parse_plane_geometry,
+    "PlaneBufferGeometry": _parse_plane_geometry,
+}
+
+
 def _parse_meshfile_geometry(
     geom_data: dict[str, Any],
     cas_assets: dict[str, str] | None = None,
+    decoded_assets: dict[str, bytes] | None = None,
 ) -> MeshFileGeometry | None:
     """Parse a _meshfile_geometry (embedded glTF/OBJ).
 
     Args:
         geom_data: Geometry data dictionary
         cas_assets: Optional CAS assets dictionary for resolving external references
+        decoded_assets: Optional cache of already decoded CAS assets
     """
-    import base64
-    import json
-
     fmt = geom_data.get("format", "")
     data = geom_data.get("data")
 
@@ -233,64 +344,52 @@ def _parse_meshfile_geometry(
     # For glTF format, we need to resolve CAS asset references in the JSON
     resources = {}
 
-    if fmt.lower() == "gltf" and isinstance(data, str) and cas_assets:
+    # Only parse the JSON when it can contain a CAS reference to resolve
+    if (
+        fmt.lower() == "gltf"
+        and isinstance(data, str)
+        and cas_assets
+        and "cas-v1" in data
+    ):
         try:
-            gltf = json.loads(data)
+            gltf = _load_json(data)
 
-            # Resolve buffer URIs that reference CAS assets
+            # Resolve buffer and image URIs that reference CAS assets
             buffers = gltf.get("buffers") or []
-            for buffer in buffers:
-                uri = buffer.get("uri", "")
-                if uri.startswith(("cas-v1/", "cas-v1-")):
-                    # Look up in CAS assets
-                    if uri in cas_assets:
-                        asset_data_uri = cas_assets[uri]
-                        # Parse data URI and extract binary data
-                        binary_data = _decode_data_uri(asset_data_uri)
-                        if binary_data:
-                            resources[uri] = binary_data
-                            # Replace URI with the resource key for later resolution
-                            buffer["uri"] = uri
-
-            # Resolve image URIs that reference CAS assets
             images = gltf.get("images") or []
-            for image in images:
-                uri = image.get("uri", "")
-                if uri.startswith(("cas-v1/", "cas-v1-")):
-                    if uri in cas_assets:
-                        asset_data_uri = cas_assets[uri]
-                        binary_data = _decode_data_uri(asset_data_uri)
-                        if binary_data:
-                            resources[uri] = binary_data
-
-            # Re-serialize the glTF JSON (it may have been modified)
-            data = json.dumps(gltf).encode("utf-8")
+            cas_uris = [
+                uri
+                for entry in (*buffers, *images)
+                if (uri := entry.get("uri", "")).startswith(("cas-v1/", "cas-v1-"))
+            ]
+            # The CAS URIs are kept as-is: the decoded assets are written next
+            # to the glTF file under the same relative paths, so the original
+            # JSON text is used without re-serializing it.
+            resources.update(_decode_cas_assets(cas_uris, cas_assets, decoded_assets))
 
         except json.JSONDecodeError:
             # Not valid JSON, treat as raw data
             pass
 
-    # Convert data to bytes if it's a string
-    if isinstance(data, str):
-        try:
-            # Use validate=True to reject non-base64 data (e.g., OBJ text).
-            # Without validation, b64decode silently strips non-base64 chars
-            # and can produce garbled output from plain text input.
-            data = base64.b64decode(data, validate=True)
-        except Exception:
-            data = data.encode("utf-8")
-    elif isinstance(data, (list, np.ndarray)):
+    # Convert data to bytes; binary payloads are used as-is
+    if isinstance(data, (bytes, bytearray)):
+        pass
+    elif isinstance(data, memoryview):
+        data = bytes(data)
+    elif isinstance(data, str):
+        data = _decode_base64_or_text(data)
+    elif isinstance(data, (list, tuple, np.ndarray)):
         data = bytes(data)
 
     # Extract any explicit resources (for glTF with external files)
     resources_data = geom_data.get("resources", {})
     for key, value in resources_data.items():
         if isinstance(value, str):
-            try:
-                resources[key] = base64.b64decode(value, validate=True)
-            except Exception:
-                resources[key] = value.encode("utf-8")
-        elif isinstance(value, (list, np.ndarray)):
+            resources[key] = _decode_base64_or_text(value)
+        elif isinstance(value, np.ndarray):
+            # Share the typed array's buffer instead of copying it
+            resources[key] = memoryview(np.ascontiguousarray(value)).cast("B")
+        elif isinstance(value, (list, tuple)):
             resources[key] = bytes(value)
         else:
             resources[key] = value
@@ -302,6 +401,79 @@ def _parse_meshfile_geometry(
     )
 
 
+def _decode_base64_or_text(value: str) -> bytes:
+    """Decode a base64 string, or encode it as UTF-8 text if it is not base64.
+
+    Args:
+        value: Base64 payload or plain text (e.g., glTF JSON or OBJ/MTL text)
+
+    Returns:
+        Decoded bytes
+    """
+    # JSON text can never be valid base64, so skip the decode attempt (which
+    # first copies the whole string to ASCII bytes)
+    if value.startswith(("{", "[")):
+        return value.encode("utf-8")
+
+    try:
+        # Use validate=True to reject non-base64 data (e.g., OBJ text).
+        # Without validation, b64decode silently strips non-base64 chars
+        # and can produce garbled output from plain text input.
+        return base64.b64decode(value, validate=True)
+    except Exception:
+        return value.encode("utf-8")
+
+
+def _load_json(data: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode_cas_assets(
+    uris: list[str],
+    cas_assets: dict[str, str],
+    decoded_assets: dict[str, bytes] | None,
+) -> dict[str, bytes]:
+    """Decode CAS assets, reusing previous decodes of the same keys.
+
+    CAS keys are content-addressed, so a key always maps to the same bytes.
+    When several assets need decoding they are decoded on a thread pool;
+    pybase64 releases the GIL while decoding large payloads.
+
+    Args:
+        uris: CAS asset keys (e.g., "cas-v1/<sha>")
+        cas_assets: CAS assets dictionary (hash -> data URI)
+        decoded_assets: Optional cache of decoded assets, updated in place
+
+    Returns:
+        Dictionary of key -> decoded bytes for the keys that could be
+        resolved, in the order given
+    """
+    if decoded_assets is None:
+        decoded_assets = {}
+
+    pending = [
+        uri
+        for uri in dict.fromkeys(uris)
+        if uri not in decoded_assets and uri in cas_assets
+    ]
+    data_uris = [cas_assets[uri] for uri in pending]
+    if len(pending) > 1:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            decoded = list(executor.map(_decode_data_uri, data_uris))
+    else:
+        decoded = [_decode_data_uri(data_uri) for data_uri in data_uris]
+
+    for uri, binary_data in zip(pending, decoded):
+        if binary_data:
+            decoded_assets[uri] = binary_data
+
+    return {uri: decoded_assets[uri] for uri in uris if uri in decoded_assets}
+
+
 def _decode_data_uri(data_uri: str) -> bytes | None:
     """Decode a data URI to binary data.
 
@@ -311,22 +483,22 @@ def _decode_data_uri(data_uri: str) -> bytes | None:
     Returns:
         Decoded bytes or None if decoding fails
     """
-    import base64
-
     if not data_uri.startswith("data:"):
         return None
 
     try:
         # Parse data URI format: data:[<mediatype>][;base64],<data>
-        header, encoded_data = data_uri.split(",", 1)
-
-        if ";base64" in header:
-            return base64.b64decode(encoded_data)
+        # Encode once and slice the payload as a memoryview, so the (possibly
+        # multi-MB) payload is not copied again before decoding
+        raw = data_uri.encode("utf-8")
+        comma = raw.index(b",")
+        payload = memoryview(raw)[comma + 1 :]
+
+        if b";base64" in raw[:comma]:
+            return base64.b64decode(payload)
         else:
             # URL-encoded data
-            from urllib.parse import unquote
-
-            return unquote(encoded_data).encode("utf-8")
+            return unquote_to_bytes(bytes(payload))
 
     except Exception:
         return None
@@ -4,67 +4,85 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
 
 import numpy as np
 
 
-@dataclass
 class Transform:
-    """Decomposed transform with translation, rotation, and scale."""
+    """Decomposed transform with translation, rotation, and scale.
 
-    translation: tuple[float, float, float]
-    rotation: tuple[float, float, float, float]  # Quaternion (x, y, z, w)
-    scale: tuple[float, float, float]
+    The components are stored in a single (10,) float64 array laid out as
+    (tx, ty, tz, qx, qy, qz, qw, sx, sy, sz), so that transforms can be fed
+    to the batched helpers without unpacking. The properties return tuples.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(
+        self,
+        translation: tuple[float, float, float],
+        rotation: tuple[float, float, float, float],  # Quaternion (x, y, z, w)
+        scale: tuple[float, float, float],
+    ):
+        self.data = np.empty(10, dtype=np.float64)
+        self.data[0:3] = translation
+        self.data[3:7] = rotation
+        self.data[7:10] = scale
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> Transform:
+        """Create a transform from a (10,) translation/rotation/scale array."""
+        transform = cls.__new__(cls)
+        transform.data = np.asarray(data, dtype=np.float64)
+        return transform
 
     @classmethod
     def identity(cls) -> Transform:
         """Create an identity transform."""
-        return cls(
-            translation=(0.0, 0.0, 0.0),
-            rotation=(0.0, 0.0, 0.0, 1.0),
-            scale=(1.0, 1.0, 1.0),
+        return cls.from_array(_IDENTITY_TRS.copy())
+
+    @property
+    def translation(self) -> tuple[float, float, float]:
+        return tuple(self.data[0:3].tolist())
+
+    @translation.setter
+    def translation(self, value: tuple[float, float, float]) -> None:
+        self.data[0:3] = value
+
+    @property
+    def rotation(self) -> tuple[float, float, float, float]:
+        return tuple(self.data[3:7].tolist())
+
+    @rotation.setter
+    def rotation(self, value: tuple[float, float, float, float]) -> None:
+        self.data[3:7] = value
+
+    @property
+    def scale(self) -> tuple[float, float, float]:
+        return tuple(self.data[7:10].tolist())
+
+    @scale.setter
+    def scale(self, value: tuple[float, float, float]) -> None:
+        self.data[7:10] = value
+
+    def __repr__(self) -> str:
+        return (
+            f"Transform(translation={self.translation}, "
+            f"rotation={self.rotation}, scale={self.scale})"
         )
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return bool(np.array_equal(self.data, other.data))
+
     def to_matrix(self) -> np.ndarray:
         """Convert to a 4x4 transformation matrix."""
-        # Build rotation matrix from quaternion
-        x, y, z, w = self.rotation
-        rot = np.array(
-            [
-                [
-                    1 - 2 * y * y - 2 * z * z,
-                    2 * x * y - 2 * z * w,
-                    2 * x * z + 2 * y * w,
-                    0,
-                ],
-                [
-                    2 * x * y + 2 * z * w,
-                    1 - 2 * x * x - 2 * z * z,
-                    2 * y * z - 2 * x * w,
-                    0,
-                ],
-                [
-                    2 * x * z - 2 * y * w,
-                    2 * y * z + 2 * x * w,
-                    1 - 2 * x * x - 2 * y * y,
-                    0,
-                ],
-                [0, 0, 0, 1],
-            ],
-            dtype=np.float64,
-        )
-
-        # Apply scale
-        scale_mat = np.diag([self.scale[0], self.scale[1], self.scale[2], 1.0])
+        data = self.data[np.newaxis]
+        return trs_to_matrices(data[:, 0:3], data[:, 3:7], data[:, 7:10])[0]
 
-        # Apply translation
-        trans_mat = np.eye(4, dtype=np.float64)
-        trans_mat[0, 3] = self.translation[0]
-        trans_mat[1, 3] = self.translation[1]
-        trans_mat[2, 3] = self.translation[2]
 
-        return trans_mat @ rot @ scale_mat
+_IDENTITY_TRS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
 
 
 def parse_transform_matrix(matrix_data: list[float] | np.ndarray) -> np.ndarray:
@@ -98,14 +116,16 @@ def matrix_to_trs(matrix: np.ndarray) -> Transform:
     Returns:
         Transform with decomposed TRS
     """
+    data = np.empty(10, dtype=np.float64)
+
     # Extract translation
-    translation = (float(matrix[0, 3]), float(matrix[1, 3]), float(matrix[2, 3]))
+    data[0:3] = matrix[:3, 3]
 
     # Extract scale from column magnitudes
     sx = np.linalg.norm(matrix[:3, 0])
     sy = np.linalg.norm(matrix[:3, 1])
     sz = np.linalg.norm(matrix[:3, 2])
-    scale = (float(sx), float(sy), float(sz))
+    data[7:10] = (sx, sy, sz)
 
     # Normalize to get rotation matrix
     rot_matrix = np.zeros((3, 3), dtype=np.float64)
@@ -114,13 +134,9 @@ def matrix_to_trs(matrix: np.ndarray) -> Transform:
     rot_matrix[:, 2] = matrix[:3, 2] / sz if sz > 1e-10 else matrix[:3, 2]
 
     # Convert rotation matrix to quaternion
-    rotation = rotation_matrix_to_quaternion(rot_matrix)
+    data[3:7] = rotation_matrix_to_quaternion(rot_matrix)
 
-    return Transform(
-        translation=translation,
-        rotation=rotation,
-        scale=scale,
-    )
+    return Transform.from_array(data)
 
 
 def rotation_matrix_to_quaternion(
@@ -165,6 +181,122 @@ def rotation_matrix_to_quaternion(
     return (float(x), float(y), float(z), float(w))
 
 
+def rotation_matrices_to_quaternions(rot: np.ndarray) -> np.ndarray:
+    """Convert an array of 3x3 rotation matrices to quaternions (x, y, z, w).
+
+    Vectorized counterpart of rotation_matrix_to_quaternion, using the same
+    branches of Shepperd's method.
+
+    Args:
+        rot: (N, 3, 3) rotation matrices
+
+    Returns:
+        (N, 4) quaternions as (x, y, z, w)
+    """
+    quats = np.empty((len(rot), 4), dtype=np.float64)
+    r00, r11, r22 = rot[:, 0, 0], rot[:, 1, 1], rot[:, 2, 2]
+    trace = r00 + r11 + r22
+
+    case_w = trace > 0
+    case_x = ~case_w & (r00 > r11) & (r00 > r22)
+    case_y = ~case_w & ~case_x & (r11 > r22)
+    case_z = ~(case_w | case_x | case_y)
+
+    m = rot[case_w]
+    s = 0.5 / np.sqrt(trace[case_w] + 1.0)
+    quats[case_w, 0] = (m[:, 2, 1] - m[:, 1, 2]) * s
+    quats[case_w, 1] = (m[:, 0, 2] - m[:, 2, 0]) * s
+    quats[case_w, 2] = (m[:, 1, 0] - m[:, 0, 1]) * s
+    quats[case_w, 3] = 0.25 / s
+
+    m = rot[case_x]
+    s = 2.0 * np.sqrt(1.0 + m[:, 0, 0] - m[:, 1, 1] - m[:, 2, 2])
+    quats[case_x, 0] = 0.25 * s
+    quats[case_x, 1] = (m[:, 0, 1] + m[:, 1, 0]) / s
+    quats[case_x, 2] = (m[:, 0, 2] + m[:, 2, 0]) / s
+    quats[case_x, 3] = (m[:, 2, 1] - m[:, 1, 2]) / s
+
+    m = rot[case_y]
+    s = 2.0 * np.sqrt(1.0 + m[:, 1, 1] - m[:, 0, 0] - m[:, 2, 2])
+    quats[case_y, 0] = (m[:, 0, 1] + m[:, 1, 0]) / s
+    quats[case_y, 1] = 0.25 * s
+    quats[case_y, 2] = (m[:, 1, 2] + m[:, 2, 1]) / s
+    quats[case_y, 3] = (m[:, 0, 2] - m[:, 2, 0]) / s
+
+    m = rot[case_z]
+    s = 2.0 * np.sqrt(1.0 + m[:, 2, 2] - m[:, 0, 0] - m[:, 1, 1])
+    quats[case_z, 0] = (m[:, 0, 2] + m[:, 2, 0]) / s
+    quats[case_z, 1] = (m[:, 1, 2] + m[:, 2, 1]) / s
+    quats[case_z, 2] = 0.25 * s
+    quats[case_z, 3] = (m[:, 1, 0] - m[:, 0, 1]) / s
+
+    return quats
+
+
+def trs_to_matrices(
+    translations: np.ndarray,
+    rotations: np.ndarray,
+    scales: np.ndarray,
+) -> np.ndarray:
+    """Build an array of 4x4 matrices from translations, rotations and scales.
+
+    Vectorized counterpart of Transform.to_matrix.
+
+    Args:
+        translations: (N, 3) translations
+        rotations: (N, 4) quaternions as (x, y, z, w)
+        scales: (N, 3) scales
+
+    Returns:
+        (N, 4, 4) transformation matrices
+    """
+    x, y, z, w = np.asarray(rotations, dtype=np.float64).T
+
+    matrices = np.zeros((len(x), 4, 4), dtype=np.float64)
+    matrices[:, 0, 0] = 1 - 2 * y * y - 2 * z * z
+    matrices[:, 0, 1] = 2 * x * y - 2 * z * w
+    matrices[:, 0, 2] = 2 * x * z + 2 * y * w
+    matrices[:, 1, 0] = 2 * x * y + 2 * z * w
+    matrices[:, 1, 1] = 1 - 2 * x * x - 2 * z * z
+    matrices[:, 1, 2] = 2 * y * z - 2 * x * w
+    matrices[:, 2, 0] = 2 * x * z - 2 * y * w
+    matrices[:, 2, 1] = 2 * y * z + 2 * x * w
+    matrices[:, 2, 2] = 1 - 2 * x * x - 2 * y * y
+
+    # Scale the rotation columns, then set translation
+    matrices[:, :3, :3] *= np.asarray(scales, dtype=np.float64)[:, np.newaxis, :]
+    matrices[:, :3, 3] = translations
+    matrices[:, 3, 3] = 1.0
+
+    return matrices
+
+
+def matrices_to_trs(
+    matrices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decompose an array of 4x4 matrices into translation, rotation, scale.
+
+    Vectorized counterpart of matrix_to_trs.
+
+    Args:
+        matrices: (N, 4, 4) transformation matrices
+
+    Returns:
+        Tuple of (N, 3) translations, (N, 4) quaternions as (x, y, z, w)
+        and (N, 3) scales
+    """
+    translations = matrices[:, :3, 3].copy()
+
+    # Extract scale from column magnitudes
+    scales = np.linalg.norm(matrices[:, :3, :3], axis=1)
+
+    # Normalize to get rotation matrices
+    divisors = np.where(scales > 1e-10, scales, 1.0)
+    rot_matrices = matrices[:, :3, :3] / divisors[:, np.newaxis, :]
+
+    return translations, rotation_matrices_to_quaternions(rot_matrices), scales
+
+
 def quaternion_multiply(
     q1: tuple[float, float, float, float],
     q2: tuple[float, float, float, float],
@@ -61,6 +61,19 @@ class TestAnimationData:
         assert clip.duration == 2.5
         assert clip.frame_count == 76  # 2.5 * 30 + 1
 
+    def test_track_type_from_name(self):
+        """Test classifying Three.js track names."""
+        from meshcat_html_importer.animation.animation_data import (
+            TrackType,
+            track_type_from_name,
+        )
+
+        assert track_type_from_name(".position") is TrackType.POSITION
+        assert track_type_from_name("object.quaternion") is TrackType.QUATERNION
+        assert track_type_from_name(".scale") is TrackType.SCALE
+        assert track_type_from_name(".visible") is TrackType.VISIBLE
+        assert track_type_from_name(".material.opacity") is None
+
 
 class TestKeyframeConverter:
     """Tests for keyframe conversion."""
@@ -101,3 +114,85 @@ class TestKeyframeConverter:
         blender_quat = convert_quaternion_to_blender(threejs_quat)
 
         assert blender_quat == (0.9, 0.1, 0.2, 0.3)
+
+    def test_downsample_keyframes(self):
+        """Test downsampling interpolates each channel on its own keyframes."""
+        import numpy as np
+        from meshcat_html_importer.animation.keyframe_converter import (
+            downsample_keyframes,
+        )
+        from meshcat_html_importer.scene.scene_graph import (
+            AnimationKeyframe,
+            KeyframeTrack,
+        )
+
+        keyframes = KeyframeTrack.from_keyframes(
+            [
+                AnimationKeyframe(time=0.0, position=(0.0, 0.0, 0.0)),
+                AnimationKeyframe(time=2.0, rotation=(0.0, 0.0, 0.0, 1.0)),
+                AnimationKeyframe(time=4.0, position=(4.0, 0.0, 0.0)),
+            ]
+        )
+
+        # 4 fps -> 2 fps: target frames at recording times 0, 2, 4
+        result = downsample_keyframes(keyframes, recording_fps=4.0, target_fps=2.0)
+
+        np.testing.assert_array_equal(result.times, [0, 1, 2])
+        np.testing.assert_allclose(result.positions[:, 0], [0.0, 2.0, 4.0])
+        np.testing.assert_allclose(result.rotations, [[0, 0, 0, 1]] * 3)
+        assert result.scales is None
+
+    def test_fcurve_points(self):
+        """Test keyframes are split into interleaved per-F-curve arrays."""
+        import numpy as np
+        from meshcat_html_importer.animation.keyframe_converter import (
+            BlenderKeyframes,
+        )
+
+        keyframes = BlenderKeyframes(
+            frames=np.array([2, 0, 2]),
+            location=np.array(
+                [[1.0, 2.0, 3.0], [0.0, 0.0, 0.0], [np.nan, np.nan, np.nan]]
+            ),
+        )
+
+        points = list(keyframes.fcurve_points())
+
+        assert [(path, index) for path, index, _ in points] == [
+            ("location", 0),
+            ("location", 1),
+            ("location", 2),
+        ]
+        # Sorted by frame, NaN rows skipped
+        np.testing.assert_array_equal(points[1][2], [0.0, 0.0, 2.0, 2.0])
+
+    def test_downsample_keyframes_on_target_grid(self):
+        """Test keyframes already at the target rate are passed through."""
+        import numpy as np
+        from meshcat_html_importer.animation.keyframe_converter import (
+            downsample_keyframes,
+        )
+        from meshcat_html_importer.scene.scene_graph import KeyframeTrack
+
+        positions = np.arange(9, dtype=np.float32).reshape(3, 3)
+        keyframes = KeyframeTrack(times=np.array([0.0, 2.0, 4.0]), positions=positions)
+
+        result = downsample_keyframes(keyframes, recording_fps=4.0, target_fps=2.0)
+
+        np.testing.assert_array_equal(result.times, [0, 1, 2])
+        np.testing.assert_array_equal(result.positions, positions)
+
+    def test_convert_quaternion_array_to_blender(self):
+        """Test batch quaternion format conversion."""
+        import numpy as np
+        from meshcat_html_importer.animation.keyframe_converter import (
+            convert_quaternion_to_blender,
+        )
+
+        threejs_quats = np.array([[0.1, 0.2, 0.3, 0.9], [0.0, 0.0, 0.0, 1.0]])
+
+        blender_quats = convert_quaternion_to_blender(threejs_quats)
+
+        np.testing.assert_array_equal(
+            blender_quats, [[0.9, 0.1, 0.2, 0.3], [1.0, 0.0, 0.0, 0.0]]
+        )
@@ -49,6 +49,33 @@ class TestMsgpackDecoder:
 
         assert list(result) == [100, 200, 300]
 
+    def test_numpy_to_list(self):
+        """Test nested arrays are converted without modifying the input."""
+        from meshcat_html_importer.parser.msgpack_decoder import (
+            decode_typed_array,
+            numpy_to_list,
+        )
+
+        array = decode_typed_array(0x17, struct.pack("<2f", 1.0, 2.0))
+        data = {"object": {"matrix": array, "children": [array, "name"]}}
+
+        result = numpy_to_list(data)
+
+        assert result == {
+            "object": {"matrix": [1.0, 2.0], "children": [[1.0, 2.0], "name"]}
+        }
+        assert data["object"]["matrix"] is array
+
+    def test_vendored_unpackb_use_list(self):
+        """Test the vendored unpacker returns tuples when use_list is False."""
+        from meshcat_html_importer.vendor import msgpack
+
+        # {"a": [1, [2, 3]]}
+        data = b"\x81\xa1a\x92\x01\x92\x02\x03"
+
+        assert msgpack.unpackb(data, raw=False) == {"a": [1, [2, 3]]}
+        assert msgpack.unpackb(data, raw=False, use_list=False) == {"a": (1, (2, 3))}
+
 
 class TestHtmlExtractor:
     """Tests for HTML command extraction."""
@@ -118,6 +145,95 @@ class TestHtmlExtractor:
         assert "cas-v1/def456" in assets
         assert assets["cas-v1/def456"] == "data:image/png;base64,aW1hZ2U="
 
+    def test_extract_cas_assets_braces_in_values(self):
+        """Test that braces inside string values do not end the literal."""
+        from meshcat_html_importer.parser.html_extractor import extract_cas_assets
+
+        html = """
+        var casAssets = {"a": "data:text/plain,}{", "b": "data:b"};
+        var other = {"c": "data:c"};
+        """
+
+        assets = extract_cas_assets(html)
+
+        assert assets == {"a": "data:text/plain,}{", "b": "data:b"}
+
+    def test_scan_html(self):
+        """Test extracting commands and assets in a single pass."""
+        from meshcat_html_importer.parser.html_extractor import scan_html
+
+        test_data = b"\x81\xa4type\xa6delete"
+        b64_data = base64.b64encode(test_data).decode()
+        html = f"""
+        var casAssets = {{"cas-v1/a": "data:old", "cas-v1/b": "data:b"}};
+        casAssets["cas-v1/a"] = "data:new";
+        fetch("data:application/octet-binary;base64,{b64_data}");
+        """
+
+        commands, assets = scan_html(html)
+
+        assert commands == [test_data]
+        assert assets == {"cas-v1/a": "data:new", "cas-v1/b": "data:b"}
+
+    def test_parse_html_recording(self, tmp_path):
+        """Test parsing a recording file through the memory-mapped scan."""
+        from meshcat_html_importer.parser import parse_html_recording
+        from meshcat_html_importer.parser.command_types import CommandType
+
+        test_data = b"\x82\xa4type\xa6delete\xa4path\xa4/foo"
+        b64_data = base64.b64encode(test_data).decode()
+        html_path = tmp_path / "recording.html"
+        html_path.write_text(
+            f"""
+            var casAssets = {{"cas-v1/a": "data:a"}};
+            casAssets["cas-v1/b"] = "data:b";
+            fetch("data:application/octet-binary;base64,{b64_data}");
+            """
+        )
+
+        result = parse_html_recording(html_path)
+
+        assert [cmd.type for cmd in result["commands"]] == [CommandType.DELETE]
+        assert result["commands"][0].path == "/foo"
+        assert result["raw_commands"] is None
+        assert result["assets"] == {"cas-v1/a": "data:a", "cas-v1/b": "data:b"}
+
+        result = parse_html_recording(html_path, include_raw=True)
+
+        assert result["raw_commands"] == [{"type": "delete", "path": "/foo"}]
+
+    def test_decode_commands_parallel(self, monkeypatch):
+        """Test the thread pool path keeps commands in order."""
+        import sys
+
+        from meshcat_html_importer.parser import html_extractor
+
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        monkeypatch.setattr(html_extractor, "_PARALLEL_DECODE_MIN_COMMANDS", 1)
+        raw_bytes = [
+            b"\x82\xa4type\xa6delete\xa4path\xa2/" + bytes([ord("a") + i])
+            for i in range(10)
+        ] + [b"\xc1"]
+
+        results = html_extractor._decode_commands(raw_bytes)
+
+        assert [cmd.path for _, cmd in results[:-1]] == [
+            f"/{chr(ord('a') + i)}" for i in range(10)
+        ]
+        assert results[-1] is None
+
+    def test_parse_html_recording_empty_file(self, tmp_path):
+        """Test parsing an empty recording file."""
+        from meshcat_html_importer.parser import parse_html_recording
+
+        html_path = tmp_path / "empty.html"
+        html_path.write_bytes(b"")
+
+        result = parse_html_recording(html_path)
+
+        assert result["commands"] == []
+        assert result["assets"] == {}
+
 
 class TestCommandTypes:
     """Tests for command type parsing."""
@@ -161,6 +277,17 @@ class TestCommandTypes:
         with pytest.raises(ValueError):
             Command.from_dict(data)
 
+    def test_get_animation_fps(self):
+        """Test FPS lookup order for set_animation commands."""
+        from meshcat_html_importer.parser.command_types import get_animation_fps
+
+        clip = {"animations": [{"clip": {"fps": 30}}]}
+
+        assert get_animation_fps({"options": {"fps": 64}, **clip}) == 64.0
+        assert get_animation_fps({"options": {"play_fps": 24}, **clip}) == 24.0
+        assert get_animation_fps({"options": {}, **clip}) == 30.0
+        assert get_animation_fps({"options": {}}) is None
+
 
 class TestAssetResolver:
     """Tests for asset resolver."""
@@ -187,3 +314,42 @@ class TestAssetResolver:
         result = resolver.resolve("nonexistent")
 
         assert result is None
+
+    def test_resolve_data_uri_cached(self):
+        """Test resolving the same data URI twice reuses the first result."""
+        from meshcat_html_importer.parser.asset_resolver import AssetResolver
+
+        resolver = AssetResolver({})
+
+        first = resolver.resolve_data_uri("data:text/plain;base64,SGVsbG8=")
+        second = resolver.resolve_data_uri("data:text/plain;base64," + "SGVsbG8=")
+
+        assert first is not None
+        assert first.data == b"Hello"
+        assert len(first.hash) == 16
+        assert second is first
+
+    def test_resolve_data_uri_header(self):
+        """Test data URI headers are split into mime type and encoding."""
+        from meshcat_html_importer.parser.asset_resolver import AssetResolver
+
+        resolver = AssetResolver({})
+
+        plain = resolver.resolve_data_uri("data:text/plain,a,b")
+        assert plain.mime_type == "text/plain"
+        assert plain.data == b"a,b"
+
+        for invalid in ("data:text/plain", "data:,abc", "data:a;,abc", "x:a,b"):
+            assert resolver.resolve_data_uri(invalid) is None
+
+    def test_get_all_keys_excludes_data_uris(self):
+        """Test directly resolved data URIs are not listed as asset keys."""
+        from meshcat_html_importer.parser.asset_resolver import AssetResolver
+
+        resolver = AssetResolver({"cas-v1/a": "data:text/plain,a"})
+
+        assert resolver.resolve_data_uri("data:image/png;base64,AAAA") is not None
+        assert resolver.get_all_keys() == ["cas-v1/a"]
+
+        resolver.resolve("cas-v1/a")
+        assert resolver.get_all_keys() == ["cas-v1/a"]
@@ -17,6 +17,29 @@ class TestTransforms:
         assert t.rotation == (0.0, 0.0, 0.0, 1.0)
         assert t.scale == (1.0, 1.0, 1.0)
 
+    def test_transform_array_storage(self):
+        """Test transform components are backed by a single array."""
+        from meshcat_html_importer.scene.transforms import Transform
+
+        t = Transform(
+            translation=(1.0, 2.0, 3.0),
+            rotation=(0.0, 0.0, 0.0, 1.0),
+            scale=(2.0, 2.0, 2.0),
+        )
+
+        np.testing.assert_array_equal(
+            t.data, [1.0, 2.0, 3.0, 0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 2.0]
+        )
+        assert t.translation == (1.0, 2.0, 3.0)
+        np.testing.assert_array_almost_equal(
+            t.to_matrix(),
+            [[2, 0, 0, 1], [0, 2, 0, 2], [0, 0, 2, 3], [0, 0, 0, 1]],
+        )
+
+        t.scale = (1.0, 1.0, 1.0)
+        assert t.data[7:10].tolist() == [1.0, 1.0, 1.0]
+        assert Transform.identity() != t
+
     def test_parse_transform_matrix(self):
         """Test parsing column-major matrix."""
         from meshcat_html_importer.scene.transforms import parse_transform_matrix
@@ -73,6 +96,33 @@ class TestTransforms:
         assert abs(result[2]) < 1e-6
         assert abs(result[3] - 1.0) < 1e-6
 
+    def test_batched_trs_roundtrip(self):
+        """Test batched TRS conversion matches the single-transform version."""
+        from meshcat_html_importer.scene.transforms import (
+            Transform,
+            matrices_to_trs,
+            matrix_to_trs,
+            trs_to_matrices,
+        )
+
+        translations = np.array([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+        rotations = np.array([[0.0, 0.0, 0.7071068, 0.7071068], [1.0, 0.0, 0.0, 0.0]])
+        scales = np.array([[1.0, 2.0, 3.0], [0.5, 0.5, 0.5]])
+
+        matrices = trs_to_matrices(translations, rotations, scales)
+        for i in range(2):
+            expected = Transform(
+                tuple(translations[i]), tuple(rotations[i]), tuple(scales[i])
+            ).to_matrix()
+            np.testing.assert_array_almost_equal(matrices[i], expected)
+
+        t, r, s = matrices_to_trs(matrices)
+        for i in range(2):
+            expected = matrix_to_trs(matrices[i])
+            np.testing.assert_array_almost_equal(t[i], expected.translation)
+            np.testing.assert_array_almost_equal(r[i], expected.rotation)
+            np.testing.assert_array_almost_equal(s[i], expected.scale)
+
 
 class TestGeometry:
     """Tests for geometry parsing."""
@@ -115,6 +165,16 @@ class TestGeometry:
         assert result.width_segments == 16
         assert result.height_segments == 8
 
+    def test_parse_buffer_geometry_aliases(self):
+        """Test legacy *BufferGeometry primitive names and unsupported types."""
+        from meshcat_html_importer.scene.geometry import GeometryType, parse_geometry
+
+        result = parse_geometry({"type": "CylinderBufferGeometry", "height": 2.0})
+
+        assert result.geometry_type == GeometryType.CYLINDER
+        assert result.height == 2.0
+        assert parse_geometry({"type": "TorusGeometry"}) is None
+
     def test_parse_buffer_geometry(self):
         """Test parsing BufferGeometry."""
         from meshcat_html_importer.scene.geometry import parse_geometry
@@ -137,6 +197,38 @@ class TestGeometry:
         assert result.positions is not None
         assert result.positions.shape == (3, 3)
 
+    def test_parse_buffer_geometry_typed_arrays(self):
+        """Test typed array attributes are used without copying."""
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        positions = np.arange(9, dtype=np.float32)
+        data = {
+            "type": "BufferGeometry",
+            "data": {
+                "attributes": {
+                    "position": {"array": positions, "itemSize": 3},
+                    "uv": {"array": np.zeros(6, dtype=np.float32).tobytes()},
+                },
+                "index": {"array": np.arange(3, dtype=np.uint32)},
+            },
+        }
+
+        result = parse_geometry(data)
+
+        assert np.shares_memory(result.positions, positions)
+        assert result.positions.shape == (3, 3)
+        assert result.uvs.shape == (3, 2)
+        assert result.indices.dtype == np.int32
+
+        # Strided input is made contiguous once before reshaping
+        data["data"]["attributes"]["position"]["array"] = np.arange(
+            18, dtype=np.float32
+        )[::2]
+        result = parse_geometry(data)
+
+        assert result.positions.flags.c_contiguous
+        np.testing.assert_array_equal(result.positions[1], [6.0, 8.0, 10.0])
+
     def test_mesh_geometry_validate(self):
         """Test MeshGeometry validation."""
         from meshcat_html_importer.scene.geometry import MeshGeometry
@@ -149,6 +241,175 @@ class TestGeometry:
         invalid = MeshGeometry(positions=np.array([]))
         assert not invalid.validate()
 
+    def test_decode_data_uri(self):
+        """Test decoding base64 and URL-encoded data URIs."""
+        from meshcat_html_importer.scene.geometry import _decode_data_uri
+
+        assert (
+            _decode_data_uri("data:application/octet-binary;base64,AAEC")
+            == b"\x00\x01\x02"
+        )
+        assert _decode_data_uri("data:text/plain,a%20b") == b"a b"
+        assert _decode_data_uri("cas-v1/abc") is None
+
+    def test_meshfile_cas_assets_decoded_once(self):
+        """Test CAS assets shared by meshfiles are decoded once."""
+        import json
+
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        cas_assets = {"cas-v1/abc": "data:application/octet-binary;base64,AAEC"}
+        geom_data = {
+            "type": "_meshfile_geometry",
+            "format": "gltf",
+            "data": json.dumps({"buffers": [{"uri": "cas-v1/abc"}]}),
+        }
+        decoded_assets: dict[str, bytes] = {}
+
+        first = parse_geometry(geom_data, cas_assets, decoded_assets)
+        second = parse_geometry(geom_data, cas_assets, decoded_assets)
+
+        assert decoded_assets == {"cas-v1/abc": b"\x00\x01\x02"}
+        assert first.resources["cas-v1/abc"] is second.resources["cas-v1/abc"]
+
+    def test_meshfile_multiple_cas_assets(self):
+        """Test several CAS assets are decoded and unresolved keys skipped."""
+        import json
+
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        cas_assets = {
+            "cas-v1/buf": "data:application/octet-binary;base64,AAEC",
+            "cas-v1/img": "data:image/png;base64,iVBORw==",
+        }
+        gltf = {
+            "buffers": [{"uri": "cas-v1/buf"}],
+            "images": [{"uri": "cas-v1/img"}, {"uri": "cas-v1/missing"}],
+        }
+        geom_data = {
+            "type": "_meshfile_geometry",
+            "format": "gltf",
+            "data": json.dumps(gltf),
+        }
+
+        result = parse_geometry(geom_data, cas_assets)
+
+        assert result.resources == {
+            "cas-v1/buf": b"\x00\x01\x02",
+            "cas-v1/img": b"\x89PNG",
+        }
+        assert result.data == geom_data["data"].encode("utf-8")
+
+    def test_prefetch_cas_assets(self):
+        """Test CAS assets of several glTF meshfiles are decoded up front."""
+        from meshcat_html_importer.scene.geometry import (
+            parse_geometry,
+            prefetch_cas_assets,
+        )
+
+        cas_assets = {
+            "cas-v1/a": "data:application/octet-binary;base64,AAEC",
+            "cas-v1/b": "data:application/octet-binary;base64,AwQF",
+            "cas-v1/unused": "data:application/octet-binary;base64,BgcI",
+        }
+        geom_data_list = [
+            {
+                "type": "_meshfile_geometry",
+                "format": "gltf",
+                "data": f'{{"buffers": [{{"uri": "cas-v1/{key}"}}]}}',
+            }
+            for key in ("a", "b")
+        ]
+        decoded_assets = {}
+
+        prefetch_cas_assets(geom_data_list, cas_assets, decoded_assets)
+
+        assert decoded_assets == {
+            "cas-v1/a": b"\x00\x01\x02",
+            "cas-v1/b": b"\x03\x04\x05",
+        }
+        result = parse_geometry(geom_data_list[1], cas_assets, decoded_assets)
+        assert result.resources["cas-v1/b"] is decoded_assets["cas-v1/b"]
+
+    def test_meshfile_gltf_without_cas_references(self):
+        """Test glTF without CAS references is passed through unchanged."""
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        gltf_text = '{"buffers": [{"uri": "data:;base64,AA=="}]}'
+        geom_data = {"type": "_meshfile_geometry", "format": "gltf", "data": gltf_text}
+
+        result = parse_geometry(geom_data, {"cas-v1/abc": "data:,unused"})
+
+        assert result.data == gltf_text.encode("utf-8")
+        assert result.resources == {}
+
+    def test_meshfile_binary_and_text_data(self):
+        """Test binary payloads pass through and text is not base64 decoded."""
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        glb = b"glTF\x02\x00\x00\x00"
+        result = parse_geometry(
+            {"type": "_meshfile_geometry", "format": "glb", "data": glb}
+        )
+        assert result.data is glb
+
+        result = parse_geometry(
+            {"type": "_meshfile_geometry", "format": "gltf", "data": "{}"}
+        )
+        assert result.data == b"{}"
+
+        result = parse_geometry(
+            {"type": "_meshfile_geometry", "format": "obj", "data": "AAEC"}
+        )
+        assert result.data == b"\x00\x01\x02"
+
+    def test_meshfile_typed_array_resources(self):
+        """Test typed array resources share memory with the decoded array."""
+        from meshcat_html_importer.scene.geometry import parse_geometry
+
+        texture = np.frombuffer(b"\x89PNG", dtype=np.uint8)
+        geom_data = {
+            "type": "_meshfile_geometry",
+            "format": "obj",
+            "data": "v 0 0 0",
+            "resources": {"tex.png": texture, "mesh.mtl": "newmtl a"},
+        }
+
+        result = parse_geometry(geom_data)
+
+        assert result.resources["tex.png"] == b"\x89PNG"
+        assert np.shares_memory(np.asarray(result.resources["tex.png"]), texture)
+        assert result.resources["mesh.mtl"] == b"newmtl a"
+
+    def test_geometry_key(self):
+        """Test geometries with the same content share a key."""
+        from meshcat_html_importer.scene.geometry import (
+            GeometryType,
+            MeshFileGeometry,
+            MeshGeometry,
+            PrimitiveGeometry,
+            geometry_key,
+        )
+
+        positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+        mesh = MeshGeometry(positions=positions)
+
+        assert geometry_key(mesh) == geometry_key(MeshGeometry(positions.copy()))
+        assert geometry_key(mesh) != geometry_key(
+            MeshGeometry(positions, indices=np.array([0, 1, 2]))
+        )
+        assert geometry_key(PrimitiveGeometry(GeometryType.BOX)) != geometry_key(
+            PrimitiveGeometry(GeometryType.BOX, width=2.0)
+        )
+
+        obj = MeshFileGeometry("obj", b"v 0 0 0", {"a.mtl": b"newmtl a"})
+        assert geometry_key(obj) == geometry_key(
+            MeshFileGeometry("obj", b"v 0 0 0", {"a.mtl": memoryview(b"newmtl a")})
+        )
+        assert geometry_key(obj) != geometry_key(
+            MeshFileGeometry("obj", b"v 0 0 0", {"a.mtl": b"newmtl b"})
+        )
+
 
 class TestMaterials:
     """Tests for material parsing."""
@@ -164,6 +425,14 @@ class TestMaterials:
         assert abs(color.g) < 1e-6
         assert abs(color.b) < 1e-6
 
+    def test_color_from_int_matches_division(self):
+        """Test table-driven color decoding matches dividing by 255."""
+        from meshcat_html_importer.scene.materials import Color
+
+        color = Color.from_int(0x1336699)
+
+        assert color.to_tuple() == (0x33 / 255.0, 0x66 / 255.0, 0x99 / 255.0)
+
     def test_color_from_hex(self):
         """Test creating color from hex string."""
         from meshcat_html_importer.scene.materials import Color
@@ -174,6 +443,17 @@ class TestMaterials:
         assert abs(color.g - 1.0) < 1e-6
         assert abs(color.b) < 1e-6
 
+    def test_color_from_hex_prefixes(self):
+        """Test hex prefixes are stripped without eating leading zeros."""
+        from meshcat_html_importer.scene.materials import Color
+
+        expected = Color.from_int(0x0A1234)
+
+        assert Color.from_hex("0a1234") == expected
+        assert Color.from_hex("0x0a1234") == expected
+        assert Color.from_hex("#0A1234") == expected
+        assert Color.from_hex("0xff") == Color.from_int(0xFF)
+
     def test_parse_standard_material(self):
         """Test parsing MeshStandardMaterial."""
         from meshcat_html_importer.scene.materials import MaterialType, parse_material
@@ -203,3 +483,283 @@ class TestMaterials:
         # Low shininess = high roughness
         assert shininess_to_roughness(1) > 0.7
         assert shininess_to_roughness(0) == 1.0
+
+
+class TestSceneGraph:
+    """Tests for scene graph construction."""
+
+    def test_set_animation_keyframe_arrays(self):
+        """Test animation tracks are stored as parallel keyframe arrays."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+
+        cmd = Command.from_dict(
+            {
+                "type": "set_animation",
+                "animations": [
+                    {
+                        "path": "/drake/robot",
+                        "clip": {
+                            "fps": 64,
+                            "tracks": [
+                                {
+                                    "name": ".position",
+                                    "keys": [
+                                        {"time": 0, "value": [0, 0, 0]},
+                                        {"time": 2, "value": [2, 0, 0]},
+                                    ],
+                                },
+                                {
+                                    "name": ".quaternion",
+                                    "keys": [{"time": 1, "value": [0, 0, 0, 1]}],
+                                },
+                            ],
+                        },
+                    }
+                ],
+                "options": {},
+            }
+        )
+
+        graph = SceneGraph()
+        graph.process_commands([cmd])
+        keyframes = graph._nodes["/drake/robot"].keyframes
+
+        np.testing.assert_array_equal(keyframes.times, [0, 1, 2])
+        assert keyframes.positions.shape == (3, 3)
+        assert np.isnan(keyframes.positions[1]).all()
+        assert keyframes.scales is None
+
+        views = list(keyframes)
+        assert views[1].position is None
+        assert views[1].rotation == (0.0, 0.0, 0.0, 1.0)
+        assert views[2].position == (2.0, 0.0, 0.0)
+
+    def test_node_path_parts(self):
+        """Test nodes split their path into components once."""
+        from meshcat_html_importer.scene.scene_graph import SceneNode
+
+        node = SceneNode(path="/drake/illustration/robot/", name="robot")
+
+        assert node.path_parts == ("drake", "illustration", "robot")
+
+    def test_scene_node_slots(self):
+        """Test scene nodes and keyframes do not carry a per-instance dict."""
+        from meshcat_html_importer.scene.scene_graph import (
+            AnimationKeyframe,
+            SceneNode,
+        )
+
+        node = SceneNode(path="/drake/robot", name="robot")
+
+        assert not hasattr(node, "__dict__")
+        assert not hasattr(AnimationKeyframe(time=0.0), "__dict__")
+
+    def test_get_or_create_node(self):
+        """Test nodes are created along the path and reused afterwards."""
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+
+        graph = SceneGraph()
+        leaf = graph._get_or_create_node("/drake/robot/link")
+
+        assert leaf.path == "/drake/robot/link"
+        assert leaf.parent.path == "/drake/robot"
+        assert graph.root.children["drake"] is graph._nodes["/drake"]
+        assert graph._get_or_create_node("/drake/robot/link") is leaf
+
+        sibling = graph._get_or_create_node("/drake/robot/other")
+        assert sibling.parent is leaf.parent
+        assert set(graph._nodes) == {
+            "/",
+            "/drake",
+            "/drake/robot",
+            "/drake/robot/link",
+            "/drake/robot/other",
+        }
+        assert graph._get_or_create_node("") is graph.root
+
+    def test_delete_subtree(self):
+        """Test delete removes a node and all of its descendants."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+
+        graph = SceneGraph()
+        for path in ("/a/b/c", "/a/b/d", "/a/bc", "/e"):
+            graph._get_or_create_node(path)
+
+        graph.process_commands([Command.from_dict({"type": "delete", "path": "/a/b"})])
+
+        assert set(graph._nodes) == {"/", "/a", "/a/bc", "/e"}
+        assert "b" not in graph._nodes["/a"].children
+
+    def test_delete_root_then_set_object(self):
+        """Test objects set after deleting "/" are rebuilt from scratch."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+
+        def set_box(path):
+            return Command.from_dict(
+                {
+                    "type": "set_object",
+                    "path": path,
+                    "object": {
+                        "geometries": [{"uuid": "g", "type": "BoxGeometry"}],
+                        "object": {"type": "Mesh", "geometry": "g"},
+                    },
+                }
+            )
+
+        graph = SceneGraph()
+        graph.process_commands(
+            [
+                set_box("/drake/a"),
+                Command.from_dict({"type": "delete", "path": "/"}),
+                set_box("/drake/a"),
+                set_box("/drake/b"),
+            ]
+        )
+
+        assert sorted(n.path for n in graph.get_mesh_nodes()) == [
+            "/drake/a",
+            "/drake/b",
+        ]
+        assert graph._nodes["/"] is graph.root
+        assert graph._nodes["/drake/a"].parent is graph._nodes["/drake"]
+
+    def test_compute_world_transforms(self):
+        """Test cached world transforms match walking the parent chain."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+        from meshcat_html_importer.scene.transforms import Transform
+
+        def set_transform(path, transform):
+            matrix = transform.to_matrix()
+            return Command.from_dict(
+                {
+                    "type": "set_transform",
+                    "path": path,
+                    "matrix": matrix.T.flatten().tolist(),
+                }
+            )
+
+        half = np.sqrt(0.5)
+        graph = SceneGraph()
+        graph.process_commands(
+            [
+                set_transform(
+                    "/a", Transform((1, 0, 0), (0, 0, half, half), (1, 1, 1))
+                ),
+                set_transform(
+                    "/a/b", Transform((0, 2, 0), (half, 0, 0, half), (1, 1, 1))
+                ),
+                set_transform("/a/b/c", Transform((0, 0, 3), (0, 0, 0, 1), (2, 2, 2))),
+                set_transform("/d", Transform((5, 0, 0), (0, 0, 0, 1), (1, 1, 1))),
+            ]
+        )
+        expected = {
+            path: node.get_world_transform() for path, node in graph._nodes.items()
+        }
+
+        graph.compute_world_transforms()
+        for path, node in graph._nodes.items():
+            assert node.world_matrix is not None
+            np.testing.assert_allclose(
+                node.get_world_transform().data, expected[path].data, atol=1e-12
+            )
+
+        # Processing more commands clears the cache
+        graph.process_commands([set_transform("/a", Transform.identity())])
+        assert graph._nodes["/a/b/c"].world_matrix is None
+        np.testing.assert_allclose(
+            graph._nodes["/a/b/c"].get_world_transform().translation,
+            (0, -1, 0),
+            atol=1e-12,
+        )
+
+    def test_world_transform_invalidation(self):
+        """Test set_transform only clears cached transforms of its subtree."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+
+        def set_translation(path, x):
+            matrix = np.eye(4)
+            matrix[0, 3] = x
+            return Command.from_dict(
+                {
+                    "type": "set_transform",
+                    "path": path,
+                    "matrix": matrix.T.flatten().tolist(),
+                }
+            )
+
+        graph = SceneGraph()
+        graph.process_commands(
+            [
+                set_translation("/a", 1),
+                set_translation("/a/b", 2),
+                set_translation("/d", 3),
+            ]
+        )
+        nodes = graph._nodes
+
+        # Computing a leaf caches its whole parent chain
+        assert nodes["/a/b"].get_world_transform().translation == (3, 0, 0)
+        assert nodes["/a"].world_matrix is not None
+        assert nodes["/d"].world_matrix is None
+
+        graph.process_commands([set_translation("/d", 4)])
+        assert nodes["/a/b"].world_matrix is not None
+
+        graph.process_commands([set_translation("/a", 5)])
+        assert nodes["/a"].world_matrix is None
+        assert nodes["/a/b"].world_matrix is None
+        assert nodes["/a/b"].get_world_transform().translation == (7, 0, 0)
+
+    def test_set_transform_invalidates_descendants(self):
+        """Test SceneNode.set_transform clears cached matrices below it."""
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+        from meshcat_html_importer.scene.transforms import Transform
+
+        graph = SceneGraph()
+        leaf = graph._get_or_create_node("/a/b/c")
+        other = graph._get_or_create_node("/d")
+        graph.compute_world_transforms()
+
+        graph._nodes["/a/b"].set_transform(
+            Transform((1, 0, 0), (0, 0, 0, 1), (1, 1, 1))
+        )
+
+        assert graph._nodes["/a"].world_matrix is not None
+        assert graph._nodes["/a/b"].world_matrix is None
+        assert leaf.world_matrix is None
+        assert other.world_matrix is not None
+        assert leaf.get_world_transform().translation == (1, 0, 0)
+
+    def test_world_transform_composes_matrices(self):
+        """Test world transforms keep the full matrix product of the chain."""
+        from meshcat_html_importer.parser.command_types import Command
+        from meshcat_html_importer.scene.scene_graph import SceneGraph
+        from meshcat_html_importer.scene.transforms import Transform
+
+        half = np.sqrt(0.5)
+        parent = Transform((1, 2, 3), (0, 0, half, half), (2, 1, 1))
+        child = Transform((0, 1, 0), (half, 0, 0, half), (1, 1, 1))
+        graph = SceneGraph()
+        graph.process_commands(
+            [
+                Command.from_dict(
+                    {
+                        "type": "set_transform",
+                        "path": path,
+                        "matrix": t.to_matrix().T.flatten().tolist(),
+                    }
+                )
+                for path, t in (("/p", parent), ("/p/c", child))
+            ]
+        )
+
+        np.testing.assert_allclose(
+            graph._nodes["/p/c"].get_group_world_matrix(),
+            parent.to_matrix() @ child.to_matrix(),
+            atol=1e-12,
+        )
@@ -115,6 +115,182 @@ class TestBlender:
         assert len(loaded) == 1
         assert loaded[0][0]["name"] == "obj1"
 
+    def test_blender_append_keyframes(self, mock_bpy, tmp_path):
+        """Test streaming keyframes to disk one frame at a time."""
+        from drake_recording_server.server import Blender, load_keyframes
+
+        keyframe_path = tmp_path / "keyframes.pkl"
+        blender = Blender(keyframe_dump_path=keyframe_path)
+
+        for i in range(3):
+            blender._keyframes.append(
+                [
+                    {
+                        "name": "obj1",
+                        "location": [i, 0, 0],
+                        "rotation_quaternion": [0, 0, 0, 1],
+                    }
+                ]
+            )
+            blender.append_last_keyframe_to_disk()
+
+        # Frames are readable while the stream is still open.
+        assert load_keyframes(keyframe_path) == blender._keyframes
+
+        blender.close_keyframe_dump()
+
+        assert keyframe_path.read_bytes()[:2] == b"\x1f\x8b"
+        assert load_keyframes(keyframe_path) == blender._keyframes
+
+    def test_load_keyframes_legacy_format(self, mock_bpy, tmp_path):
+        """Test loading a single pickled list of frames."""
+        from drake_recording_server.server import Blender, load_keyframes
+
+        keyframe_path = tmp_path / "keyframes.pkl"
+        blender = Blender(keyframe_dump_path=keyframe_path)
+        blender._keyframes = [[{"name": "obj1"}], []]
+        blender.dump_keyframes_to_disk()
+
+        assert load_keyframes(keyframe_path) == [[{"name": "obj1"}], []]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_keyframes(self, mock_bpy, tmp_path, monkeypatch, use_orjson):
+        """Test writing and loading keyframes as JSON Lines."""
+        import json
+
+        import numpy as np
+        from drake_recording_server import server
+        from drake_recording_server.server import Blender, load_keyframes
+
+        if not use_orjson:
+            monkeypatch.setattr(server, "orjson", None)
+        elif server.orjson is None:
+            pytest.skip("orjson not installed")
+
+        keyframe_path = tmp_path / "keyframes.jsonl"
+        blender = Blender(keyframe_dump_path=keyframe_path, keyframe_format="json")
+        for i in range(2):
+            blender._keyframes.append(
+                {
+                    "names": ["obj1", "obj2"],
+                    "location": np.array([[i, 0.5, 0], [0, 0, 0.1]], np.float32),
+                    "rotation_quaternion": np.eye(2, 4, dtype=np.float32),
+                }
+            )
+            blender.append_last_keyframe_to_disk()
+        blender.close_keyframe_dump()
+
+        lines = keyframe_path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["format"] == "drake_recording_server.keyframes"
+        assert json.loads(lines[2])["names"] == ["obj1", "obj2"]
+
+        for _ in range(2):
+            loaded = load_keyframes(keyframe_path)
+            assert len(loaded) == 2
+            for frame, expected in zip(loaded, blender._keyframes):
+                assert frame["names"] == expected["names"]
+                for key in ("location", "rotation_quaternion"):
+                    assert frame[key].dtype == np.float32
+                    np.testing.assert_array_equal(frame[key], expected[key])
+
+            # The full dump uses the same layout.
+            keyframe_path.unlink()
+            blender.dump_keyframes_to_disk()
+
+    def test_unsupported_keyframe_format(self, mock_bpy):
+        """Test that unknown keyframe formats are rejected."""
+        from drake_recording_server.server import Blender
+
+        with pytest.raises(ValueError, match="msgpack"):
+            Blender(keyframe_format="msgpack")
+
+    def test_pose_frame(self, mock_bpy):
+        """Test collecting object poses into keyframe arrays."""
+        from types import SimpleNamespace
+
+        import numpy as np
+        from drake_recording_server.server import pose_frame
+
+        objects = [
+            SimpleNamespace(
+                name=f"obj{i}",
+                location=(i, 0.5, 0),
+                rotation_quaternion=(1, 0, 0, i),
+            )
+            for i in range(3)
+        ]
+        frame = pose_frame(objects)
+
+        assert frame["names"] == ["obj0", "obj1", "obj2"]
+        assert frame["location"].shape == (3, 3)
+        assert frame["location"].dtype == np.float32
+        assert frame["rotation_quaternion"].shape == (3, 4)
+        assert frame["location"][2].tolist() == [2.0, 0.5, 0.0]
+        assert frame["rotation_quaternion"][:, 3].tolist() == [0.0, 1.0, 2.0]
+
+        empty = pose_frame([])
+        assert empty["names"] == []
+        assert empty["location"].shape == (0, 3)
+
+    def test_save_keyframe_sets_up_scene_once(self, mock_bpy, tmp_path):
+        """Test that the base scene is only loaded for the first keyframe."""
+        from types import SimpleNamespace
+
+        from drake_recording_server.server import Blender, RenderParams
+
+        blender = Blender()
+        mock_bpy.context.selected_objects = [
+            SimpleNamespace(
+                name="obj1",
+                parent=None,
+                location=(1, 2, 3),
+                rotation_quaternion=(1, 0, 0, 0),
+            )
+        ]
+        # Each import adds the selected object to the object count.
+        object_counts = iter([0, 1] * 3)
+        mock_bpy.data.objects.__len__.side_effect = lambda: next(object_counts)
+        params = MagicMock(spec=RenderParams, scene=tmp_path / "scene.gltf")
+
+        for _ in range(3):
+            blender.save_keyframe(params=params)
+
+        assert mock_bpy.ops.wm.read_factory_settings.call_count == 1
+        assert mock_bpy.ops.import_scene.gltf.call_count == 3
+        assert mock_bpy.data.batch_remove.call_count == 4
+        assert len(blender._keyframes) == 3
+        assert blender._keyframes[2]["location"].tolist() == [[1, -3, 2]]
+
+    def test_rotate_gltf_roots(self, mock_bpy):
+        """Test compensating the glTF import rotation on root objects only."""
+        import numpy as np
+        from drake_recording_server.server import _rotate_gltf_roots
+
+        frame = {
+            "names": ["root", "child"],
+            "location": np.array([[1, 2, 3], [1, 2, 3]], dtype=np.float32),
+            "rotation_quaternion": np.array(
+                [[1, 0, 0, 0], [1, 0, 0, 0]], dtype=np.float32
+            ),
+        }
+        _rotate_gltf_roots(frame, [True, False])
+
+        h = np.sqrt(0.5)
+        np.testing.assert_allclose(frame["location"], [[1, -3, 2], [1, 2, 3]])
+        np.testing.assert_allclose(
+            frame["rotation_quaternion"], [[h, h, 0, 0], [1, 0, 0, 0]], atol=1e-7
+        )
+
+        # Rotating four times by 90 degrees gives the negated quaternion.
+        frame["rotation_quaternion"][0] = [0.5, 0.5, -0.5, 0.5]
+        for _ in range(4):
+            _rotate_gltf_roots(frame, [True, False])
+        np.testing.assert_allclose(frame["location"][0], [1, -3, 2], atol=1e-6)
+        np.testing.assert_allclose(
+            frame["rotation_quaternion"][0], [-0.5, -0.5, 0.5, -0.5], atol=1e-6
+        )
+
 
 class TestServerApp:
     """Tests for ServerApp Flask application."""
@@ -144,3 +320,140 @@ class TestServerApp:
             response = client.get("/")
             assert response.status_code == 200
             assert b"Drake Blender Recording Server" in response.data
+
+    def test_render_from_worker_thread(self, mock_bpy, tmp_path):
+        """Test that renders requested off the main thread use bpy on it."""
+        import threading
+
+        from drake_recording_server.server import ServerApp
+
+        app = ServerApp(temp_dir=str(tmp_path))
+        app._parse_params = MagicMock(
+            return_value=MagicMock(width=5, height=2, scene=tmp_path / "x.gltf")
+        )
+        blender_threads = []
+        app._blender.save_keyframe = MagicMock(
+            side_effect=lambda params: blender_threads.append(
+                threading.current_thread()
+            )
+        )
+        app._blender.append_last_keyframe_to_disk = MagicMock()
+
+        responses = []
+
+        def post():
+            with app.test_client() as client:
+                responses.append(client.post("/render"))
+
+        thread = threading.Thread(target=post)
+        thread.start()
+        while thread.is_alive():
+            app.process_blender_jobs(timeout=0.01)
+        thread.join()
+
+        assert [r.status_code for r in responses] == [200]
+        assert blender_threads == [threading.main_thread()]
+
+    def test_render_from_worker_thread_error(self, mock_bpy, tmp_path):
+        """Test that Blender errors on the main thread reach the request."""
+        import threading
+
+        from drake_recording_server.server import ServerApp
+
+        app = ServerApp(temp_dir=str(tmp_path))
+        app._parse_params = MagicMock(
+            return_value=MagicMock(width=5, height=2, scene=tmp_path / "x.gltf")
+        )
+        app._blender.save_keyframe = MagicMock(side_effect=RuntimeError("boom"))
+
+        responses = []
+
+        def post():
+            with app.test_client() as client:
+                responses.append(client.post("/render"))
+
+        thread = threading.Thread(target=post)
+        thread.start()
+        while thread.is_alive():
+            app.process_blender_jobs(timeout=0.01)
+        thread.join()
+
+        assert responses[0].status_code == 500
+        assert "boom" in responses[0].json["message"]
+
+    def test_fake_png(self, mock_bpy):
+        """Test that the placeholder image has the requested size and is cached."""
+        import io
+
+        from drake_recording_server.server import _fake_png
+        from PIL import Image
+
+        data = _fake_png(4, 3)
+        with Image.open(io.BytesIO(data)) as img:
+            assert img.format == "PNG"
+            assert img.size == (4, 3)
+        assert _fake_png(4, 3) is data
+
+    def test_render_endpoint_reuses_png(self, mock_bpy, tmp_path):
+        """Test that repeated renders return the same encoded image bytes."""
+        from drake_recording_server.server import ServerApp, _fake_png
+
+        app = ServerApp(temp_dir=str(tmp_path))
+        app._parse_params = MagicMock(
+            return_value=MagicMock(width=5, height=2, scene=tmp_path / "x.gltf")
+        )
+        app._blender.save_keyframe = MagicMock()
+        app._blender.append_last_keyframe_to_disk = MagicMock()
+
+        _fake_png.cache_clear()
+        with app.test_client() as client:
+            for _ in range(3):
+                response = client.post("/render")
+                assert response.status_code == 200
+                assert response.mimetype == "image/png"
+                assert response.data == _fake_png(5, 2)
+
+        assert _fake_png.cache_info().misses == 1
+        assert app._blender.save_keyframe.call_count == 3
+
+    def test_parse_params(self, mock_bpy, tmp_path):
+        """Test converting render form data to RenderParams."""
+        import io
+
+        import flask
+        from drake_recording_server.server import ServerApp
+
+        app = ServerApp(temp_dir=str(tmp_path))
+        form = {
+            "scene_sha256": "0" * 64,
+            "image_type": "depth",
+            "width": "640",
+            "height": "480",
+            "near": "0.01",
+            "far": "10",
+            "focal_x": "579.4",
+            "focal_y": "579.4",
+            "fov_x": "1.0",
+            "fov_y": "0.78",
+            "center_x": "319.5",
+            "center_y": "239.5",
+            "min_depth": "0.1",
+            "submit": "Render",
+        }
+        data = dict(form, scene=(io.BytesIO(b"{}"), "scene.gltf"))
+
+        with app.test_request_context("/render", method="POST", data=data):
+            params = app._parse_params(flask.request)
+
+        assert params.width == 640
+        assert params.far == 10.0
+        assert params.image_type == "depth"
+        assert params.min_depth == 0.1
+        assert params.max_depth is None
+        assert params.scene.read_bytes() == b"{}"
+
+        form["image_type"] = "normal"
+        data = dict(form, scene=(io.BytesIO(b"{}"), "scene.gltf"))
+        with app.test_request_context("/render", method="POST", data=data):
+            with pytest.raises(ValueError, match="image_type"):
+                app._parse_params(flask.request)